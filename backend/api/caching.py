@@ -0,0 +1,138 @@
+"""
+Модуль условного HTTP-кэширования ответов API.
+
+Веб-приложение постоянно опрашивает посты заново. Эндпоинты сначала
+получают версию данных дешевым запросом (`updated_at` поста или
+количество и максимальный `updated_at` для списка), строят по ней
+валидаторы `ETag` и `Last-Modified` и, если версия клиента совпадает,
+отвечают `304 Not Modified` без тела и без загрузки самих данных.
+
+Заголовок `Cache-Control` задается для каждого маршрута в
+`settings.cache_control` (по имени эндпоинта), чтобы CDN мог кэшировать
+опубликованный контент. Для непубличных данных используется
+`settings.cache_control_private`.
+
+Классы:
+- CacheValidators: Валидаторы ответа и проверка условного запроса.
+"""
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Dict
+from fastapi import Request, Response
+from settings import settings
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Строит слабый ETag по составляющим версии ответа.
+
+    ETag слабый (`W/`): ответ может быть сжат промежуточным слоем, но
+    его содержимое при этом не меняется.
+
+    Args:
+        *parts (Any): Составляющие версии (ID, даты, параметры фильтра).
+
+    Returns:
+        str: Значение заголовка ETag.
+    """
+    digest = hashlib.blake2b("\x1f".join(map(str, parts)).encode(), digest_size=12)
+    return f'W/"{digest.hexdigest()}"'
+
+
+def to_http_date(value: datetime) -> str:
+    """
+    Форматирует дату для заголовка Last-Modified.
+
+    Args:
+        value (datetime): Дата; без часового пояса считается локальной
+            (модели заполняют `updated_at` через `datetime.now`).
+
+    Returns:
+        str: Дата в формате HTTP (GMT).
+    """
+    return format_datetime(value.astimezone(timezone.utc).replace(microsecond=0), usegmt=True)
+
+
+def cache_control_for(request: Request, public: bool = True) -> str:
+    """
+    Возвращает Cache-Control маршрута из настроек.
+
+    Args:
+        request (Request): Запрос (маршрут определяется по имени эндпоинта).
+        public (bool): Данные публичны и могут кэшироваться CDN.
+
+    Returns:
+        str: Значение заголовка Cache-Control.
+    """
+    if not public:
+        return settings.cache_control_private
+    route = request.scope.get("route")
+    name = getattr(route, "name", None)
+    return settings.cache_control.get(name, settings.cache_control_private)
+
+
+@dataclass(frozen=True)
+class CacheValidators:
+    """
+    Валидаторы ответа.
+
+    Args:
+        etag (str): Значение ETag.
+        last_modified (datetime | None): Дата последнего изменения данных.
+        cache_control (str): Значение Cache-Control.
+    """
+    etag: str
+    last_modified: datetime | None
+    cache_control: str
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """
+        Возвращает заголовки кэширования для ответа 200 и 304.
+        """
+        headers = {"ETag": self.etag, "Cache-Control": self.cache_control}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = to_http_date(self.last_modified)
+        return headers
+
+    def matches(self, request: Request) -> bool:
+        """
+        Проверяет, что у клиента актуальная версия ответа.
+
+        `If-None-Match` имеет приоритет над `If-Modified-Since`
+        (RFC 9110, 13.2.2). ETag сравниваются слабым сравнением.
+
+        Args:
+            request (Request): Запрос.
+
+        Returns:
+            bool: True, если можно ответить 304.
+        """
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            if if_none_match.strip() == "*":
+                return True
+            tag = self.etag.removeprefix("W/")
+            return any(
+                candidate.strip().removeprefix("W/") == tag
+                for candidate in if_none_match.split(",")
+            )
+
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since is None or self.last_modified is None:
+            return False
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        return self.last_modified.astimezone(timezone.utc).replace(microsecond=0) <= since
+
+    def not_modified(self) -> Response:
+        """
+        Возвращает ответ 304 без тела с заголовками кэширования.
+        """
+        return Response(status_code=304, headers=self.headers)
@@ -18,7 +18,12 @@ import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from api.middlewares.docs_blocker import BlockDocsMiddleware
+from api.middlewares.compression import CompressionMiddleware
+from api.middlewares.timing import TimingMiddleware
+from api.middlewares.metrics import HTTPMetricsMiddleware
+from api.responses import FastJSONResponse
 from api.routers import all_routers
+from api.routers.metrics import router as metrics_router
 from settings import settings
 from bot.main import lifespan
 
@@ -27,15 +32,30 @@ app = FastAPI(
     title=settings.app_name,
     version=settings.app_version,
     description=settings.app_description,
-    lifespan=lifespan
+    lifespan=lifespan,
+    # JSON кодируется pydantic-core за один проход (см. api.responses)
+    default_response_class=FastJSONResponse
 )
 
 # Включение маршрутизаторов для обработки команд и сообщений
 app.include_router(all_routers())
 
+# Метрики Prometheus отдаются в корне приложения, вне версий API
+if settings.metrics_enabled:
+    app.include_router(metrics_router)
+
+# Все промежуточные слои - ASGI-классы без BaseHTTPMiddleware.
+# Слой, добавленный последним, выполняется первым.
+
+# Сжатие больших ответов (потоковые ответы не сжимаются)
+app.add_middleware(CompressionMiddleware, minimum_size=settings.compression_minimum_size)
+
 # Настройка промежуточных слоев для блокировки доступа к документации
 app.add_middleware(BlockDocsMiddleware)
 
+# Заголовок Server-Timing с временем обработки запроса
+app.add_middleware(TimingMiddleware)
+
 # Настройка промежуточного слоя для CORS
 app.add_middleware(
     CORSMiddleware,
@@ -45,15 +65,30 @@ app.add_middleware(
     allow_headers=settings.allow_headers
 )
 
+# Метрики HTTP-запросов: внешний слой, чтобы учитывать время всех остальных
+if settings.metrics_enabled:
+    app.add_middleware(HTTPMetricsMiddleware)
+
 def run():
     """
     Запуск приложения FastAPI.
+
+    При `api_workers` > 1 uvicorn запускает несколько процессов, и
+    приложение передается строкой импорта, чтобы каждый воркер
+    импортировал его сам. Бот в каждом воркере обрабатывает вебхук,
+    а вебхук, polling и рассылки берет на себя ведущий процесс.
+
+    Обновления вебхука любой воркер сохраняет в общую очередь в базе
+    данных, а обрабатывает только ведущий (см. `bot.core.inbox`), поэтому
+    порядок обновлений чата, лимит отправки и кэш FSM действуют так же,
+    как при одном воркере.
     """
     try:
         uvicorn.run(
-            app,
+            "api.main:app",
             host="0.0.0.0",
-            port=settings.webhook_port
+            port=settings.webhook_port,
+            workers=settings.api_workers
         )
     except gaierror as e:
         logging.critical("Ошибка сетевого адреса: %s", e)
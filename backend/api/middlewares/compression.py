@@ -0,0 +1,159 @@
+"""
+Модуль промежуточного слоя сжатия ответов.
+
+`CompressionMiddleware` - ASGI-слой, сжимающий ответы brotli (если
+установлен пакет `brotli`) или gzip в зависимости от `Accept-Encoding`.
+Сжимаются только ответы, целиком переданные одним сообщением
+(`JSONResponse` и другие обычные ответы), размером не меньше
+`minimum_size` и со сжимаемым типом содержимого - прежде всего большие
+JSON-списки. Потоковые ответы (`StreamingResponse`, SSE) передаются без
+изменений и без буферизации: сжатие по частям задерживало бы события.
+"""
+import gzip
+from typing import Dict
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript", "image/svg+xml")
+
+
+def choose_encoding(accept_encoding: str) -> str | None:
+    """
+    Выбирает кодировку сжатия по заголовку Accept-Encoding.
+
+    Выбирается кодировка с наибольшим q; при равных q предпочитается br.
+    Кодировка, не указанная явно, получает q из `*`. Кодировки с q <= 0
+    или некорректным q считаются запрещенными.
+
+    Args:
+        accept_encoding (str): Значение заголовка.
+
+    Returns:
+        str | None: "br", "gzip" или None.
+    """
+    qualities: Dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, *params = part.split(";")
+        quality = 1.0
+        for param in params:
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        name = name.strip().lower()
+        if name:
+            # nan не проходит сравнение и считается запретом
+            qualities[name] = quality if quality > 0 else 0.0
+
+    wildcard = qualities.get("*", 0.0)
+    candidates = ("br", "gzip") if brotli is not None else ("gzip",)
+    best, best_quality = None, 0.0
+    for encoding in candidates:
+        quality = qualities.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class CompressionMiddleware:
+    """
+    Промежуточный слой сжатия ответов.
+
+    Args:
+        app (ASGIApp): Следующее ASGI-приложение.
+        minimum_size (int): Минимальный размер ответа для сжатия, байты.
+        gzip_level (int): Уровень сжатия gzip.
+        brotli_quality (int): Качество сжатия brotli.
+    """
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        gzip_level: int = 6,
+        brotli_quality: int = 4
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Message | None = None
+        passthrough = False
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                # Заголовки откладываются до первого фрагмента тела
+                start = message
+                return
+            if message["type"] != "http.response.body" or start is None:
+                await send(message)
+                return
+
+            passthrough = True
+            body = message.get("body", b"")
+            if message.get("more_body", False) or not self._should_compress(start, body):
+                await send(start)
+                await send(message)
+                return
+
+            body, headers = self._compress(body, encoding), MutableHeaders(scope=start)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(body))
+            headers.add_vary_header("Accept-Encoding")
+            await send(start)
+            await send({"type": "http.response.body", "body": body, "more_body": False})
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _should_compress(self, start: Message, body: bytes) -> bool:
+        """
+        Проверяет, нужно ли сжимать ответ.
+
+        Args:
+            start (Message): Сообщение начала ответа с заголовками.
+            body (bytes): Тело ответа.
+
+        Returns:
+            bool: True, если ответ сжимаемый и достаточно большой.
+        """
+        if len(body) < self.minimum_size:
+            return False
+        headers = Headers(raw=start["headers"])
+        if "content-encoding" in headers:
+            return False
+        return headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES)
+
+    def _compress(self, body: bytes, encoding: str) -> bytes:
+        """
+        Сжимает тело ответа.
+
+        Args:
+            body (bytes): Тело ответа.
+            encoding (str): "br" или "gzip".
+
+        Returns:
+            bytes: Сжатое тело.
+        """
+        if encoding == "br":
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
@@ -1,11 +1,23 @@
-from fastapi import Request
+"""
+Модуль промежуточного слоя блокировки документации.
+
+`BlockDocsMiddleware` - ASGI-слой: проверка пути выполняется до вызова
+приложения, а все остальные запросы (включая вебхук) передаются дальше
+без дополнительных задач и потоков `BaseHTTPMiddleware`.
+"""
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.types import ASGIApp, Receive, Scope, Send
 from settings import settings
 
-class BlockDocsMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        if not settings.docs_access and request.url.path in ["/docs", "/redoc"]:
-            return JSONResponse(status_code=403, content={"detail": "Доступ к документации запрещён."})
-        response = await call_next(request)
-        return response
\ No newline at end of file
+DOCS_PATHS = frozenset(("/docs", "/redoc"))
+
+class BlockDocsMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and not settings.docs_access and scope["path"] in DOCS_PATHS:
+            response = JSONResponse(status_code=403, content={"detail": "Доступ к документации запрещён."})
+            await response(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
@@ -0,0 +1,49 @@
+"""
+Модуль промежуточного слоя HTTP-метрик.
+
+`HTTPMetricsMiddleware` - ASGI-слой без обертки `BaseHTTPMiddleware`:
+он не создает задач и потоков ответа, а только перехватывает `send`,
+чтобы узнать статус ответа. Метка маршрута берется из шаблона пути
+FastAPI (`/api/v1/posts/{post_id}`), а не из самого пути, поэтому
+количество серий не растет с количеством ID. Запросы, не попавшие ни в
+один маршрут, записываются с меткой `unmatched`.
+"""
+import time
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from shared.metrics import http_requests_total, http_request_duration, http_requests_in_flight
+
+
+class HTTPMetricsMiddleware:
+    """
+    Промежуточный слой метрик HTTP-запросов.
+
+    Args:
+        app (ASGIApp): Следующее ASGI-приложение.
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            path = getattr(route, "path_format", None) or "unmatched"
+            method = scope["method"]
+            http_request_duration.observe(time.perf_counter() - started, method, path)
+            http_requests_total.inc(method, path, str(status))
+            http_requests_in_flight.dec()
@@ -0,0 +1,36 @@
+"""
+Модуль промежуточного слоя замера времени запроса.
+
+`TimingMiddleware` - ASGI-слой, добавляющий в ответ заголовок
+`Server-Timing: app;dur=<мс>` - время от получения запроса до начала
+ответа. Заголовок виден в инструментах разработчика браузера.
+"""
+import time
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+class TimingMiddleware:
+    """
+    Промежуточный слой заголовка Server-Timing.
+
+    Args:
+        app (ASGIApp): Следующее ASGI-приложение.
+    """
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                headers.append("Server-Timing", f"app;dur={(time.perf_counter() - started) * 1000:.2f}")
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
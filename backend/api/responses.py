@@ -0,0 +1,216 @@
+"""
+Модуль быстрой сериализации ответов API.
+
+По умолчанию FastAPI обрабатывает результат эндпоинта с `response_model`
+в три прохода: валидирует его заново по модели ответа, сериализует в
+объекты Python (`field.serialize`) и затем кодирует в JSON стандартным
+`json.dumps`. Менеджеры данных уже возвращают провалидированные схемы,
+поэтому для них это лишняя работа.
+
+- `FastJSONResponse` кодирует содержимое за один проход через
+  `pydantic_core.to_json` (Rust): схемы pydantic, datetime, Enum и т.п.
+  сериализуются без промежуточных словарей. Используется как класс
+  ответа по умолчанию всего приложения.
+- `FastJSONRoute` возвращает `FastJSONResponse` сразу, если результат
+  эндпоинта уже является экземпляром модели ответа (или списком
+  экземпляров), пропуская повторную валидацию. Остальные результаты
+  (словари, ORM-модели, частичные данные) обрабатываются FastAPI как
+  обычно.
+- `MsgPackResponse` и `negotiate` - ответы API v2 в MessagePack или JSON
+  по заголовку `Accept`. MessagePack доступен, если установлен пакет
+  `msgpack` (extra `msgpack`), иначе всегда отдается JSON.
+
+Классы:
+- FastJSONResponse: JSON-ответ с кодированием через pydantic-core.
+- MsgPackResponse: Ответ в формате MessagePack.
+- FastJSONRoute: Маршрут с быстрым путем для провалидированных схем.
+"""
+import inspect
+from functools import wraps
+from typing import Any, Callable, Dict, List, get_args, get_origin
+from fastapi import Request, Response
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from pydantic import BaseModel
+from pydantic_core import to_json, to_jsonable_python
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+MSGPACK_TYPES = ("application/msgpack", "application/x-msgpack", "application/vnd.msgpack")
+
+# Описание альтернативного формата ответа для OpenAPI (роутеры API v2)
+MSGPACK_RESPONSES = {200: {"content": {"application/msgpack": {}}}}
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON-ответ с кодированием через `pydantic_core.to_json`.
+    """
+    def render(self, content: Any) -> bytes:
+        return to_json(content, by_alias=True)
+
+
+class MsgPackResponse(Response):
+    """
+    Ответ в формате MessagePack.
+
+    Схемы pydantic приводятся к простым типам тем же сериализатором, что и
+    для JSON (даты - строки ISO 8601), поэтому содержимое ответов в обоих
+    форматах совпадает.
+    """
+    media_type = "application/msgpack"
+
+    def render(self, content: Any) -> bytes:
+        return msgpack.packb(to_jsonable_python(content, by_alias=True), use_bin_type=True)
+
+
+def accepts_msgpack(accept: str) -> bool:
+    """
+    Проверяет, что клиент предпочитает MessagePack.
+
+    MessagePack выбирается, если его тип указан в `Accept` с качеством не
+    ниже, чем у JSON (`application/json` или `*/*`).
+
+    Args:
+        accept (str): Значение заголовка Accept.
+
+    Returns:
+        bool: True, если отвечать нужно в MessagePack.
+    """
+    if msgpack is None or not accept:
+        return False
+    msgpack_quality = json_quality = 0.0
+    for part in accept.split(","):
+        media_type, *params = [item.strip() for item in part.split(";")]
+        quality = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        media_type = media_type.lower()
+        if media_type in MSGPACK_TYPES:
+            msgpack_quality = max(msgpack_quality, quality)
+        elif media_type in ("application/json", "application/*", "*/*"):
+            json_quality = max(json_quality, quality)
+    return msgpack_quality > 0 and msgpack_quality >= json_quality
+
+
+def negotiate(
+    request: Request,
+    content: Any,
+    status_code: int = 200,
+    headers: Dict[str, str] | None = None
+) -> Response:
+    """
+    Возвращает ответ в MessagePack или JSON по заголовку Accept.
+
+    Args:
+        request (Request): Запрос.
+        content (Any): Содержимое ответа (схемы, словари, списки).
+        status_code (int): Код ответа.
+        headers (Dict[str, str] | None): Дополнительные заголовки.
+
+    Returns:
+        Response: `MsgPackResponse` или `FastJSONResponse`.
+    """
+    headers = {**(headers or {}), "Vary": "Accept"}
+    if accepts_msgpack(request.headers.get("accept", "")):
+        return MsgPackResponse(content, status_code=status_code, headers=headers)
+    return FastJSONResponse(content, status_code=status_code, headers=headers)
+
+
+def is_validated(value: Any, annotation: Any) -> bool:
+    """
+    Проверяет, что значение уже является экземпляром модели ответа.
+
+    Сравнивается точный тип: экземпляр подкласса может содержать поля,
+    которых нет в модели ответа, и должен пройти обычную фильтрацию.
+
+    Args:
+        value (Any): Результат эндпоинта.
+        annotation (Any): Модель ответа маршрута.
+
+    Returns:
+        bool: True, если повторная валидация не нужна.
+    """
+    if inspect.isclass(annotation) and issubclass(annotation, BaseModel):
+        return type(value) is annotation
+    if get_origin(annotation) in (list, List) and isinstance(value, list):
+        (item_type,) = get_args(annotation) or (Any,)
+        return (
+            inspect.isclass(item_type)
+            and issubclass(item_type, BaseModel)
+            and all(type(item) is item_type for item in value)
+        )
+    return False
+
+
+class FastJSONRoute(APIRoute):
+    """
+    Маршрут, отдающий провалидированные схемы без повторной валидации.
+
+    Быстрый путь включается, только если ответ маршрута не настраивается
+    параметрами `response_model_include/exclude/...` и эндпоинт не
+    принимает `Response` для установки заголовков: в этих случаях
+    результат обрабатывает FastAPI.
+    """
+    def __init__(self, path: str, endpoint: Callable[..., Any], **kwargs: Any):
+        super().__init__(path, endpoint, **kwargs)
+        if self._fast_path_allowed():
+            self.dependant.call = self._wrap(self.dependant.call)
+
+    def _fast_path_allowed(self) -> bool:
+        """
+        Проверяет, можно ли отдавать результат эндпоинта напрямую.
+
+        Returns:
+            bool: True, если у маршрута есть модель ответа и нет
+                настроек, меняющих ее сериализацию.
+        """
+        # Класс ответа по умолчанию приходит обернутым в DefaultPlaceholder
+        response_class = getattr(self.response_class, "value", self.response_class)
+        return (
+            self.response_field is not None
+            and issubclass(response_class, FastJSONResponse)
+            and self.dependant.response_param_name is None
+            and self.response_model_include is None
+            and self.response_model_exclude is None
+            and self.response_model_by_alias
+            and not self.response_model_exclude_unset
+            and not self.response_model_exclude_defaults
+            and not self.response_model_exclude_none
+        )
+
+    def _wrap(self, call: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Оборачивает эндпоинт быстрым путем, сохраняя его синхронность.
+
+        Args:
+            call (Callable[..., Any]): Функция эндпоинта.
+
+        Returns:
+            Callable[..., Any]: Обернутая функция.
+        """
+        response_model = self.response_model
+        response_class = getattr(self.response_class, "value", self.response_class)
+        status_code = self.status_code or 200
+
+        def respond(result: Any) -> Any:
+            if is_validated(result, response_model):
+                return response_class(content=result, status_code=status_code)
+            return result
+
+        if inspect.iscoroutinefunction(call):
+            @wraps(call)
+            async def endpoint(**values: Any) -> Any:
+                return respond(await call(**values))
+        else:
+            @wraps(call)
+            def endpoint(**values: Any) -> Any:
+                return respond(call(**values))
+        return endpoint
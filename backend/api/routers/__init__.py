@@ -2,7 +2,7 @@ from fastapi import APIRouter
 from settings import settings
 
 from api.routers import v1
-# from api.routers import v2 - когда появится, тогда и раскомментируем
+from api.routers import v2
 
 def all_routers() -> APIRouter:
     """
@@ -16,8 +16,8 @@ def all_routers() -> APIRouter:
     for version in settings.api_versions:
         if version == "v1":
             version_router = v1.get_routers()
-        # elif version == "v2":
-        #     version_router = v2.get_routers()
+        elif version == "v2":
+            version_router = v2.get_routers()
     
         router.include_router(
             router=version_router,
@@ -0,0 +1,27 @@
+"""
+Модуль эндпоинта метрик Prometheus.
+
+Роуты:
+- GET /metrics - Метрики процесса в текстовом формате Prometheus
+
+Метрики хранятся в памяти процесса: при нескольких воркерах API каждый
+воркер отдает свои метрики.
+"""
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from shared.metrics import metrics
+
+router = APIRouter(tags=["Metrics"])
+
+@router.get("/metrics", include_in_schema=False)
+async def get_metrics() -> PlainTextResponse:
+    """
+    Возвращает метрики бота и HTTP в текстовом формате Prometheus.
+
+    Returns:
+        Текст метрик.
+    """
+    return PlainTextResponse(
+        metrics.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8"
+    )
@@ -6,14 +6,18 @@
 - users: Аутентификация и управление пользователями  
 - tags: Управление тегами
 - bot: Вебхуки для Telegram бота
+- broadcasts: Рассылки (для администраторов)
+- moderation: Очередь модерации постов (для модераторов)
+- feed: Лента событий постов (SSE, WebSocket)
+- imports: Массовый импорт постов (для администраторов)
 
 Экспортирует:
 - get_routers(): Функция для получения объединенного роутера
 """
 from fastapi import APIRouter
-from . import posts, users, tags, bot
+from . import posts, users, tags, bot, broadcasts, moderation, feed, imports
 
-__all__ = ["posts", "users", "tags", "bot"]
+__all__ = ["posts", "users", "tags", "bot", "broadcasts", "moderation", "feed", "imports"]
 
 def get_routers() -> APIRouter:
     """
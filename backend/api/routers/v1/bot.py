@@ -1,32 +1,118 @@
 """
 Модуль для обработки вебхуков Telegram бота.
 
-Этот модуль содержит роутер и обработчики для приема и обработки 
-вебхук-обновлений от Telegram бота. Используется для интеграции 
+Этот модуль содержит роутер и обработчики для приема и обработки
+вебхук-обновлений от Telegram бота. Используется для интеграции
 бота с веб-сервером через webhook API.
 
+Вебхук только валидирует обновление и кладет его в очередь
+`update_queue`, после чего сразу отвечает Telegram. Обработка выполняется
+пулом фоновых воркеров. Повторные доставки одного и того же update_id
+отсекаются окном дедупликации до валидации.
+
+При нескольких воркерах API обновление сохраняется в общую очередь в
+базе данных (`update_inbox`), а в `update_queue` его передает ведущий
+процесс: так порядок чата, лимит отправки и FSM остаются в одном
+процессе, а уникальный update_id отсекает повторы между воркерами.
+
 Роутеры:
 - /bot/webhook - Эндпоинт для приема вебхуков от Telegram
+- /bot/webhook/stats - Метрики очереди обновлений
+- /bot/lanes/stats - Метрики полос обработки обновлений
+- /bot/sender/stats - Метрики исходящих запросов к Bot API
+
+Эндпоинты метрик доступны только администраторам.
 
 Зависимости:
 - FastAPI для создания API эндпоинтов
 - Telegram бот и диспетчер для обработки обновлений
+- get_admin_user для проверки прав администратора
 """
-from fastapi import APIRouter
-from bot.core.instance import dp, bot
+import logging
+from typing import Dict
+from fastapi import APIRouter, Depends
+from api.responses import FastJSONRoute
+from pydantic import ValidationError
+from aiogram.types import Update
+from bot.core.instance import bot, update_queue, update_inbox, lane_executor, update_deduplicator, sender
+from shared.exceptions.bot import WebhookQueueFullError
+from shared.services.users import get_admin_user
 
-router = APIRouter(prefix="/bot", tags=["Webhook"])
+router = APIRouter(prefix="/bot", tags=["Webhook"], route_class=FastJSONRoute)
 
 @router.post("/webhook")
 async def bot_webhook(update: dict) -> dict:
     """
     Обработчик вебхука для приема обновлений от бота.
-    
+
+    Обновление валидируется и ставится в очередь (при нескольких
+    воркерах - в общую очередь в базе данных), ответ возвращается сразу,
+    не дожидаясь обработчиков. Уже принятое обновление (повторная
+    доставка) подтверждается без обработки.
+
     Args:
         update (dict): Обновление от бота.
 
     Returns:
-        dict: Результат обработки обновления.
+        dict: Результат приема обновления.
+
+    Raises:
+        WebhookQueueFullError: Если очередь обновлений переполнена (429).
     """
-    await dp.feed_webhook_update(bot, update)
+    update_id = update.get("update_id")
+    if isinstance(update_id, int) and update_deduplicator.check(update_id):
+        return {'ok': True}
+
+    try:
+        telegram_update = Update.model_validate(update, context={"bot": bot})
+    except ValidationError as e:
+        # Повторная доставка не исправит некорректное обновление
+        logging.warning("Некорректное обновление от Telegram: %s", e)
+        return {'ok': False}
+
+    if update_inbox is not None:
+        if not await update_inbox.add(update):
+            update_deduplicator.duplicates += 1
+        update_deduplicator.add(telegram_update.update_id)
+        return {'ok': True}
+
+    if not update_queue.put(telegram_update):
+        raise WebhookQueueFullError()
+
+    # Запоминаем только принятые обновления: отклоненное (429) Telegram доставит снова
+    update_deduplicator.add(telegram_update.update_id)
     return {'ok': True}
+
+@router.get("/webhook/stats", dependencies=[Depends(get_admin_user)])
+async def webhook_stats() -> Dict[str, int]:
+    """
+    Возвращает метрики очереди обновлений вебхука.
+
+    Returns:
+        Dict[str, int]: Глубина очереди, счетчики обработки и число дубликатов.
+    """
+    return {
+        **update_queue.stats().to_dict(),
+        "duplicates": update_deduplicator.duplicates
+    }
+
+@router.get("/lanes/stats", dependencies=[Depends(get_admin_user)])
+async def lanes_stats() -> Dict[str, int]:
+    """
+    Возвращает метрики полос обработки обновлений.
+
+    Returns:
+        Dict[str, int]: Количество полос, ожидающих и обрабатываемых обновлений.
+    """
+    return lane_executor.stats().to_dict()
+
+@router.get("/sender/stats", dependencies=[Depends(get_admin_user)])
+async def sender_stats() -> Dict[str, float]:
+    """
+    Возвращает метрики исходящих запросов к Bot API.
+
+    Returns:
+        Dict[str, float]: Количество отправленных запросов по приоритетам,
+            время ожидания лимитов, число RetryAfter и пропускная способность.
+    """
+    return sender.stats().to_dict()
@@ -0,0 +1,125 @@
+"""
+Модуль для управления рассылками через REST API.
+
+Этот модуль предоставляет администраторам эндпоинты для создания,
+запуска, приостановки и просмотра рассылок. Отправку выполняет
+`Broadcaster` бота в фоне, эндпоинты отвечают сразу.
+
+Роуты:
+- GET /broadcasts - Список рассылок
+- POST /broadcasts - Создание рассылки
+- GET /broadcasts/{broadcast_id} - Состояние и прогресс рассылки
+- POST /broadcasts/{broadcast_id}/start - Запуск или продолжение рассылки
+- POST /broadcasts/{broadcast_id}/pause - Приостановка рассылки
+
+Зависимости:
+- FastAPI для API эндпоинтов
+- BroadcastService для бизнес-логики
+- get_admin_user для проверки прав администратора
+"""
+from typing import List
+from fastapi import APIRouter, Depends
+from api.responses import FastJSONRoute
+from sqlalchemy.ext.asyncio import AsyncSession
+from shared.database.session import get_async_session
+from shared.schemas.broadcasts import BroadcastSchema, CreateBroadcastSchema
+from shared.services.broadcasts import BroadcastService
+from shared.services.users import get_admin_user
+from bot.core.instance import broadcaster, leader
+
+router = APIRouter(
+    prefix="/broadcasts",
+    route_class=FastJSONRoute,
+    tags=["Broadcasts"],
+    dependencies=[Depends(get_admin_user)]
+)
+
+@router.get("")
+async def get_broadcasts(
+    session: AsyncSession = Depends(get_async_session)
+    ) -> List[BroadcastSchema]:
+    """
+    Возвращает список рассылок, новые первыми.
+
+    Raises:
+        HTTPException: 403 Forbidden
+
+    Returns:
+        Список рассылок.
+    """
+    return await BroadcastService(session).get_broadcasts()
+
+@router.post("")
+async def create_broadcast(
+    data: CreateBroadcastSchema,
+    session: AsyncSession = Depends(get_async_session)
+    ) -> BroadcastSchema:
+    """
+    Создает рассылку. Отправка начинается после запуска.
+
+    Raises:
+        HTTPException: 403 Forbidden
+
+    Returns:
+        Созданная рассылка.
+    """
+    return await BroadcastService(session).create_broadcast(data)
+
+@router.get("/{broadcast_id}")
+async def get_broadcast(
+    broadcast_id: int,
+    session: AsyncSession = Depends(get_async_session)
+    ) -> BroadcastSchema:
+    """
+    Возвращает состояние и прогресс рассылки.
+
+    Raises:
+        HTTPException: 403 Forbidden
+        HTTPException: 404 Not Found
+
+    Returns:
+        Рассылка.
+    """
+    return await BroadcastService(session).get_broadcast(broadcast_id)
+
+@router.post("/{broadcast_id}/start")
+async def start_broadcast(
+    broadcast_id: int,
+    session: AsyncSession = Depends(get_async_session)
+    ) -> BroadcastSchema:
+    """
+    Запускает новую или продолжает приостановленную рассылку.
+
+    Рассылку выполняет ведущий процесс: если запрос обработан другим
+    воркером, ведущий подхватит рассылку при следующей проверке.
+
+    Raises:
+        HTTPException: 403 Forbidden
+        HTTPException: 404 Not Found
+        HTTPException: 409 Conflict
+
+    Returns:
+        Рассылка.
+    """
+    broadcast = await BroadcastService(session).start_broadcast(broadcast_id)
+    if leader.is_leader:
+        broadcaster.start(broadcast_id)
+    return broadcast
+
+@router.post("/{broadcast_id}/pause")
+async def pause_broadcast(
+    broadcast_id: int,
+    session: AsyncSession = Depends(get_async_session)
+    ) -> BroadcastSchema:
+    """
+    Приостанавливает рассылку после текущей порции получателей.
+
+    Raises:
+        HTTPException: 403 Forbidden
+        HTTPException: 404 Not Found
+        HTTPException: 409 Conflict
+
+    Returns:
+        Рассылка.
+    """
+    return await BroadcastService(session).pause_broadcast(broadcast_id)
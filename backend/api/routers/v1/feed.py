@@ -0,0 +1,105 @@
+"""
+Модуль ленты событий постов через REST API.
+
+Этот модуль предоставляет клиентам поток событий вместо опроса `/posts`:
+изменение статуса поста (в том числе публикация) и изменение рейтинга.
+События берутся из шины `shared.feed.feed`, у каждого клиента свой
+ограниченный буфер.
+
+Роуты:
+- GET /feed/stream - Поток событий (Server-Sent Events)
+- WS /feed/ws - Поток событий (WebSocket, JSON-сообщения)
+
+События:
+- post.status - {"type", "post_id", "data": {"status"}}
+- post.rating - {"type", "post_id", "data": {"rating"}}
+- reset - клиент не успевал читать события, нужно заново загрузить посты
+
+Зависимости:
+- FastAPI для API эндпоинтов
+- FeedBus для подписки на события
+"""
+import asyncio
+from typing import AsyncIterator
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from fastapi.responses import StreamingResponse
+from api.responses import FastJSONRoute
+from shared.feed import feed
+from settings import settings
+
+router = APIRouter(prefix="/feed", tags=["Feed"], route_class=FastJSONRoute)
+
+# Интервал переподключения EventSource, мс
+SSE_RETRY = 3000
+
+async def sse_events() -> AsyncIterator[str]:
+    """
+    Формирует поток событий в формате SSE.
+
+    Подписка создается при старте потока и снимается при его завершении
+    (в том числе при отключении клиента). При отсутствии событий
+    отправляется комментарий-heartbeat, чтобы прокси не закрывали
+    соединение.
+
+    Yields:
+        str: Сообщения SSE.
+    """
+    subscription = feed.subscribe(settings.feed_client_buffer)
+    try:
+        yield f"retry: {SSE_RETRY}\n\n"
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.get(), settings.feed_heartbeat)
+            except asyncio.TimeoutError:
+                yield ": ping\n\n"
+                continue
+            if event is None:
+                yield "event: reset\ndata: {}\n\n"
+                return
+            yield f"event: {event.type}\ndata: {event.to_json()}\n\n"
+    finally:
+        feed.unsubscribe(subscription)
+
+@router.get("/stream")
+async def stream_feed() -> StreamingResponse:
+    """
+    Возвращает поток событий постов (Server-Sent Events).
+
+    Returns:
+        StreamingResponse: Поток `text/event-stream`.
+    """
+    return StreamingResponse(
+        sse_events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@router.websocket("/ws")
+async def websocket_feed(websocket: WebSocket) -> None:
+    """
+    Передает события постов по WebSocket.
+
+    Сообщения - JSON событий; при отсутствии событий отправляется
+    `{"type": "ping"}`, по которому обнаруживается отключение клиента.
+
+    Args:
+        websocket (WebSocket): Соединение клиента.
+    """
+    await websocket.accept()
+    subscription = feed.subscribe(settings.feed_client_buffer)
+    try:
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.get(), settings.feed_heartbeat)
+            except asyncio.TimeoutError:
+                await websocket.send_text('{"type":"ping"}')
+                continue
+            if event is None:
+                await websocket.send_text('{"type":"reset"}')
+                await websocket.close()
+                return
+            await websocket.send_text(event.to_json())
+    except WebSocketDisconnect:
+        pass
+    finally:
+        feed.unsubscribe(subscription)
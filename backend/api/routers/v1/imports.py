@@ -0,0 +1,60 @@
+"""
+Модуль массового импорта постов через REST API.
+
+Этот модуль предоставляет администраторам эндпоинт загрузки постов из
+архива NDJSON-потоком: тело запроса читается и сохраняется порциями, не
+загружаясь в память целиком.
+
+Роуты:
+- POST /imports/posts - Импорт постов из NDJSON
+
+Формат строки (`PostImportSchema`):
+{"name": "...", "content": "...", "author": 1, "tags": ["работа"], "created_at": "2020-01-01T00:00:00"}
+
+Зависимости:
+- FastAPI для API эндпоинтов
+- ImportService для бизнес-логики
+- get_admin_user для проверки прав администратора
+"""
+from fastapi import APIRouter, Depends, Request
+from api.responses import FastJSONRoute
+from sqlalchemy.ext.asyncio import AsyncSession
+from shared.database.session import get_async_session
+from shared.schemas.imports import ImportReportSchema
+from shared.services.imports import ImportService
+from shared.services.users import get_admin_user
+
+router = APIRouter(
+    prefix="/imports",
+    route_class=FastJSONRoute,
+    tags=["Imports"],
+    dependencies=[Depends(get_admin_user)]
+)
+
+@router.post(
+    "/posts",
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/x-ndjson": {"schema": {"type": "string", "format": "binary"}}}
+        }
+    }
+)
+async def import_posts(
+    request: Request,
+    session: AsyncSession = Depends(get_async_session)
+    ) -> ImportReportSchema:
+    """
+    Импортирует посты из NDJSON (один пост в строке).
+
+    Ошибки строк не прерывают импорт и возвращаются в отчете с номерами
+    строк; импортированные порции сохраняются, даже если в других
+    порциях были ошибки.
+
+    Raises:
+        HTTPException: 403 Forbidden
+
+    Returns:
+        Отчет об импорте.
+    """
+    return await ImportService(session).import_posts(request.stream())
@@ -0,0 +1,90 @@
+"""
+Модуль очереди модерации постов через REST API.
+
+Новые посты создаются в статусе CHECKING. Модератор берет из очереди
+порцию постов (они закрепляются за ним на время проверки), а затем
+публикует или отклоняет их одним запросом.
+
+Роуты:
+- POST /moderation/claim - Получение порции постов из очереди
+- POST /moderation/decisions - Публикация или отклонение постов
+- POST /moderation/release - Возврат постов в очередь без решения
+
+Зависимости:
+- FastAPI для API эндпоинтов
+- ModerationService для бизнес-логики
+- get_moderator_user для проверки прав модератора
+"""
+from typing import List
+from fastapi import APIRouter, Body, Depends, Query
+from api.responses import FastJSONRoute
+from sqlalchemy.ext.asyncio import AsyncSession
+from shared.database.session import get_async_session
+from shared.schemas.users import UserSchema
+from shared.schemas.moderation import (
+    ModerationPostSchema,
+    ModerationDecisionSchema,
+    ModerationResultSchema
+)
+from shared.services.moderation import ModerationService
+from shared.services.users import get_moderator_user
+from settings import settings
+
+router = APIRouter(prefix="/moderation", tags=["Moderation"], route_class=FastJSONRoute)
+
+@router.post("/claim")
+async def claim_posts(
+    limit: int = Query(settings.moderation_batch_size, ge=1, le=settings.moderation_max_batch),
+    user: UserSchema = Depends(get_moderator_user),
+    session: AsyncSession = Depends(get_async_session)
+    ) -> List[ModerationPostSchema]:
+    """
+    Закрепляет за модератором порцию постов на проверке.
+
+    Параллельные модераторы получают непересекающиеся порции. Посты,
+    уже закрепленные за модератором, выдаются повторно.
+
+    Raises:
+        HTTPException: 403 Forbidden
+
+    Returns:
+        Закрепленные посты.
+    """
+    return await ModerationService(session).claim_posts(user.id, limit)
+
+@router.post("/decisions")
+async def decide(
+    data: ModerationDecisionSchema,
+    user: UserSchema = Depends(get_moderator_user),
+    session: AsyncSession = Depends(get_async_session)
+    ) -> ModerationResultSchema:
+    """
+    Публикует или отклоняет посты одним запросом.
+
+    Посты, которые уже не на проверке или закреплены за другим
+    модератором, возвращаются в `skipped`.
+
+    Raises:
+        HTTPException: 403 Forbidden
+
+    Returns:
+        Измененные и пропущенные посты.
+    """
+    return await ModerationService(session).decide(user.id, data.post_ids, data.decision)
+
+@router.post("/release")
+async def release_posts(
+    post_ids: List[int] = Body(max_length=settings.moderation_max_batch),
+    user: UserSchema = Depends(get_moderator_user),
+    session: AsyncSession = Depends(get_async_session)
+    ) -> List[int]:
+    """
+    Возвращает закрепленные за модератором посты в очередь.
+
+    Raises:
+        HTTPException: 403 Forbidden
+
+    Returns:
+        ID возвращенных в очередь постов.
+    """
+    return await ModerationService(session).release_posts(user.id, post_ids)
@@ -9,27 +9,58 @@
 - POST /posts/ - Создание нового поста
 - GET /posts/ - Получение списка постов с фильтрацией
 - GET /posts/{id} - Получение поста по ID  
+- POST /posts/batch - Получение нескольких постов по ID
 - PUT /posts/{id}/status - Обновление статуса поста
 
+GET-эндпоинты поддерживают условные запросы (ETag, Last-Modified, 304)
+и отдают Cache-Control из настроек (см. `api.caching`). Список и пакетное
+получение принимают `fields=id,name,rating` - из базы выбираются и в
+ответ попадают только эти поля.
+
 Зависимости:
 - FastAPI для создания API эндпоинтов
 - SQLAlchemy для работы с БД
 - PostService для бизнес-логики
 """
-from typing import List
-from fastapi import APIRouter, Depends, Query
+from datetime import datetime
+from typing import List, Tuple
+from fastapi import APIRouter, Depends, Query, Request, Response
 from fastapi import HTTPException
+from api.caching import CacheValidators, cache_control_for, make_etag
+from api.responses import FastJSONResponse, FastJSONRoute
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 from shared.database.session import get_async_session
 from shared.services.users import get_current_user
 from shared.schemas.users import UserSchema
-from shared.schemas.base import Page, PaginationParams
+from shared.schemas.base import BatchRequestSchema, BatchResult, Page, PaginationParams, sparse_fields
 from shared.schemas.posts import PostSchema, PostCreateSchema, PostStatus
 from shared.services.posts import PostService
 from shared.exceptions.posts import PostNotFoundError, PostCreateError, PostUpdateError
 
-router = APIRouter(prefix="/posts", tags=["Posts"])
+router = APIRouter(prefix="/posts", tags=["Posts"], route_class=FastJSONRoute)
+
+# Параметр `fields` с проверкой по схеме поста
+post_fields = sparse_fields(PostSchema)
+
+def post_validators(request: Request, post_id: int, updated_at: datetime, status: PostStatus) -> CacheValidators:
+    """
+    Строит валидаторы ответа для поста.
+
+    Args:
+        request (Request): Запрос.
+        post_id (int): ID поста.
+        updated_at (datetime): Дата последнего изменения поста.
+        status (PostStatus): Статус поста; CDN кэширует только опубликованные.
+
+    Returns:
+        CacheValidators: Валидаторы ответа.
+    """
+    return CacheValidators(
+        etag=make_etag("post", post_id, updated_at.isoformat()),
+        last_modified=updated_at,
+        cache_control=cache_control_for(request, public=status == PostStatus.PUBLISHED)
+    )
 
 @router.post("/", response_model=PostSchema)
 async def create_post(
@@ -83,29 +114,75 @@ async def update_post_status(
     except SQLAlchemyError as e:
         raise PostUpdateError(post_id, str(e)) from e
 
+@router.post("/batch", response_model=BatchResult[PostSchema])
+async def get_posts_batch(
+    batch: BatchRequestSchema,
+    fields: Tuple[str, ...] | None = Depends(post_fields),
+    session: AsyncSession = Depends(get_async_session)
+) -> BatchResult[PostSchema] | Response:
+    """
+    Получает несколько постов по ID одним запросом.
+
+    Args:
+        batch (BatchRequestSchema): ID постов (не больше `settings.batch_max_ids`).
+        fields (Tuple[str, ...] | None): Поля постов, None - все поля.
+        session (AsyncSession): Асинхронная сессия базы данных.
+
+    Returns:
+        BatchResult[PostSchema] | Response: Посты в порядке запроса и ненайденные ID.
+
+    Raises:
+        HTTPException: Если не удалось получить посты.
+    """
+    try:
+        posts, missing = await PostService(session).get_posts_batch(batch.ids, fields)
+        if fields:
+            return FastJSONResponse({"items": posts, "missing": missing})
+        return BatchResult[PostSchema](items=posts, missing=missing)
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Ошибка при получении постов: {str(e)}"
+        ) from e
+
 @router.get("/{post_id}", response_model=PostSchema)
 async def get_post(
     post_id: int,
+    request: Request,
     session: AsyncSession = Depends(get_async_session)
-) -> PostSchema:
+) -> Response:
     """
     Получает пост по его ID.
+
+    Сначала запрашивается только версия поста: если она совпадает с
+    версией клиента, возвращается 304 без загрузки поста.
     
     Args:
         post_id (int): ID поста.
+        request (Request): Запрос с заголовками условного запроса.
         session (AsyncSession): Асинхронная сессия базы данных.
     
     Returns:
-        PostSchema: Найденный пост.
+        Response: Пост или 304 Not Modified.
     
     Raises:
         HTTPException: Если пост не найден.
     """
     try:
-        post = await PostService(session).get_post(post_id)
+        service = PostService(session)
+        version = await service.get_post_version(post_id)
+        if version is None:
+            raise PostNotFoundError(post_id)
+        validators = post_validators(request, post_id, version.updated_at, version.status)
+        if validators.matches(request):
+            return validators.not_modified()
+
+        post = await service.get_post(post_id)
         if not post:
             raise PostNotFoundError(post_id)
-        return post
+        # Версия могла измениться между запросами - валидаторы по загруженному посту
+        validators = post_validators(request, post_id, post.updated_at, post.status)
+        return FastJSONResponse(post, headers=validators.headers)
     except SQLAlchemyError as e:
         raise HTTPException(
             status_code=500,
@@ -114,44 +191,81 @@ async def get_post(
 
 @router.get("/", response_model=Page[PostSchema])
 async def get_posts(
+    request: Request,
     pagination: PaginationParams = Depends(),
     search: str = None,
     status: PostStatus = None,
     tags: List[str] = Query(None),
     user_id: int = None,
+    fields: Tuple[str, ...] | None = Depends(post_fields),
     session: AsyncSession = Depends(get_async_session)
-) -> Page[PostSchema]:
+) -> Response:
     """
     Получает список постов с пагинацией, поиском, фильтрацией и сортировкой.
 
+    Версия списка - количество постов и максимальный `updated_at` по
+    фильтру (один агрегатный запрос) вместе с параметрами запроса. Если
+    она совпадает с версией клиента, возвращается 304 без выборки
+    страницы.
+
     Args:
+        request (Request): Запрос с заголовками условного запроса.
         pagination (PaginationParams): Параметры пагинации.
         search (str): Строка поиска.
         status (PostStatus): Статус поста.
         tags (List[str]): Список тегов.
         user_id (int): ID пользователя.
+        fields (Tuple[str, ...] | None): Поля постов, None - все поля.
         session (AsyncSession): Асинхронная сессия базы данных.
 
     Returns:
-        Page[PostSchema]: Страница с постами.
+        Response: Страница с постами или 304 Not Modified.
     
     Raises:
         HTTPException: Если не удалось получить посты.
     """
     try:
-        posts, total = await PostService(session).get_posts(
-            pagination=pagination,
+        service = PostService(session)
+        total, last_modified = await service.get_posts_version(
             search=search,
             status=status,
             tags=tags,
             user_id=user_id,
         )
-        return Page(
-            items=posts,
+        validators = CacheValidators(
+            etag=make_etag(
+                "posts",
+                sorted(request.query_params.multi_items()),
+                total,
+                last_modified and last_modified.isoformat()
+            ),
+            last_modified=last_modified,
+            # CDN кэширует только выборку опубликованных постов
+            cache_control=cache_control_for(request, public=status == PostStatus.PUBLISHED)
+        )
+        if validators.matches(request):
+            return validators.not_modified()
+
+        posts, total = await service.get_posts(
+            pagination=pagination,
+            search=search,
+            status=status,
+            tags=tags,
+            user_id=user_id,
             total=total,
-            page=pagination.page,
-            size=pagination.limit
+            fields=fields,
         )
+        if fields:
+            # Частичные записи не соответствуют PostSchema - страница словарем
+            page = {"items": posts, "total": total, "page": pagination.page, "size": pagination.limit}
+        else:
+            page = Page[PostSchema](
+                items=posts,
+                total=total,
+                page=pagination.page,
+                size=pagination.limit
+            )
+        return FastJSONResponse(page, headers=validators.headers)
     except SQLAlchemyError as e:
         raise HTTPException(
             status_code=500,
@@ -8,6 +8,7 @@
 - POST /tags/ - Создание новых тегов
 - GET /tags/{post_id}/tags - Получение тегов поста
 - POST /tags/post-tags - Привязка тегов к посту
+- POST /tags/batch - Получение нескольких тегов по ID
 
 Зависимости:
 - FastAPI для API эндпоинтов
@@ -18,13 +19,15 @@
 from typing import List, Dict
 from fastapi import APIRouter, Depends
 from fastapi import HTTPException
+from api.responses import FastJSONRoute
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 from shared.database.session import get_async_session
+from shared.schemas.base import BatchRequestSchema, BatchResult
 from shared.schemas.tags import TagSchema
 from shared.services.tags import TagService
 
-router = APIRouter(prefix="/tags", tags=["Tags"])
+router = APIRouter(prefix="/tags", tags=["Tags"], route_class=FastJSONRoute)
 
 
 @router.post("/", response_model=TagSchema)
@@ -105,3 +108,30 @@ async def add_post_tags(
             status_code=500,
             detail=f"Не удалось связать теги с постом: {str(e)}"
         ) from e
+
+@router.post("/batch", response_model=BatchResult[TagSchema])
+async def get_tags_batch(
+    batch: BatchRequestSchema,
+    session: AsyncSession = Depends(get_async_session)
+) -> BatchResult[TagSchema]:
+    """
+    Получает несколько тегов по ID одним запросом.
+
+    Args:
+        batch (BatchRequestSchema): ID тегов (не больше `settings.batch_max_ids`).
+        session (AsyncSession): Асинхронная сессия базы данных.
+
+    Returns:
+        BatchResult[TagSchema]: Теги в порядке запроса и ненайденные ID.
+
+    Raises:
+        HTTPException: Если не удалось получить теги.
+    """
+    try:
+        tags, missing = await TagService(session).get_tags_batch(batch.ids)
+        return BatchResult[TagSchema](items=tags, missing=missing)
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Не удалось получить теги: {str(e)}"
+        ) from e
@@ -8,20 +8,25 @@
 Роуты:
 - POST /users - Аутентификация пользователя
 - POST /users/create - Создание нового пользователя
+- POST /users/batch - Публичные данные нескольких пользователей по ID
 
 Зависимости:
 - FastAPI для API эндпоинтов
 - OAuth2 для аутентификации
 - AuthService для бизнес-логики
 """
-from fastapi import APIRouter, Depends
+from typing import Tuple
+from fastapi import APIRouter, Depends, HTTPException, Response
 from fastapi.security import OAuth2PasswordRequestForm
+from api.responses import FastJSONResponse, FastJSONRoute
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
 from shared.database.session import get_async_session
-from shared.schemas.users import TokenSchema, CreateUserSchema, UserUpdateSchema, UserSchema
-from shared.services.users import AuthService, UserService
+from shared.schemas.base import BatchRequestSchema, BatchResult, sparse_fields
+from shared.schemas.users import TokenSchema, CreateUserSchema, UserUpdateSchema, UserSchema, UserPublicSchema
+from shared.services.users import AuthService, UserService, get_current_user
 
-router = APIRouter(prefix="/users", tags=["Users"])
+router = APIRouter(prefix="/users", tags=["Users"], route_class=FastJSONRoute)
 
 @router.post("")
 async def authenticate(
@@ -62,6 +67,7 @@ async def create_user(
 
 @router.get("/me")
 async def get_profile(
+    user: UserSchema = Depends(get_current_user),
     session: AsyncSession = Depends(get_async_session)
     ) -> UserSchema:
     """
@@ -70,11 +76,12 @@ async def get_profile(
     Returns:
         Возвращает информацию о текущем пользователе.
     """
-    return await UserService(session).get_profile()
+    return await UserService(session).get_profile(user)
 
 @router.patch("/me")
 async def update_profile(
     data: UserUpdateSchema,
+    user: UserSchema = Depends(get_current_user),
     session: AsyncSession = Depends(get_async_session)
 
     ) -> UserSchema:
@@ -87,4 +94,34 @@ async def update_profile(
         Обновленные данные пользователя.
     
     """
-    return await UserService(session).update_profile(data)
+    return await UserService(session).update_profile(user, data)
+
+@router.post("/batch", response_model=BatchResult[UserPublicSchema])
+async def get_users_batch(
+    batch: BatchRequestSchema,
+    fields: Tuple[str, ...] | None = Depends(sparse_fields(UserPublicSchema)),
+    session: AsyncSession = Depends(get_async_session)
+    ) -> BatchResult[UserPublicSchema] | Response:
+    """
+    Возвращает публичные данные нескольких пользователей одним запросом.
+
+    Args:
+        batch: ID пользователей (не больше `settings.batch_max_ids`).
+        fields: Поля пользователей через запятую (`fields=id,username`).
+
+    Raises:
+        HTTPException: 500 Internal Server Error
+
+    Returns:
+        Пользователи в порядке запроса и ненайденные ID.
+    """
+    try:
+        users, missing = await UserService(session).get_users_batch(batch.ids, fields)
+        if fields:
+            return FastJSONResponse({"items": users, "missing": missing})
+        return BatchResult[UserPublicSchema](items=users, missing=missing)
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Не удалось получить пользователей: {str(e)}"
+        ) from e
@@ -2,15 +2,19 @@
 Модуль для объединения всех роутеров API v2.
 
 Этот модуль собирает все роутеры из подмодулей:
-- <module>: <description>
+- posts: Лента постов с курсором и получение постов
+- users: Публичные данные пользователей
+- tags: Теги постов
+
+Ответы API v2 отдаются в MessagePack или JSON по заголовку Accept.
 
 Экспортирует:
 - get_routers(): Функция для получения объединенного роутера
 """
 from fastapi import APIRouter
-# from . import <module> # TODO: Добавить модули для API v2 в формате module
+from . import posts, users, tags
 
-__all__ = [] # TODO: Добавить модули для API v2 в формате строки "module"
+__all__ = ["posts", "users", "tags"]
 
 def get_routers() -> APIRouter:
     """
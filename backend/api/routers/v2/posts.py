@@ -0,0 +1,186 @@
+"""
+Модуль для чтения постов через REST API v2.
+
+API v2 - компактный вариант чтения постов для веб-приложения и мобильных
+клиентов. Ответы отдаются в MessagePack (`Accept: application/msgpack`)
+или JSON, список постов - страница с курсором (`CursorPage`) вместо
+подсчета общего количества. Бизнес-логика общая с API v1 (PostService).
+
+Роуты:
+- GET /posts/ - Лента постов с курсором
+- GET /posts/{id} - Получение поста по ID
+- POST /posts/batch - Получение нескольких постов по ID
+
+Зависимости:
+- FastAPI для создания API эндпоинтов
+- SQLAlchemy для работы с БД
+- PostService для бизнес-логики
+"""
+from typing import List, Tuple
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi import HTTPException
+from api.caching import CacheValidators, cache_control_for, make_etag
+from api.responses import MSGPACK_RESPONSES, FastJSONRoute, accepts_msgpack, negotiate
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+from shared.database.session import get_async_session
+from shared.schemas.base import BatchRequestSchema, BatchResult, CursorPage, sparse_fields
+from shared.schemas.posts import PostSchema, PostStatus, PostSort
+from shared.services.posts import PostService
+from shared.exceptions.posts import PostNotFoundError
+from settings import settings
+
+router = APIRouter(
+    prefix="/posts",
+    tags=["Posts v2"],
+    route_class=FastJSONRoute,
+    responses=MSGPACK_RESPONSES
+)
+
+# Параметр `fields` с проверкой по схеме поста
+post_fields = sparse_fields(PostSchema)
+
+@router.get("/", response_model=CursorPage[PostSchema])
+async def get_posts(
+    request: Request,
+    limit: int = Query(10, ge=1, le=settings.cursor_page_max),
+    cursor: str = None,
+    sort: PostSort = PostSort.NEW,
+    search: str = None,
+    status: PostStatus = None,
+    tags: List[str] = Query(None),
+    user_id: int = None,
+    fields: Tuple[str, ...] | None = Depends(post_fields),
+    session: AsyncSession = Depends(get_async_session)
+) -> Response:
+    """
+    Получает ленту постов по курсору.
+
+    Следующая страница запрашивается с `cursor` из поля `next` ответа и
+    теми же параметрами сортировки и фильтров.
+
+    Args:
+        request (Request): Запрос (формат ответа по заголовку Accept).
+        limit (int): Размер страницы (не больше `settings.cursor_page_max`).
+        cursor (str): Курсор следующей страницы, None - первая страница.
+        sort (PostSort): Порядок постов: new - новые, top - по рейтингу.
+        search (str): Строка поиска.
+        status (PostStatus): Статус поста.
+        tags (List[str]): Список тегов.
+        user_id (int): ID пользователя.
+        fields (Tuple[str, ...] | None): Поля постов, None - все поля.
+        session (AsyncSession): Асинхронная сессия базы данных.
+
+    Returns:
+        Response: Страница постов с курсором следующей страницы.
+
+    Raises:
+        HTTPException: Если курсор некорректен или не удалось получить посты.
+    """
+    try:
+        posts, next_cursor = await PostService(session).get_posts_page(
+            limit=limit,
+            cursor=cursor,
+            sort=sort,
+            search=search,
+            status=status,
+            tags=tags,
+            user_id=user_id,
+            fields=fields,
+        )
+        if fields:
+            # Частичные записи не соответствуют PostSchema - страница словарем
+            return negotiate(request, {"items": posts, "next": next_cursor})
+        return negotiate(request, CursorPage[PostSchema](items=posts, next=next_cursor))
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Ошибка при получении постов: {str(e)}"
+        ) from e
+
+@router.post("/batch", response_model=BatchResult[PostSchema])
+async def get_posts_batch(
+    request: Request,
+    batch: BatchRequestSchema,
+    fields: Tuple[str, ...] | None = Depends(post_fields),
+    session: AsyncSession = Depends(get_async_session)
+) -> Response:
+    """
+    Получает несколько постов по ID одним запросом.
+
+    Args:
+        request (Request): Запрос (формат ответа по заголовку Accept).
+        batch (BatchRequestSchema): ID постов (не больше `settings.batch_max_ids`).
+        fields (Tuple[str, ...] | None): Поля постов, None - все поля.
+        session (AsyncSession): Асинхронная сессия базы данных.
+
+    Returns:
+        Response: Посты в порядке запроса и ненайденные ID.
+
+    Raises:
+        HTTPException: Если не удалось получить посты.
+    """
+    try:
+        posts, missing = await PostService(session).get_posts_batch(batch.ids, fields)
+        if fields:
+            return negotiate(request, {"items": posts, "missing": missing})
+        return negotiate(request, BatchResult[PostSchema](items=posts, missing=missing))
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Ошибка при получении постов: {str(e)}"
+        ) from e
+
+@router.get("/{post_id}", response_model=PostSchema)
+async def get_post(
+    post_id: int,
+    request: Request,
+    session: AsyncSession = Depends(get_async_session)
+) -> Response:
+    """
+    Получает пост по его ID.
+
+    Поддерживает условные запросы, как и API v1; ETag учитывает формат
+    ответа, так как JSON и MessagePack - разные представления поста.
+
+    Args:
+        post_id (int): ID поста.
+        request (Request): Запрос с заголовками Accept и условного запроса.
+        session (AsyncSession): Асинхронная сессия базы данных.
+
+    Returns:
+        Response: Пост или 304 Not Modified.
+
+    Raises:
+        HTTPException: Если пост не найден.
+    """
+    try:
+        service = PostService(session)
+        media = "msgpack" if accepts_msgpack(request.headers.get("accept", "")) else "json"
+        version = await service.get_post_version(post_id)
+        if version is None:
+            raise PostNotFoundError(post_id)
+        validators = CacheValidators(
+            etag=make_etag("post", post_id, version.updated_at.isoformat(), media),
+            last_modified=version.updated_at,
+            cache_control=cache_control_for(request, public=version.status == PostStatus.PUBLISHED)
+        )
+        if validators.matches(request):
+            response = validators.not_modified()
+            response.headers["Vary"] = "Accept"
+            return response
+
+        post = await service.get_post(post_id)
+        if not post:
+            raise PostNotFoundError(post_id)
+        validators = CacheValidators(
+            etag=make_etag("post", post_id, post.updated_at.isoformat(), media),
+            last_modified=post.updated_at,
+            cache_control=cache_control_for(request, public=post.status == PostStatus.PUBLISHED)
+        )
+        return negotiate(request, post, headers=validators.headers)
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Ошибка при получении поста: {str(e)}"
+        ) from e
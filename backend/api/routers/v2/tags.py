@@ -0,0 +1,88 @@
+"""
+Модуль для чтения тегов через REST API v2.
+
+Ответы отдаются в MessagePack (`Accept: application/msgpack`) или JSON.
+Бизнес-логика общая с API v1 (TagService).
+
+Роуты:
+- GET /tags/{post_id}/tags - Получение тегов поста
+- POST /tags/batch - Получение нескольких тегов по ID
+
+Зависимости:
+- FastAPI для API эндпоинтов
+- SQLAlchemy для работы с БД
+- TagService для бизнес-логики тегов
+"""
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from api.responses import MSGPACK_RESPONSES, FastJSONRoute, negotiate
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+from shared.database.session import get_async_session
+from shared.schemas.base import BatchRequestSchema, BatchResult
+from shared.schemas.tags import TagSchema
+from shared.services.tags import TagService
+
+router = APIRouter(
+    prefix="/tags",
+    tags=["Tags v2"],
+    route_class=FastJSONRoute,
+    responses=MSGPACK_RESPONSES
+)
+
+@router.get("/{post_id}/tags", response_model=List[TagSchema])
+async def get_post_tags(
+    post_id: int,
+    request: Request,
+    session: AsyncSession = Depends(get_async_session)
+) -> Response:
+    """
+    Получает теги поста по его ID.
+
+    Args:
+        post_id (int): ID поста.
+        request (Request): Запрос (формат ответа по заголовку Accept).
+        session (AsyncSession): Асинхронная сессия базы данных.
+
+    Returns:
+        Response: Список тегов поста.
+
+    Raises:
+        HTTPException: Если не удалось получить теги поста.
+    """
+    try:
+        return negotiate(request, await TagService(session).get_tags_by_post_id(post_id))
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Не удалось получить теги поста: {str(e)}"
+        ) from e
+
+@router.post("/batch", response_model=BatchResult[TagSchema])
+async def get_tags_batch(
+    request: Request,
+    batch: BatchRequestSchema,
+    session: AsyncSession = Depends(get_async_session)
+) -> Response:
+    """
+    Получает несколько тегов по ID одним запросом.
+
+    Args:
+        request (Request): Запрос (формат ответа по заголовку Accept).
+        batch (BatchRequestSchema): ID тегов (не больше `settings.batch_max_ids`).
+        session (AsyncSession): Асинхронная сессия базы данных.
+
+    Returns:
+        Response: Теги в порядке запроса и ненайденные ID.
+
+    Raises:
+        HTTPException: Если не удалось получить теги.
+    """
+    try:
+        tags, missing = await TagService(session).get_tags_batch(batch.ids)
+        return negotiate(request, BatchResult[TagSchema](items=tags, missing=missing))
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Не удалось получить теги: {str(e)}"
+        ) from e
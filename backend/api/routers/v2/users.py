@@ -0,0 +1,61 @@
+"""
+Модуль для чтения пользователей через REST API v2.
+
+Ответы отдаются в MessagePack (`Accept: application/msgpack`) или JSON.
+Бизнес-логика общая с API v1 (UserService).
+
+Роуты:
+- POST /users/batch - Публичные данные нескольких пользователей по ID
+
+Зависимости:
+- FastAPI для API эндпоинтов
+- UserService для бизнес-логики
+"""
+from typing import Tuple
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from api.responses import MSGPACK_RESPONSES, FastJSONRoute, negotiate
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+from shared.database.session import get_async_session
+from shared.schemas.base import BatchRequestSchema, BatchResult, sparse_fields
+from shared.schemas.users import UserPublicSchema
+from shared.services.users import UserService
+
+router = APIRouter(
+    prefix="/users",
+    tags=["Users v2"],
+    route_class=FastJSONRoute,
+    responses=MSGPACK_RESPONSES
+)
+
+@router.post("/batch", response_model=BatchResult[UserPublicSchema])
+async def get_users_batch(
+    request: Request,
+    batch: BatchRequestSchema,
+    fields: Tuple[str, ...] | None = Depends(sparse_fields(UserPublicSchema)),
+    session: AsyncSession = Depends(get_async_session)
+) -> Response:
+    """
+    Возвращает публичные данные нескольких пользователей одним запросом.
+
+    Args:
+        request: Запрос (формат ответа по заголовку Accept).
+        batch: ID пользователей (не больше `settings.batch_max_ids`).
+        fields: Поля пользователей через запятую (`fields=id,username`).
+
+    Raises:
+        HTTPException: 500 Internal Server Error
+
+    Returns:
+        Пользователи в порядке запроса и ненайденные ID.
+    """
+    try:
+        users, missing = await UserService(session).get_users_batch(batch.ids, fields)
+        if fields:
+            return negotiate(request, {"items": users, "missing": missing})
+        return negotiate(request, BatchResult[UserPublicSchema](items=users, missing=missing))
+    except SQLAlchemyError as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Не удалось получить пользователей: {str(e)}"
+        ) from e
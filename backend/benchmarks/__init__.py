@@ -0,0 +1,8 @@
+"""
+Бенчмарки производительности бэкенда.
+
+Запуск: `python -m benchmarks.<модуль>` из каталога backend.
+
+Бенчмарки сервисов и слоя данных с результатами в JSON и сравнением
+запусков: `python -m benchmarks.suite run|compare` (см. `benchmarks.suite`).
+"""
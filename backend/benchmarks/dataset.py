@@ -0,0 +1,137 @@
+"""
+Тестовые данные для бенчмарков слоя данных.
+
+Создает схему базы данных и заполняет ее детерминированным набором
+пользователей, тегов, постов и связей постов с тегами заданного размера,
+чтобы результаты разных запусков можно было сравнивать.
+
+В SQLite таблица `posttags` создается отдельным DDL: модель `PostTag`
+наследует автоинкрементный `id` при составном первичном ключе, который
+SQLite не поддерживает.
+"""
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List
+from sqlalchemy import insert, text
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncEngine
+from shared.models import User, Post
+from shared.models.base import SQLModel
+from shared.models.tags import Tag
+from shared.models.post_tags import PostTag
+from shared.schemas.posts import PostStatus
+
+# Слова названий и текстов постов; SEARCH_WORD встречается примерно в 1/8 постов
+WORDS = ["начальник", "отпуск", "зарплата", "офис", "дедлайн", "коллега", "отчет", "работа"]
+SEARCH_WORD = "работа"
+TAG_COUNT = 50
+INSERT_CHUNK = 1000
+
+SQLITE_POSTTAGS = """
+CREATE TABLE posttags (
+    id INTEGER,
+    post_id INTEGER NOT NULL REFERENCES posts (id) ON DELETE CASCADE,
+    tag_id INTEGER NOT NULL REFERENCES tags (id) ON DELETE CASCADE,
+    created_at TIMESTAMP,
+    updated_at TIMESTAMP,
+    PRIMARY KEY (post_id, tag_id)
+)
+"""
+
+
+@dataclass(frozen=True)
+class Dataset:
+    """
+    Параметры созданного набора данных.
+
+    Args:
+        size (int): Количество постов.
+        users (int): Количество пользователей (ID с 1).
+        tags (List[str]): Названия тегов.
+    """
+    size: int
+    users: int
+    tags: List[str]
+
+
+def create_schema(connection: Connection) -> None:
+    """
+    Пересоздает таблицы приложения.
+
+    Args:
+        connection (Connection): Синхронное соединение.
+    """
+    SQLModel.metadata.drop_all(connection)
+    if connection.dialect.name == "sqlite":
+        tables = [table for table in SQLModel.metadata.sorted_tables if table is not PostTag.__table__]
+        SQLModel.metadata.create_all(connection, tables=tables)
+        connection.execute(text(SQLITE_POSTTAGS))
+    else:
+        SQLModel.metadata.create_all(connection)
+
+
+async def seed(engine: AsyncEngine, size: int, seed_value: int = 42) -> Dataset:
+    """
+    Создает схему и заполняет ее данными.
+
+    Args:
+        engine (AsyncEngine): Движок базы данных бенчмарка.
+        size (int): Количество постов.
+        seed_value (int): Начальное значение генератора случайных чисел.
+
+    Returns:
+        Dataset: Параметры набора данных.
+    """
+    rnd = random.Random(seed_value)
+    users = max(10, size // 20)
+    tags = [f"тег{i}" for i in range(TAG_COUNT)]
+    started = datetime(2024, 1, 1)
+
+    async with engine.begin() as connection:
+        await connection.run_sync(create_schema)
+        await connection.execute(insert(User), [
+            {"username": f"user{i}", "chat_id": 100000 + i, "email": f"user{i}@example.com"}
+            for i in range(1, users + 1)
+        ])
+        await connection.execute(insert(Tag), [{"name": name} for name in tags])
+
+        posts: List[Dict[str, Any]] = []
+        post_tags: List[Dict[str, Any]] = []
+        for post_id in range(1, size + 1):
+            created_at = started + timedelta(minutes=post_id)
+            posts.append({
+                "id": post_id,
+                "name": " ".join(rnd.choices(WORDS, k=3)),
+                "content": " ".join(rnd.choices(WORDS, k=60)),
+                "author": rnd.randint(1, users),
+                "rating": rnd.randint(-10, 100),
+                "status": rnd.choices(list(PostStatus), weights=(1, 1, 6, 1))[0],
+                "created_at": created_at,
+                "updated_at": created_at,
+            })
+            for tag_id in rnd.sample(range(1, TAG_COUNT + 1), rnd.randint(0, 3)):
+                post_tags.append({"post_id": post_id, "tag_id": tag_id, "created_at": created_at})
+            if len(posts) >= INSERT_CHUNK:
+                await _flush(connection, posts, post_tags)
+
+        await _flush(connection, posts, post_tags)
+
+    return Dataset(size=size, users=users, tags=tags)
+
+
+async def _flush(connection: Any, posts: List[Dict[str, Any]], post_tags: List[Dict[str, Any]]) -> None:
+    """
+    Вставляет накопленные посты и связи с тегами и очищает списки.
+
+    Args:
+        connection (AsyncConnection): Соединение в транзакции.
+        posts (List[Dict[str, Any]]): Строки постов.
+        post_tags (List[Dict[str, Any]]): Строки связей постов с тегами.
+    """
+    if posts:
+        await connection.execute(insert(Post), posts)
+    if post_tags:
+        await connection.execute(insert(PostTag), post_tags)
+    posts.clear()
+    post_tags.clear()
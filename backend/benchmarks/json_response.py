@@ -0,0 +1,133 @@
+"""
+Бенчмарк сериализации ответа `/posts`.
+
+Сравнивает стандартный путь FastAPI (повторная валидация по
+`response_model`, `field.serialize` и `json.dumps`) с `FastJSONRoute` и
+`FastJSONResponse` на странице `Page[PostSchema]`, уже собранной из
+провалидированных схем, как ее возвращает `PostDataManager`. Ответы
+обоих вариантов сравниваются на равенство.
+
+Запуск:
+    python -m benchmarks.json_response [--requests 2000] [--size 50]
+"""
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime
+from fastapi import APIRouter, FastAPI
+from fastapi.responses import JSONResponse
+from fastapi.routing import APIRoute
+from api.responses import FastJSONResponse, FastJSONRoute
+from shared.schemas.base import Page
+from shared.schemas.posts import PostSchema, PostStatus
+from shared.schemas.users import UserSchema
+from benchmarks.middleware import make_request
+
+
+def build_page(size: int) -> Page[PostSchema]:
+    """
+    Собирает страницу постов из провалидированных схем.
+
+    Args:
+        size (int): Количество постов.
+
+    Returns:
+        Page[PostSchema]: Страница постов.
+    """
+    user = UserSchema(id=1, username="author", chat_id=1, email=None, created_at=datetime(2024, 1, 1))
+    items = [
+        PostSchema(
+            id=i,
+            name=f"Пост {i}",
+            content="Текст поста " * 20,
+            status=PostStatus.PUBLISHED,
+            author=1,
+            rating=i,
+            created_at=datetime(2024, 1, 1),
+            updated_at=datetime(2024, 1, 2),
+            user=user,
+        )
+        for i in range(size)
+    ]
+    return Page[PostSchema](items=items, total=size, page=1, size=size)
+
+
+def build_app(fast: bool, page: Page[PostSchema]) -> FastAPI:
+    """
+    Создает приложение с эндпоинтом списка постов.
+
+    Args:
+        fast (bool): Использовать быстрый путь сериализации.
+        page (Page[PostSchema]): Возвращаемая страница.
+
+    Returns:
+        FastAPI: Приложение.
+    """
+    app = FastAPI(default_response_class=FastJSONResponse if fast else JSONResponse)
+    router = APIRouter(prefix="/api/v1/posts", route_class=FastJSONRoute if fast else APIRoute)
+
+    @router.get("/", response_model=Page[PostSchema])
+    async def get_posts() -> Page[PostSchema]:
+        return page
+
+    app.include_router(router)
+    return app
+
+
+async def run(requests: int, size: int) -> dict:
+    """
+    Выполняет бенчмарк.
+
+    Args:
+        requests (int): Количество запросов на замер.
+        size (int): Количество постов на странице.
+
+    Returns:
+        dict: Среднее время запроса (мкс) для стандартного и быстрого пути.
+    """
+    page = build_page(size)
+    request = make_request("GET", "/api/v1/posts/")
+    results = {}
+    bodies = {}
+    for name, fast in (("fastapi", False), ("fast_json", True)):
+        app = build_app(fast, page)
+        body = bytearray()
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            if message["type"] == "http.response.body":
+                body.extend(message.get("body", b""))
+
+        scope = {
+            "type": "http", "method": "GET", "path": "/api/v1/posts/", "raw_path": b"/api/v1/posts/",
+            "query_string": b"", "root_path": "", "headers": [], "scheme": "http", "http_version": "1.1",
+        }
+        await app(scope, receive, send)
+        bodies[name] = json.loads(body)
+
+        for _ in range(min(100, requests)):
+            await request(app)
+        started = time.perf_counter()
+        for _ in range(requests):
+            await request(app)
+        results[name] = (time.perf_counter() - started) / requests * 1e6
+        print(f"{name:<10} {results[name]:8.1f} мкс на запрос ({size} постов)")
+
+    assert bodies["fastapi"] == bodies["fast_json"], "Ответы различаются"
+    print(f"Ускорение: {results['fastapi'] / results['fast_json']:.2f}x, ответы совпадают")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк сериализации ответа /posts")
+    parser.add_argument("--requests", type=int, default=2000, help="Количество запросов на замер")
+    parser.add_argument("--size", type=int, default=50, help="Количество постов на странице")
+    args = parser.parse_args()
+    asyncio.run(run(args.requests, args.size))
+
+
+if __name__ == "__main__":
+    main()
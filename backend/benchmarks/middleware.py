@@ -0,0 +1,196 @@
+"""
+Бенчмарк накладных расходов промежуточных слоев API.
+
+Сравнивает прежний стек (блокировка документации на `BaseHTTPMiddleware`)
+с ASGI-стеком приложения (блокировка документации, Server-Timing,
+сжатие) и с приложением без промежуточных слоев. Запросы подаются
+напрямую в ASGI-приложение без сети, поэтому разница во времени - это
+стоимость самих промежуточных слоев.
+
+Эндпоинты повторяют `/api/v1/bot/webhook` (маленький JSON-ответ) и
+`/api/v1/posts` (список постов), но не обращаются к боту и базе данных.
+
+Запуск:
+    python -m benchmarks.middleware [--requests 5000]
+"""
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List
+from fastapi import FastAPI, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
+from starlette.middleware.base import BaseHTTPMiddleware
+from api.middlewares.compression import CompressionMiddleware
+from api.middlewares.docs_blocker import BlockDocsMiddleware
+from api.middlewares.timing import TimingMiddleware
+
+UPDATE = json.dumps({
+    "update_id": 1,
+    "message": {"message_id": 1, "date": 0, "chat": {"id": 1, "type": "private"}, "text": "/start"}
+}).encode()
+
+POSTS = [
+    {
+        "id": i,
+        "name": f"Пост {i}",
+        "content": "Текст поста " * 20,
+        "author": 1,
+        "rating": i,
+        "status": "published",
+        "created_at": datetime(2024, 1, 1).isoformat(),
+        "updated_at": datetime(2024, 1, 1).isoformat(),
+    }
+    for i in range(50)
+]
+
+
+class LegacyBlockDocsMiddleware(BaseHTTPMiddleware):
+    """
+    Прежняя реализация блокировки документации (для сравнения).
+    """
+    async def dispatch(self, request: Request, call_next):
+        if request.url.path in ["/docs", "/redoc"]:
+            return JSONResponse(status_code=403, content={"detail": "Доступ к документации запрещён."})
+        return await call_next(request)
+
+
+def build_app(stack: str) -> FastAPI:
+    """
+    Создает приложение с эндпоинтами бенчмарка и заданным стеком слоев.
+
+    Args:
+        stack (str): "none", "legacy" или "asgi".
+
+    Returns:
+        FastAPI: Приложение.
+    """
+    app = FastAPI()
+
+    @app.post("/api/v1/bot/webhook")
+    async def webhook(update: dict) -> dict:
+        return {"ok": True}
+
+    @app.get("/api/v1/posts")
+    async def posts() -> List[Dict[str, Any]]:
+        return POSTS
+
+    if stack == "legacy":
+        app.add_middleware(LegacyBlockDocsMiddleware)
+    elif stack == "asgi":
+        app.add_middleware(CompressionMiddleware)
+        app.add_middleware(BlockDocsMiddleware)
+        app.add_middleware(TimingMiddleware)
+    if stack != "none":
+        app.add_middleware(CORSMiddleware, allow_origins=["*"])
+    return app
+
+
+def make_request(method: str, path: str, body: bytes = b"") -> Callable[[FastAPI], Any]:
+    """
+    Возвращает функцию, выполняющую один запрос к ASGI-приложению.
+
+    Args:
+        method (str): HTTP-метод.
+        path (str): Путь.
+        body (bytes): Тело запроса.
+
+    Returns:
+        Callable[[FastAPI], Any]: Корутинная функция запроса, возвращающая размер ответа.
+    """
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [
+            (b"host", b"bench"),
+            (b"content-type", b"application/json"),
+            (b"accept-encoding", b"gzip, br"),
+        ],
+        "client": ("127.0.0.1", 1),
+        "server": ("bench", 80),
+    }
+
+    async def request(app: FastAPI) -> int:
+        messages = [{"type": "http.request", "body": body, "more_body": False}]
+        size = 0
+
+        async def receive():
+            return messages.pop() if messages else {"type": "http.disconnect"}
+
+        async def send(message):
+            nonlocal size
+            if message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+
+        await app(dict(scope), receive, send)
+        return size
+
+    return request
+
+
+async def measure(app: FastAPI, request: Callable, requests: int) -> tuple[float, int]:
+    """
+    Замеряет среднее время запроса.
+
+    Args:
+        app (FastAPI): Приложение.
+        request (Callable): Функция запроса.
+        requests (int): Количество запросов.
+
+    Returns:
+        tuple[float, int]: Среднее время запроса (мкс) и размер ответа (байты).
+    """
+    for _ in range(min(200, requests)):
+        size = await request(app)
+    started = time.perf_counter()
+    for _ in range(requests):
+        await request(app)
+    return (time.perf_counter() - started) / requests * 1e6, size
+
+
+async def run(requests: int) -> Dict[str, Dict[str, float]]:
+    """
+    Выполняет бенчмарк для всех стеков и эндпоинтов.
+
+    Args:
+        requests (int): Количество запросов на замер.
+
+    Returns:
+        Dict[str, Dict[str, float]]: Среднее время (мкс) по эндпоинтам и стекам.
+    """
+    endpoints = {
+        "POST /api/v1/bot/webhook": make_request("POST", "/api/v1/bot/webhook", UPDATE),
+        "GET /api/v1/posts": make_request("GET", "/api/v1/posts"),
+    }
+    stacks = ("none", "legacy", "asgi")
+    apps = {stack: build_app(stack) for stack in stacks}
+    results: Dict[str, Dict[str, float]] = {}
+    for name, request in endpoints.items():
+        results[name] = {}
+        for stack in stacks:
+            elapsed, size = await measure(apps[stack], request, requests)
+            results[name][stack] = elapsed
+            print(f"{name:<28} {stack:<7} {elapsed:8.1f} мкс  ответ {size} байт")
+        saved = results[name]["legacy"] - results[name]["asgi"]
+        print(f"{name:<28} экономия ASGI-стека: {saved:.1f} мкс на запрос\n")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарк промежуточных слоев API")
+    parser.add_argument("--requests", type=int, default=5000, help="Количество запросов на замер")
+    args = parser.parse_args()
+    asyncio.run(run(args.requests))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,354 @@
+"""
+Бенчмарки сервисов и слоя данных.
+
+Каждый сценарий выполняется на наборах данных нескольких размеров
+(`benchmarks.dataset`) в SQLite (по умолчанию, временный файл) или в
+PostgreSQL (`--dsn`, нужна отдельная база: таблицы пересоздаются).
+Результаты сохраняются в JSON, команда `compare` сравнивает два запуска
+по медиане и отмечает регрессии.
+
+Сценарии:
+- posts.get_posts[...] - `PostDataManager.get_posts` без фильтров и с
+  каждым фильтром (поиск, статус, теги, автор);
+- posts.get_paginated[offset=...] - страница в середине и в конце списка;
+- tags.add_tags - существующие и новые теги;
+- users.login_telegram_user - вход существующего пользователя (upsert);
+- users.get_current_user - проверка токена;
+- menu.get, menu.compile - меню из кэша и сборка всех меню локали
+  (не зависят от размера данных и выполняются один раз).
+
+Объединение чтений (`post_reads`) на время замеров отключается, чтобы
+каждый вызов выполнял запрос.
+
+Запуск:
+    python -m benchmarks.suite run [--sizes 1000,10000] [--repeat 30] [--dsn URL] [--output results.json]
+    python -m benchmarks.suite compare base.json new.json [--threshold 0.2]
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from itertools import count
+from typing import Any, Awaitable, Callable, Dict, List, Tuple
+import sqlalchemy
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+from benchmarks.dataset import SEARCH_WORD, Dataset, seed
+from bot.keyboards.menu import MenuManager
+from bot.locales.localization import setup_localization
+from shared.schemas.base import PaginationParams
+from shared.schemas.posts import PostStatus
+from shared.services.posts import PostDataManager, post_reads
+from shared.services.tags import TagDataManager
+from shared.services.users import AuthService, get_current_user
+
+PAGE = 20
+
+
+@dataclass(frozen=True)
+class Case:
+    """
+    Сценарий бенчмарка.
+
+    Args:
+        name (str): Имя сценария в результатах.
+        call (Callable): Вызов `call(session, dataset)`; для сценариев без
+            базы данных аргументы равны None.
+        sized (bool): Зависит от размера данных (выполняется для каждого размера).
+    """
+    name: str
+    call: Callable[[AsyncSession | None, Dataset | None], Awaitable[Any]]
+    sized: bool = True
+
+
+def posts_case(name: str, **filters: Any) -> Case:
+    """
+    Сценарий первой страницы `get_posts` с фильтрами.
+
+    Args:
+        name (str): Имя фильтра.
+        **filters (Any): Фильтры `get_posts`.
+
+    Returns:
+        Case: Сценарий.
+    """
+    async def call(session: AsyncSession, dataset: Dataset) -> Any:
+        return await PostDataManager(session).get_posts(PaginationParams(limit=PAGE), **filters)
+    return Case(f"posts.get_posts[{name}]", call)
+
+
+def offset_case(name: str, position: float) -> Case:
+    """
+    Сценарий страницы `get_posts` (`get_paginated`) с большим смещением.
+
+    Args:
+        name (str): Имя смещения.
+        position (float): Доля списка перед страницей (0.5 - середина).
+
+    Returns:
+        Case: Сценарий.
+    """
+    async def call(session: AsyncSession, dataset: Dataset) -> Any:
+        skip = max(0, int(dataset.size * position) - PAGE)
+        return await PostDataManager(session).get_posts(PaginationParams(skip=skip, limit=PAGE))
+    return Case(f"posts.get_paginated[offset={name}]", call)
+
+
+new_tags = count()
+
+async def add_tags(session: AsyncSession, dataset: Dataset) -> Any:
+    """
+    Добавляет три существующих тега и два новых, как при создании поста.
+    """
+    names = [*dataset.tags[:3], f"новый{next(new_tags)}", f"новый{next(new_tags)}"]
+    return await TagDataManager(session).add_tags(names)
+
+async def login_telegram_user(session: AsyncSession, dataset: Dataset) -> Any:
+    """
+    Выполняет вход существующего пользователя Telegram.
+    """
+    return await AuthService(session).login_telegram_user(100001, "user1")
+
+token: Dict[str, str] = {}
+
+async def current_user(session: AsyncSession, dataset: Dataset) -> Any:
+    """
+    Проверяет токен пользователя (токен выдается один раз на набор данных).
+    """
+    if "value" not in token:
+        token["value"] = (await AuthService(session).login_telegram_user(100001, "user1")).access_token
+    return await get_current_user(token["value"])
+
+localization = setup_localization().get("ru")
+menus = MenuManager(reload_interval=0)
+menus.compile(localization)
+
+async def menu_get(session: None, dataset: None) -> Any:
+    """
+    Получает все меню из кэша.
+    """
+    return [menus.get(menu_id, localization) for menu_id in menus.menu]
+
+async def menu_compile(session: None, dataset: None) -> Any:
+    """
+    Собирает все меню локали заново.
+    """
+    return menus.compile(localization)
+
+
+CASES: List[Case] = [
+    posts_case("all"),
+    posts_case("search", search=SEARCH_WORD),
+    posts_case("status", status=PostStatus.PUBLISHED),
+    posts_case("tags", tags=["тег1", "тег2"]),
+    posts_case("user_id", user_id=1),
+    offset_case("50%", 0.5),
+    offset_case("end", 1.0),
+    Case("tags.add_tags", add_tags),
+    Case("users.login_telegram_user", login_telegram_user),
+    Case("users.get_current_user", current_user),
+    Case("menu.get", menu_get, sized=False),
+    Case("menu.compile", menu_compile, sized=False),
+]
+
+
+async def measure(case: Case, session: AsyncSession | None, dataset: Dataset | None, repeat: int) -> Dict[str, Any]:
+    """
+    Выполняет сценарий и считает статистику времени вызова.
+
+    Args:
+        case (Case): Сценарий.
+        session (AsyncSession | None): Сессия базы данных.
+        dataset (Dataset | None): Набор данных.
+        repeat (int): Количество замеров.
+
+    Returns:
+        Dict[str, Any]: Результат сценария (время в микросекундах).
+    """
+    for _ in range(min(3, repeat)):
+        await case.call(session, dataset)
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await case.call(session, dataset)
+        timings.append((time.perf_counter() - started) * 1e6)
+    timings.sort()
+    return {
+        "name": case.name,
+        "size": dataset.size if case.sized else None,
+        "repeat": repeat,
+        "min_us": round(timings[0], 1),
+        "median_us": round(statistics.median(timings), 1),
+        "mean_us": round(statistics.fmean(timings), 1),
+        "p95_us": round(timings[min(len(timings) - 1, int(len(timings) * 0.95))], 1),
+    }
+
+
+async def run(dsn: str | None, sizes: List[int], repeat: int, selected: List[str]) -> Dict[str, Any]:
+    """
+    Выполняет сценарии для всех размеров данных.
+
+    Args:
+        dsn (str | None): Адрес базы данных, None - временный файл SQLite.
+        sizes (List[int]): Размеры наборов данных (количество постов).
+        repeat (int): Количество замеров сценария.
+        selected (List[str]): Подстроки имен сценариев, пустой - все.
+
+    Returns:
+        Dict[str, Any]: Описание запуска и результаты.
+    """
+    cases = [case for case in CASES if not selected or any(part in case.name for part in selected)]
+    post_reads.enabled = False
+    results = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_async_engine(dsn or f"sqlite+aiosqlite:///{directory}/benchmark.db")
+        session_factory = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+        try:
+            for case in cases:
+                if not case.sized:
+                    results.append(await measure(case, None, None, repeat))
+                    print(_format(results[-1]))
+
+            for size in sizes:
+                dataset = await seed(engine, size)
+                token.clear()
+                for case in cases:
+                    if case.sized:
+                        async with session_factory() as session:
+                            results.append(await measure(case, session, dataset, repeat))
+                        print(_format(results[-1]))
+            dialect = engine.dialect.name
+        finally:
+            await engine.dispose()
+
+    return {
+        "meta": {
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "dialect": dialect,
+            "python": platform.python_version(),
+            "sqlalchemy": sqlalchemy.__version__,
+            "platform": platform.platform(),
+            "sizes": sizes,
+            "repeat": repeat,
+        },
+        "results": results,
+    }
+
+
+def compare(base: Dict[str, Any], new: Dict[str, Any], threshold: float) -> List[Tuple[str, Any, float, float, float, str]]:
+    """
+    Сравнивает медианы двух запусков.
+
+    Args:
+        base (Dict[str, Any]): Результаты базового запуска.
+        new (Dict[str, Any]): Результаты нового запуска.
+        threshold (float): Допустимое относительное изменение (0.2 - 20%).
+
+    Returns:
+        List[Tuple[str, Any, float, float, float, str]]: Имя, размер, медианы
+            базового и нового запуска, отношение и оценка
+            ("regression", "improvement", "ok").
+    """
+    base_results = {(item["name"], item["size"]): item for item in base["results"]}
+    rows = []
+    for item in new["results"]:
+        previous = base_results.get((item["name"], item["size"]))
+        if previous is None:
+            continue
+        ratio = item["median_us"] / previous["median_us"] if previous["median_us"] else 1.0
+        if ratio > 1 + threshold:
+            verdict = "regression"
+        elif ratio < 1 - threshold:
+            verdict = "improvement"
+        else:
+            verdict = "ok"
+        rows.append((item["name"], item["size"], previous["median_us"], item["median_us"], ratio, verdict))
+    return rows
+
+
+def _format(result: Dict[str, Any]) -> str:
+    """
+    Форматирует результат сценария для вывода.
+
+    Args:
+        result (Dict[str, Any]): Результат сценария.
+
+    Returns:
+        str: Строка таблицы.
+    """
+    size = "-" if result["size"] is None else result["size"]
+    return (
+        f"{result['name']:<36} {size:>8} "
+        f"медиана {result['median_us']:>10.1f} мкс, p95 {result['p95_us']:>10.1f} мкс"
+    )
+
+
+def _git_commit() -> str | None:
+    """
+    Возвращает текущий коммит репозитория, если он доступен.
+
+    Returns:
+        str | None: Хэш коммита.
+    """
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True, cwd=os.path.dirname(__file__)
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Бенчмарки сервисов и слоя данных")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="Выполнить бенчмарки")
+    run_parser.add_argument("--dsn", help="Адрес отдельной базы данных (таблицы пересоздаются), по умолчанию SQLite")
+    run_parser.add_argument("--sizes", default="1000,10000", help="Размеры наборов данных через запятую")
+    run_parser.add_argument("--repeat", type=int, default=30, help="Количество замеров сценария")
+    run_parser.add_argument("--only", action="append", default=[], help="Выполнить сценарии, имя которых содержит строку")
+    run_parser.add_argument("--output", help="Файл результатов JSON")
+
+    compare_parser = commands.add_parser("compare", help="Сравнить два запуска")
+    compare_parser.add_argument("base", help="Результаты базового запуска")
+    compare_parser.add_argument("new", help="Результаты нового запуска")
+    compare_parser.add_argument("--threshold", type=float, default=0.2, help="Допустимое замедление медианы (0.2 - 20%%)")
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        sizes = [int(size) for size in args.sizes.split(",")]
+        report = asyncio.run(run(args.dsn, sizes, args.repeat, args.only))
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as file:
+                json.dump(report, file, ensure_ascii=False, indent=2)
+            print(f"Результаты сохранены в {args.output}")
+        return
+
+    with open(args.base, encoding="utf-8") as file:
+        base = json.load(file)
+    with open(args.new, encoding="utf-8") as file:
+        new = json.load(file)
+    rows = compare(base, new, args.threshold)
+    for name, size, before, after, ratio, verdict in rows:
+        size = "-" if size is None else size
+        mark = {"regression": "РЕГРЕССИЯ", "improvement": "ускорение", "ok": ""}[verdict]
+        print(f"{name:<36} {size:>8} {before:>10.1f} -> {after:>10.1f} мкс  x{ratio:5.2f}  {mark}")
+    regressions = sum(1 for row in rows if row[5] == "regression")
+    print(f"Сценариев: {len(rows)}, регрессий: {regressions} (порог {args.threshold:.0%})")
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
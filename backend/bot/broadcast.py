@@ -0,0 +1,93 @@
+"""
+Модуль командной строки для рассылок.
+
+Команды:
+- poetry run broadcast create "<текст>" - Создать рассылку
+- poetry run broadcast start <id> - Запустить рассылку и выполнять ее в этом процессе
+  (прерванная по Ctrl+C рассылка продолжается этой же командой)
+- poetry run broadcast pause <id> - Приостановить рассылку (в том числе в другом процессе)
+- poetry run broadcast status <id> - Показать прогресс рассылки
+- poetry run broadcast list - Показать все рассылки
+
+Functions:
+- main: Точка входа скрипта `broadcast`.
+"""
+import argparse
+import asyncio
+import logging
+from fastapi import HTTPException
+from shared.database.session import async_session
+from shared.schemas.broadcasts import BroadcastSchema, BroadcastStatus, CreateBroadcastSchema
+from shared.services.broadcasts import BroadcastService
+from bot.core.instance import bot, broadcaster
+
+def _print(broadcast: BroadcastSchema) -> None:
+    """
+    Выводит состояние рассылки.
+
+    Args:
+        broadcast: Рассылка.
+    """
+    print(
+        f"#{broadcast.id} {broadcast.status.value}: "
+        f"доставлено {broadcast.sent}, заблокировали {broadcast.blocked}, "
+        f"ошибок {broadcast.failed}, курсор {broadcast.cursor}"
+    )
+
+async def _run(args: argparse.Namespace) -> None:
+    """
+    Выполняет команду.
+
+    Args:
+        args: Аргументы командной строки.
+    """
+    try:
+        async with async_session() as session:
+            service = BroadcastService(session)
+            if args.command == "create":
+                _print(await service.create_broadcast(CreateBroadcastSchema(text=args.text)))
+            elif args.command == "list":
+                for broadcast in await service.get_broadcasts():
+                    _print(broadcast)
+            elif args.command == "status":
+                _print(await service.get_broadcast(args.id))
+            elif args.command == "pause":
+                _print(await service.pause_broadcast(args.id))
+            elif args.command == "start":
+                broadcast = await service.get_broadcast(args.id)
+                if broadcast.status != BroadcastStatus.RUNNING:
+                    broadcast = await service.start_broadcast(args.id)
+                _print(broadcast)
+
+        if args.command == "start":
+            broadcast = await broadcaster.run(args.id)
+            if broadcast and broadcast.status == BroadcastStatus.RUNNING:
+                logging.info("Рассылка %d выполняется другим процессом", args.id)
+            if broadcast:
+                _print(broadcast)
+    except HTTPException as e:
+        logging.error(e.detail)
+    finally:
+        await bot.session.close()
+
+def main():
+    """
+    Точка входа скрипта `broadcast`.
+    """
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    parser = argparse.ArgumentParser(prog="broadcast", description="Управление рассылками")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("create", help="Создать рассылку").add_argument("text")
+    for command, help_text in (
+        ("start", "Запустить или продолжить рассылку"),
+        ("pause", "Приостановить рассылку"),
+        ("status", "Показать прогресс рассылки")
+    ):
+        commands.add_parser(command, help=help_text).add_argument("id", type=int)
+    commands.add_parser("list", help="Показать все рассылки")
+
+    try:
+        asyncio.run(_run(parser.parse_args()))
+    except KeyboardInterrupt:
+        logging.info("Рассылка прервана, продолжить: broadcast start <id>")
@@ -1,31 +1,27 @@
 """
 Модуль для установки команд бота с использованием библиотеки aiogram.
 
-Этот модуль содержит функцию `set_bot_commands`, которая создает и устанавливает
-команды для бота, используя локализацию для описаний команд.
+Этот модуль содержит функцию `get_bot_commands`, которая создает команды
+для бота, используя локализацию для описаний команд.
 
 Functions:
-- set_bot_commands: Устанавливает команды для бота с их описаниями.
+- get_bot_commands: Возвращает команды бота с их описаниями.
 """
-from aiogram import Bot
-from aiogram.types import BotCommand, BotCommandScopeDefault
+from typing import List
+from aiogram.types import BotCommand
 from fluent.runtime import FluentLocalization
 
-async def set_bot_commands(bot: Bot, l10n: FluentLocalization):
+def get_bot_commands(l10n: FluentLocalization) -> List[BotCommand]:
     """
-    Устанавливает команды для бота.
+    Возвращает команды бота с локализованными описаниями.
 
-    Эта функция создает список команд с их описаниями, используя локализацию,
-    и устанавливает их для бота.
-
-    :param bot: Экземпляр бота, для которого устанавливаются команды.
     :param l10n: Объект локализации для получения описаний команд.
-    
+
     Returns:
-        None
+        List[BotCommand]: Команды бота.
     """
-    commands = [
+    return [
         BotCommand(command="start", description=l10n.format_value("start-description")),
-        BotCommand(command="help", description=l10n.format_value("help-description"))
-    ]   
-    await bot.set_my_commands(commands, scope=BotCommandScopeDefault())
+        BotCommand(command="help", description=l10n.format_value("help-description")),
+        BotCommand(command="moderate", description=l10n.format_value("moderate-description"))
+    ]
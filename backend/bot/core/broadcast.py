@@ -0,0 +1,313 @@
+"""
+Модуль движка рассылок.
+
+Этот модуль определяет класс `Broadcaster`, который отправляет рассылку
+всем пользователям бота:
+- получатели читаются порциями по ключу (`users.id > курсор`);
+- порция отправляется параллельно, но не более `concurrency` запросов
+  одновременно, с приоритетом BULK: лимиты Telegram соблюдает
+  `ThrottlingRequestMiddleware`, а ответы пользователям идут вперед рассылки;
+- после каждой порции результаты доставки и курсор сохраняются одной
+  транзакцией, поэтому после сбоя рассылка продолжается с места остановки;
+  при штатной остановке сохраняются и результаты незавершенной порции;
+- пользователи, заблокировавшие бота, помечаются и в следующие рассылки
+  не попадают.
+
+Статус рассылки перечитывается перед каждой порцией, поэтому пауза через
+API или CLI действует на рассылку, запущенную в любом процессе.
+
+Рассылку отправляет только процесс, взявший ее в аренду (`owner`,
+`lease_until`): аренда продлевается, пока идет отправка, и освобождается
+при остановке. Поэтому рассылка, запущенная командой `broadcast start`,
+не подхватывается ведущим процессом API, а после падения процесса
+продолжается другим, когда аренда истечет.
+
+Классы:
+- Broadcaster: Исполнитель рассылок.
+"""
+import asyncio
+import logging
+import os
+import socket
+from typing import Any, Callable, Dict, List, Set
+from aiogram import Bot
+from aiogram.exceptions import TelegramAPIError, TelegramForbiddenError
+from sqlalchemy.ext.asyncio import AsyncSession
+from shared.database.session import async_session
+from shared.schemas.broadcasts import BroadcastSchema, BroadcastStatus, DeliveryStatus
+from shared.services.broadcasts import BroadcastDataManager
+from bot.core.sender import SendPriority, send_priority
+
+
+class Broadcaster:
+    """
+    Исполнитель рассылок.
+
+    Args:
+        bot (Bot): Экземпляр бота.
+        session_factory (Callable[[], AsyncSession]): Фабрика сессий базы данных.
+        chunk_size (int): Количество получателей в одной порции.
+        concurrency (int): Максимальное количество одновременных отправок.
+        lease_seconds (float): Срок аренды рассылки процессом, секунды.
+    """
+    def __init__(
+        self,
+        bot: Bot,
+        session_factory: Callable[[], AsyncSession] = async_session,
+        chunk_size: int = 100,
+        concurrency: int = 20,
+        lease_seconds: float = 60.0
+    ):
+        """
+        Инициализирует исполнитель рассылок.
+
+        Args:
+            bot (Bot): Экземпляр бота.
+            session_factory (Callable[[], AsyncSession]): Фабрика сессий базы данных.
+            chunk_size (int): Количество получателей в одной порции.
+            concurrency (int): Максимальное количество одновременных отправок.
+            lease_seconds (float): Срок аренды рассылки процессом, секунды.
+        """
+        self.bot = bot
+        self.session_factory = session_factory
+        self.chunk_size = chunk_size
+        self.lease_seconds = lease_seconds
+        self.owner = f"{socket.gethostname()}:{os.getpid()}"
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self._tasks: Dict[int, asyncio.Task] = {}
+
+    @property
+    def running(self) -> Set[int]:
+        """
+        Идентификаторы рассылок, выполняющихся в этом процессе.
+        """
+        return set(self._tasks)
+
+    def start(self, broadcast_id: int) -> bool:
+        """
+        Запускает выполнение рассылки в фоне.
+
+        Рассылка должна быть в статусе RUNNING (см. `BroadcastService`).
+
+        Args:
+            broadcast_id (int): ID рассылки.
+
+        Returns:
+            bool: False, если рассылка уже выполняется в этом процессе.
+        """
+        if broadcast_id in self._tasks:
+            return False
+        task = asyncio.create_task(self.run(broadcast_id))
+        self._tasks[broadcast_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(broadcast_id, None))
+        return True
+
+    async def resume_all(self) -> None:
+        """
+        Продолжает рассылки, прерванные остановкой процесса.
+
+        Рассылки, аренду которых держит другой процесс, пропускаются.
+        """
+        async with self.session_factory() as session:
+            broadcasts = await BroadcastDataManager(session).get_unleased()
+        for broadcast in broadcasts:
+            if self.start(broadcast.id):
+                logging.info("Рассылка %d продолжена с пользователя %d", broadcast.id, broadcast.cursor)
+
+    async def stop(self) -> None:
+        """
+        Останавливает рассылки этого процесса.
+
+        Статус RUNNING сохраняется, и при следующем запуске рассылки
+        продолжатся после последней сохраненной порции.
+        """
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def run(self, broadcast_id: int) -> BroadcastSchema | None:
+        """
+        Выполняет рассылку, пока она не завершится или не будет приостановлена.
+
+        Если рассылку выполняет другой процесс (аренда не истекла), сразу
+        возвращает ее текущее состояние.
+
+        Args:
+            broadcast_id (int): ID рассылки.
+
+        Returns:
+            BroadcastSchema | None: Состояние рассылки после остановки.
+        """
+        if not await self._acquire(broadcast_id):
+            logging.debug("Рассылка %d выполняется другим процессом", broadcast_id)
+            async with self.session_factory() as session:
+                return await BroadcastDataManager(session).get_broadcast(broadcast_id)
+
+        heartbeat = asyncio.create_task(self._heartbeat(broadcast_id))
+        try:
+            return await self._send(broadcast_id, heartbeat)
+        finally:
+            heartbeat.cancel()
+            await self._shielded(self._release(broadcast_id))
+
+    async def _send(self, broadcast_id: int, heartbeat: asyncio.Task) -> BroadcastSchema | None:
+        """
+        Отправляет рассылку порциями, пока процесс владеет арендой.
+
+        Args:
+            broadcast_id (int): ID рассылки.
+            heartbeat (asyncio.Task): Задача продления аренды; завершается,
+                если аренда потеряна.
+
+        Returns:
+            BroadcastSchema | None: Состояние рассылки после остановки.
+        """
+        while True:
+            async with self.session_factory() as session:
+                data_manager = BroadcastDataManager(session)
+                broadcast = await data_manager.get_broadcast(broadcast_id)
+                if broadcast is None or broadcast.status != BroadcastStatus.RUNNING:
+                    return broadcast
+                if heartbeat.done():
+                    logging.warning("Аренда рассылки %d потеряна, отправка остановлена", broadcast_id)
+                    return broadcast
+                recipients = await data_manager.get_recipients(
+                    broadcast_id,
+                    broadcast.cursor,
+                    self.chunk_size
+                )
+                if not recipients:
+                    logging.info(
+                        "Рассылка %d завершена: доставлено %d, заблокировали %d, ошибок %d",
+                        broadcast_id,
+                        broadcast.sent,
+                        broadcast.blocked,
+                        broadcast.failed
+                    )
+                    return await data_manager.set_status(
+                        broadcast_id,
+                        BroadcastStatus.COMPLETED,
+                        [BroadcastStatus.RUNNING]
+                    )
+
+            # Сессия не держится открытой, пока идет отправка порции
+            tasks = [
+                asyncio.create_task(self._deliver(user_id, chat_id, broadcast.text))
+                for user_id, chat_id in recipients
+            ]
+            try:
+                deliveries = await asyncio.gather(*tasks)
+            except asyncio.CancelledError:
+                # При остановке сохраняем уже доставленное, не сдвигая курсор:
+                # при продолжении эти получатели будут пропущены
+                for task in tasks:
+                    task.cancel()
+                done = [task.result() for task in tasks if task.done() and not task.cancelled()]
+                await self._save(broadcast_id, broadcast.cursor, done)
+                raise
+
+            await self._save(broadcast_id, recipients[-1][0], deliveries)
+
+    async def _acquire(self, broadcast_id: int) -> bool:
+        """
+        Берет или продлевает аренду рассылки.
+
+        Args:
+            broadcast_id (int): ID рассылки.
+
+        Returns:
+            bool: True, если аренда принадлежит этому процессу.
+        """
+        async with self.session_factory() as session:
+            return await BroadcastDataManager(session).acquire_lease(
+                broadcast_id,
+                self.owner,
+                self.lease_seconds
+            )
+
+    async def _release(self, broadcast_id: int) -> None:
+        """
+        Освобождает аренду рассылки.
+
+        Args:
+            broadcast_id (int): ID рассылки.
+        """
+        async with self.session_factory() as session:
+            await BroadcastDataManager(session).release_lease(broadcast_id, self.owner)
+
+    async def _heartbeat(self, broadcast_id: int) -> None:
+        """
+        Продлевает аренду, пока идет отправка; завершается, если аренду
+        продлить не удалось (рассылка остановлена или ее взял другой процесс).
+
+        Args:
+            broadcast_id (int): ID рассылки.
+        """
+        while True:
+            await asyncio.sleep(self.lease_seconds / 3)
+            try:
+                if not await self._acquire(broadcast_id):
+                    return
+            except Exception as e:
+                logging.error("Ошибка продления аренды рассылки %d: %s", broadcast_id, e)
+
+    @staticmethod
+    async def _shielded(coroutine: Any) -> None:
+        """
+        Выполняет сохранение, не прерывая его отменой задачи.
+
+        Args:
+            coroutine (Any): Корутина сохранения.
+        """
+        task = asyncio.ensure_future(coroutine)
+        try:
+            await asyncio.shield(task)
+        except asyncio.CancelledError:
+            await task
+            raise
+
+    async def _save(self, broadcast_id: int, cursor: int, deliveries: List[Dict[str, Any]]) -> None:
+        """
+        Сохраняет результаты доставки порции и курсор рассылки.
+
+        Сохранение не прерывается отменой задачи: иначе уже отправленная
+        порция была бы отправлена повторно после перезапуска.
+
+        Args:
+            broadcast_id (int): ID рассылки.
+            cursor (int): ID последнего обработанного пользователя.
+            deliveries (List[Dict[str, Any]]): Результаты доставки.
+        """
+        async def save() -> None:
+            async with self.session_factory() as session:
+                await BroadcastDataManager(session).save_progress(
+                    broadcast_id,
+                    cursor=cursor,
+                    deliveries=deliveries
+                )
+
+        await self._shielded(save())
+
+    async def _deliver(self, user_id: int, chat_id: int, text: str) -> Dict[str, Any]:
+        """
+        Отправляет сообщение рассылки одному пользователю.
+
+        Args:
+            user_id (int): ID пользователя.
+            chat_id (int): ID чата пользователя.
+            text (str): Текст сообщения.
+
+        Returns:
+            Dict[str, Any]: Результат доставки (`user_id`, `status`, `error`).
+        """
+        async with self._semaphore:
+            with send_priority(SendPriority.BULK):
+                try:
+                    await self.bot.send_message(chat_id=chat_id, text=text)
+                    return {"user_id": user_id, "status": DeliveryStatus.SENT, "error": None}
+                except TelegramForbiddenError:
+                    return {"user_id": user_id, "status": DeliveryStatus.BLOCKED, "error": None}
+                except TelegramAPIError as e:
+                    logging.warning("Ошибка рассылки пользователю %d: %s", user_id, e)
+                    return {"user_id": user_id, "status": DeliveryStatus.FAILED, "error": str(e)[:255]}
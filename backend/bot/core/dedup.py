@@ -0,0 +1,267 @@
+"""
+Модуль дедупликации обновлений Telegram по update_id.
+
+Telegram повторно доставляет обновление, если ответ на вебхук задержался.
+Класс `UpdateDeduplicator` помнит последние `window` идентификаторов
+обновлений в компактном кольцевом битовом окне (window / 8 байт), поэтому
+повторная доставка стоит одной проверки бита вместо полного прогона
+обработчиков с запросами к базе данных.
+
+Окно можно сохранять в файл, чтобы оно переживало перезапуск процесса.
+Это позволяет не сбрасывать накопившиеся обновления
+(`drop_pending_updates`) при деплое.
+
+Окно проверяется в памяти процесса. При нескольких воркерах API они
+сохраняют окно в один файл: перед записью окно объединяется с файлом под
+блокировкой, поэтому воркеры не затирают идентификаторы друг друга, а
+после перезапуска каждый воркер загружает объединенное окно.
+
+Классы:
+- UpdateDeduplicator: Кольцевое битовое окно последних update_id.
+"""
+import asyncio
+import logging
+import os
+import struct
+from pathlib import Path
+from typing import Tuple
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+# Заголовок файла состояния: максимальный update_id и размер окна
+_HEADER = struct.Struct("<qI")
+
+
+class UpdateDeduplicator:
+    """
+    Кольцевое битовое окно последних идентификаторов обновлений.
+
+    Окно покрывает идентификаторы в диапазоне (max_id - window, max_id].
+    Обновление с идентификатором ниже окна считается новым и не
+    запоминается. Если идентификатор ниже окна более чем на размер окна,
+    окно сбрасывается: так бывает, когда Telegram после долгого простоя
+    выбирает следующий update_id случайно.
+
+    Args:
+        window (int): Количество запоминаемых идентификаторов (кратно 8).
+        path (str | None): Путь к файлу состояния. None - без сохранения.
+    """
+    def __init__(self, window: int = 4096, path: str | None = None):
+        """
+        Инициализирует окно дедупликации.
+
+        Args:
+            window (int): Количество запоминаемых идентификаторов.
+            path (str | None): Путь к файлу состояния.
+        """
+        self.window = (window + 7) // 8 * 8
+        self.path = Path(path) if path else None
+        self.duplicates = 0
+        self._bits = bytearray(self.window // 8)
+        self._max_id: int | None = None
+        self._dirty = False
+        self._flush_task: asyncio.Task | None = None
+
+    def __contains__(self, update_id: int) -> bool:
+        """
+        Проверяет, встречалось ли обновление с таким идентификатором.
+
+        Args:
+            update_id (int): Идентификатор обновления.
+
+        Returns:
+            bool: True, если обновление уже было принято.
+        """
+        if self._max_id is None or update_id > self._max_id:
+            return False
+        if update_id <= self._max_id - self.window:
+            return False
+        position = update_id % self.window
+        return bool(self._bits[position >> 3] & (1 << (position & 7)))
+
+    def check(self, update_id: int) -> bool:
+        """
+        Проверяет обновление на повтор и учитывает его в счетчике дубликатов.
+
+        Args:
+            update_id (int): Идентификатор обновления.
+
+        Returns:
+            bool: True, если это повторная доставка.
+        """
+        if update_id in self:
+            self.duplicates += 1
+            return True
+        return False
+
+    def add(self, update_id: int) -> None:
+        """
+        Запоминает идентификатор принятого обновления.
+
+        Args:
+            update_id (int): Идентификатор обновления.
+        """
+        if self._max_id is None or update_id <= self._max_id - 2 * self.window:
+            self._bits = bytearray(self.window // 8)
+            self._max_id = update_id
+        elif update_id <= self._max_id - self.window:
+            return
+        elif update_id > self._max_id:
+            shift = update_id - self._max_id
+            if shift >= self.window:
+                self._bits = bytearray(self.window // 8)
+            else:
+                # Освобождаем позиции, которые занимали вытесненные из окна id
+                for stale_id in range(self._max_id + 1, update_id + 1):
+                    position = stale_id % self.window
+                    self._bits[position >> 3] &= ~(1 << (position & 7)) & 0xFF
+            self._max_id = update_id
+
+        position = update_id % self.window
+        self._bits[position >> 3] |= 1 << (position & 7)
+        self._dirty = True
+
+    async def load(self) -> None:
+        """
+        Загружает состояние окна из файла, если он существует.
+
+        Файл читается в отдельном потоке, чтобы не блокировать цикл
+        событий. Файл с другим размером окна или поврежденный файл
+        игнорируется.
+        """
+        if not self.path:
+            return
+        state = await asyncio.to_thread(self._read)
+        if state is None:
+            return
+        self._merge(*state)
+        self._dirty = False
+        logging.info("Окно дедупликации загружено, последний update_id %d", state[0])
+
+    async def save(self) -> None:
+        """
+        Атомарно сохраняет состояние окна в файл, если оно изменилось.
+
+        Окно предварительно объединяется с файлом, сохраненным другими
+        процессами; чтение и запись выполняются под блокировкой файла в
+        отдельном потоке, поэтому ожидание блокировки не останавливает
+        обработку обновлений. Поток работает со снимком окна, а
+        идентификаторы других процессов добавляются в окно после записи.
+        """
+        if not self.path or not self._dirty or self._max_id is None:
+            return
+        self._dirty = False
+        merged = await asyncio.to_thread(self._write, self._max_id, bytes(self._bits))
+        # Идентификаторы из файла уже сохранены: окно не становится измененным
+        dirty = self._dirty
+        if merged is None:
+            dirty = True
+        else:
+            self._merge(*merged)
+        self._dirty = dirty
+
+    def _write(self, max_id: int, bits: bytes) -> Tuple[int, bytes] | None:
+        """
+        Объединяет снимок окна с файлом и записывает результат
+        (выполняется в отдельном потоке).
+
+        Args:
+            max_id (int): Максимальный update_id снимка.
+            bits (bytes): Биты снимка.
+
+        Returns:
+            Tuple[int, bytes] | None: Записанное окно; None при ошибке.
+        """
+        snapshot = UpdateDeduplicator(self.window)
+        snapshot._merge(max_id, bits)
+        lock_path = self.path.with_suffix(f"{self.path.suffix}.lock")
+        temp_path = self.path.with_suffix(f"{self.path.suffix}.{os.getpid()}.tmp")
+        try:
+            with open(lock_path, "a+b") as lock:
+                if fcntl is not None:
+                    fcntl.flock(lock.fileno(), fcntl.LOCK_EX)
+                state = self._read()
+                if state is not None:
+                    snapshot._merge(*state)
+                temp_path.write_bytes(_HEADER.pack(snapshot._max_id, self.window) + bytes(snapshot._bits))
+                os.replace(temp_path, self.path)
+        except OSError as e:
+            logging.error("Ошибка сохранения окна дедупликации: %s", e)
+            return None
+        return snapshot._max_id, bytes(snapshot._bits)
+
+    def _read(self) -> Tuple[int, bytes] | None:
+        """
+        Читает состояние окна из файла.
+
+        Returns:
+            Tuple[int, bytes] | None: Максимальный update_id и биты окна;
+                None, если файла нет или он не подходит.
+        """
+        if not self.path.exists():
+            return None
+        try:
+            raw = self.path.read_bytes()
+            max_id, window = _HEADER.unpack_from(raw)
+        except (OSError, struct.error) as e:
+            logging.error("Ошибка загрузки окна дедупликации: %s", e)
+            return None
+        bits = raw[_HEADER.size:]
+        if window != self.window or len(bits) != self.window // 8:
+            logging.warning("Файл окна дедупликации не совпадает по размеру, пропущен")
+            return None
+        return max_id, bits
+
+    def _merge(self, max_id: int, bits: bytes) -> None:
+        """
+        Добавляет в окно идентификаторы из другого окна того же размера.
+
+        Args:
+            max_id (int): Максимальный update_id другого окна.
+            bits (bytes): Биты другого окна.
+        """
+        start = max_id - self.window + 1
+        if self._max_id is not None:
+            # Идентификаторы ниже текущего окна не нужны (а слишком старые
+            # сбросили бы окно)
+            start = max(start, self._max_id - self.window + 1)
+        for update_id in range(start, max_id + 1):
+            position = update_id % self.window
+            if bits[position >> 3] & (1 << (position & 7)):
+                self.add(update_id)
+
+    async def start(self, interval: float = 5.0) -> None:
+        """
+        Загружает окно и запускает периодическое сохранение.
+
+        Args:
+            interval (float): Интервал сохранения в секундах.
+        """
+        if not self.path or self._flush_task:
+            return
+        await self.load()
+        self._flush_task = asyncio.create_task(self._flush_loop(interval))
+
+    async def stop(self) -> None:
+        """
+        Останавливает периодическое сохранение и сохраняет окно.
+        """
+        if self._flush_task:
+            self._flush_task.cancel()
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+        await self.save()
+
+    async def _flush_loop(self, interval: float) -> None:
+        """
+        Периодически сохраняет окно в файл.
+
+        Args:
+            interval (float): Интервал сохранения в секундах.
+        """
+        while True:
+            await asyncio.sleep(interval)
+            await self.save()
@@ -0,0 +1,168 @@
+"""
+Модуль общей очереди входящих обновлений для нескольких воркеров API.
+
+При нескольких воркерах вебхук Telegram принимает любой из них, а
+очереди чатов, окно дедупликации, лимит отправки и кэш FSM живут в
+памяти процесса. Чтобы эти гарантии сохранялись, воркер не обрабатывает
+обновление сам: он сохраняет его в таблицу `botupdates` и будит ведущий
+процесс сигналом `bot.updates` через брокер ленты (`shared.feed`).
+
+Ведущий процесс забирает обновления в порядке update_id и кладет их в
+свою очередь `update_queue`. Таким образом:
+- обработчики выполняются в одном процессе, поэтому порядок внутри чата,
+  лимит 30 сообщений/с и кэш FSM работают как при одном воркере;
+- уникальный update_id в таблице отсекает повторные доставки, принятые
+  разными воркерами;
+- если сигнал потерян (брокер недоступен), обновления подхватываются
+  периодическим опросом таблицы.
+
+Обновление отмечается обработанным в момент передачи в очередь ведущего,
+как и при одном воркере, где вебхук подтверждает обновление после
+постановки в очередь. Обработанные записи хранятся
+`settings.update_inbox_retention` секунд для дедупликации и затем удаляются.
+
+Классы:
+- UpdateInbox: Общая очередь входящих обновлений в базе данных.
+"""
+import asyncio
+import logging
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List
+from aiogram import Bot
+from aiogram.types import Update
+from pydantic import ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+from shared.database.session import async_session
+from shared.feed import feed, FeedEvent, BOT_UPDATES
+from shared.services.bot_updates import BotUpdateDataManager
+from bot.core.queue import UpdateQueue
+
+
+class UpdateInbox:
+    """
+    Общая очередь входящих обновлений в базе данных.
+
+    Args:
+        bot (Bot): Экземпляр бота для валидации обновлений.
+        queue (UpdateQueue): Очередь обновлений ведущего процесса.
+        batch_size (int): Максимальное количество обновлений за одну выборку.
+        poll_interval (float): Интервал опроса таблицы без сигнала, секунды.
+        retention (float): Время хранения обработанных обновлений, секунды.
+        session_factory (Callable[[], AsyncSession]): Фабрика сессий базы данных.
+    """
+    def __init__(
+        self,
+        bot: Bot,
+        queue: UpdateQueue,
+        batch_size: int = 100,
+        poll_interval: float = 1.0,
+        retention: float = 3600.0,
+        session_factory: Callable[[], AsyncSession] = async_session
+    ):
+        """
+        Инициализирует очередь входящих обновлений.
+
+        Args:
+            bot (Bot): Экземпляр бота.
+            queue (UpdateQueue): Очередь обновлений ведущего процесса.
+            batch_size (int): Размер выборки.
+            poll_interval (float): Интервал опроса, секунды.
+            retention (float): Время хранения обработанных обновлений, секунды.
+            session_factory (Callable[[], AsyncSession]): Фабрика сессий.
+        """
+        self.bot = bot
+        self.queue = queue
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.retention = retention
+        self.session_factory = session_factory
+        self._wake = asyncio.Event()
+
+    async def add(self, update: Dict[str, Any]) -> bool:
+        """
+        Сохраняет обновление и будит ведущий процесс.
+
+        Args:
+            update (Dict[str, Any]): Обновление от Telegram (провалидированное).
+
+        Returns:
+            bool: True, если обновление новое, False для повторной доставки.
+        """
+        async with self.session_factory() as session:
+            inserted = await BotUpdateDataManager(session).add_update(update["update_id"], update)
+        if inserted:
+            feed.publish(FeedEvent(BOT_UPDATES, 0))
+        return inserted
+
+    def wake(self, _event: FeedEvent | None = None) -> None:
+        """
+        Будит цикл ведущего процесса (обработчик события `bot.updates`).
+
+        Args:
+            _event (FeedEvent | None): Событие ленты.
+        """
+        self._wake.set()
+
+    async def run(self) -> None:
+        """
+        Цикл ведущего процесса: передает сохраненные обновления в очередь.
+
+        Выполняется до отмены задачи.
+        """
+        cleaned_at = time.monotonic()
+        while True:
+            self._wake.clear()
+            try:
+                while await self.drain():
+                    pass
+                if time.monotonic() - cleaned_at >= self.retention:
+                    await self.cleanup()
+                    cleaned_at = time.monotonic()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logging.error("Ошибка чтения очереди входящих обновлений: %s", e)
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.poll_interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def drain(self) -> bool:
+        """
+        Передает одну выборку обновлений в очередь ведущего.
+
+        Returns:
+            bool: True, если выборка заполнена целиком и в таблице могут
+                остаться обновления.
+        """
+        stats = self.queue.stats()
+        limit = min(self.batch_size, stats.maxsize - stats.depth)
+        if limit <= 0:
+            return False
+
+        async with self.session_factory() as session:
+            data_manager = BotUpdateDataManager(session)
+            pending = await data_manager.get_pending(limit)
+            handled: List[int] = []
+            for row in pending:
+                try:
+                    update = Update.model_validate(row.payload, context={"bot": self.bot})
+                except ValidationError as e:
+                    logging.warning("Некорректное обновление %d в очереди: %s", row.update_id, e)
+                    handled.append(row.update_id)
+                    continue
+                if not self.queue.put(update):
+                    break
+                handled.append(row.update_id)
+            await data_manager.mark_handled(handled)
+        return len(pending) == limit and len(handled) == limit
+
+    async def cleanup(self) -> None:
+        """
+        Удаляет обработанные обновления старше `retention`.
+        """
+        async with self.session_factory() as session:
+            await BotUpdateDataManager(session).delete_handled(
+                datetime.now() - timedelta(seconds=self.retention)
+            )
@@ -1,21 +1,115 @@
+from pathlib import Path
 from aiogram import Bot, Dispatcher
 from aiogram.client.default import DefaultBotProperties
+from aiogram.client.session.aiohttp import AiohttpSession
+from aiogram.client.telegram import TelegramAPIServer
 from aiogram.enums import ParseMode
 from aiogram.fsm.storage.memory import MemoryStorage
 from settings import settings
+from bot.core.storage import DatabaseStorage
+from bot.core.queue import UpdateQueue
+from bot.core.inbox import UpdateInbox
+from bot.core.lanes import ChatLaneExecutor
+from bot.core.dedup import UpdateDeduplicator
+from bot.core.sender import ThrottlingRequestMiddleware
+from bot.core.broadcast import Broadcaster
+from bot.core.search import InlineSearch
+from bot.core.leader import LeaderElector
+from shared.database.session import engine
+
+# Сессия Bot API: локальный сервер задается для тестов и self-hosted API
+session = AiohttpSession(
+    api=TelegramAPIServer.from_base(settings.bot_api_server)
+) if settings.bot_api_server else AiohttpSession()
+
+# Ограничение скорости исходящих запросов: глобально и по чатам
+sender = ThrottlingRequestMiddleware(
+    global_rate=settings.send_global_rate,
+    chat_rate=settings.send_chat_rate,
+    group_rate=settings.send_group_rate,
+    chat_burst=settings.send_chat_burst,
+    max_retries=settings.send_max_retries
+)
+session.middleware(sender)
 
 # Инициализация бота с токеном и настройками по умолчанию
 bot = Bot(
     token=settings.bot_token.get_secret_value(),
+    session=session,
     # Установка режима парсинга сообщений
     default=DefaultBotProperties(parse_mode=ParseMode.HTML)
 )
 
-# Хранилище состояний
-storage = MemoryStorage()
+# Хранилище состояний. Обновления обрабатывает только ведущий процесс,
+# при смене ведущего кэш очищается
+if settings.fsm_storage == "database":
+    storage = DatabaseStorage(
+        cache_ttl=settings.fsm_cache_ttl,
+        cache_size=settings.fsm_cache_size
+    )
+else:
+    storage = MemoryStorage()
 
-# Инициализация диспетчера
+# Инициализация диспетчера.
+# FSM подключается в lifespan после маршрутизации по полосам, чтобы
+# состояние читалось уже внутри полосы чата, а не до нее
 dp = Dispatcher(
     bot=bot, 
-    storage=storage
+    storage=storage,
+    disable_fsm=True
+)
+
+# Очередь обновлений вебхука
+update_queue = UpdateQueue(
+    dispatcher=dp,
+    bot=bot,
+    maxsize=settings.webhook_queue_size,
+    workers=settings.webhook_workers
+)
+
+# Общая очередь обновлений в базе данных при нескольких воркерах API:
+# вебхук принимает любой воркер, обрабатывает только ведущий
+update_inbox = UpdateInbox(
+    bot=bot,
+    queue=update_queue,
+    batch_size=settings.update_inbox_batch_size,
+    poll_interval=settings.update_inbox_poll_interval,
+    retention=settings.update_inbox_retention
+) if settings.api_workers > 1 else None
+
+# Исполнитель обновлений: порядок внутри чата, параллельность между чатами
+lane_executor = ChatLaneExecutor(
+    dispatcher=dp,
+    max_concurrency=settings.update_max_concurrency,
+    max_pending=settings.update_max_pending
+)
+
+# Окно дедупликации повторно доставленных обновлений
+update_deduplicator = UpdateDeduplicator(
+    window=settings.update_dedup_window,
+    path=settings.update_dedup_path
+)
+
+# Исполнитель рассылок
+broadcaster = Broadcaster(
+    bot=bot,
+    chunk_size=settings.broadcast_chunk_size,
+    concurrency=settings.broadcast_concurrency,
+    lease_seconds=settings.broadcast_lease_seconds
+)
+
+# Кэш inline-поиска постов
+inline_search = InlineSearch(
+    ttl=settings.inline_cache_time,
+    limit=settings.inline_results_limit,
+    cache_size=settings.inline_cache_size
+)
+
+# Выбор ведущего процесса при запуске API в несколько воркеров
+leader = LeaderElector(
+    engine,
+    lock_file=Path(settings.leader_lock_file),
+    lock_key=settings.leader_lock_key,
+    interval=settings.leader_check_interval,
+    backend=settings.leader_backend
 )
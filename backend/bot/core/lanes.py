@@ -0,0 +1,258 @@
+"""
+Модуль исполнителя обновлений с упорядочиванием по чатам.
+
+Этот модуль определяет класс `ChatLaneExecutor`, который распределяет
+обновления Telegram по "полосам" (lanes) по ключу чата. Внутри одной
+полосы обновления обрабатываются строго по очереди, поэтому состояние FSM
+и вызовы edit_text одного чата не гоняются друг с другом. Разные полосы
+обрабатываются параллельно, но не более `max_concurrency` одновременно.
+
+Полоса существует, пока в ней есть необработанные обновления: опустевшая
+полоса удаляется вместе со своей задачей, поэтому неактивные чаты не
+занимают память.
+
+Inline-запросы пользователя идут в его полосу, и ожидающий запрос
+заменяется более новым (см. `ChatLaneExecutor._supersede`): так
+быстрый набор текста превращается в один поиск, а не в поиск на каждую букву.
+
+Классы:
+- LaneExecutorStats: Снимок метрик исполнителя.
+- ChatLaneExecutor: Исполнитель обновлений с полосами по чатам.
+"""
+import asyncio
+import logging
+from collections import deque
+from dataclasses import dataclass, asdict
+from typing import Any, Deque, Dict, Hashable, Set, Tuple
+from aiogram import Bot, Dispatcher
+from aiogram.methods import TelegramMethod
+from aiogram.types import Update
+
+# Ключ в контексте обработки, которым помечаются обновления,
+# уже переданные в полосу исполнителя
+LANE_DISPATCHED_KEY = "lane_dispatched"
+
+
+@dataclass(frozen=True)
+class LaneExecutorStats:
+    """
+    Снимок метрик исполнителя полос.
+
+    Args:
+        lanes (int): Количество активных полос.
+        pending (int): Количество обновлений, ожидающих обработки.
+        active (int): Количество обновлений, обрабатываемых прямо сейчас.
+        max_concurrency (int): Максимальное количество параллельных обработок.
+        max_pending (int): Максимальное количество ожидающих обновлений.
+        processed (int): Количество обработанных обновлений.
+        failed (int): Количество обновлений, обработка которых завершилась ошибкой.
+        superseded (int): Количество inline-запросов, замененных более новыми.
+    """
+    lanes: int
+    pending: int
+    active: int
+    max_concurrency: int
+    max_pending: int
+    processed: int
+    failed: int
+    superseded: int
+
+    def to_dict(self) -> Dict[str, int]:
+        """
+        Преобразует метрики в словарь.
+
+        Returns:
+            Dict[str, int]: Словарь с метриками.
+        """
+        return asdict(self)
+
+
+class ChatLaneExecutor:
+    """
+    Исполнитель обновлений: порядок внутри чата, параллельность между чатами.
+
+    Args:
+        dispatcher (Dispatcher): Диспетчер, обрабатывающий обновления.
+        max_concurrency (int): Максимальное количество обновлений,
+            обрабатываемых одновременно во всех полосах.
+        max_pending (int): Максимальное количество принятых, но еще не
+            обработанных обновлений. При превышении `submit` ждет (backpressure).
+    """
+    def __init__(self, dispatcher: Dispatcher, max_concurrency: int = 32, max_pending: int = 1000):
+        """
+        Инициализирует исполнитель полос.
+
+        Args:
+            dispatcher (Dispatcher): Диспетчер, обрабатывающий обновления.
+            max_concurrency (int): Максимальное количество параллельных обработок.
+            max_pending (int): Максимальное количество ожидающих обновлений.
+        """
+        self.dispatcher = dispatcher
+        self.max_concurrency = max_concurrency
+        self.max_pending = max_pending
+        self._concurrency = asyncio.Semaphore(max_concurrency)
+        self._capacity = asyncio.Semaphore(max_pending)
+        self._lanes: Dict[Hashable, Deque[Tuple[Bot, Update]]] = {}
+        self._tasks: Set[asyncio.Task] = set()
+        self._pending = 0
+        self._active = 0
+        self._processed = 0
+        self._failed = 0
+        self._superseded = 0
+
+    async def submit(self, key: Hashable | None, bot: Bot, update: Update) -> None:
+        """
+        Ставит обновление в полосу с заданным ключом.
+
+        Метод возвращается, как только обновление поставлено в полосу, не
+        дожидаясь его обработки. Ожидание возможно только при превышении
+        `max_pending`.
+
+        Args:
+            key (Hashable | None): Ключ полосы (обычно chat_id). Обновления без
+                ключа обрабатываются независимо друг от друга.
+            bot (Bot): Экземпляр бота.
+            update (Update): Обновление Telegram.
+        """
+        await self._capacity.acquire()
+        self._pending += 1
+
+        if key is None:
+            key = ("update", update.update_id)
+
+        lane = self._lanes.get(key)
+        if lane is not None:
+            if update.inline_query is not None and self._supersede(lane, bot, update):
+                return
+            lane.append((bot, update))
+            return
+
+        lane = self._lanes[key] = deque([(bot, update)])
+        task = asyncio.create_task(self._run_lane(key, lane))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """
+        Дожидается обработки всех полос и отменяет оставшиеся по таймауту.
+
+        Args:
+            timeout (float): Максимальное время ожидания в секундах.
+        """
+        if not self._tasks:
+            return
+        _, pending = await asyncio.wait(set(self._tasks), timeout=timeout)
+        if pending:
+            logging.warning(
+                "Полосы обновлений не завершились за %.1f с, отменено %d",
+                timeout,
+                len(pending)
+            )
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    def stats(self) -> LaneExecutorStats:
+        """
+        Возвращает текущие метрики исполнителя.
+
+        Returns:
+            LaneExecutorStats: Снимок метрик.
+        """
+        return LaneExecutorStats(
+            lanes=len(self._lanes),
+            pending=self._pending,
+            active=self._active,
+            max_concurrency=self.max_concurrency,
+            max_pending=self.max_pending,
+            processed=self._processed,
+            failed=self._failed,
+            superseded=self._superseded
+        )
+
+    async def process_update(self, bot: Bot, update: Update) -> Any:
+        """
+        Передает обновление в диспетчер в обход маршрутизации по полосам.
+
+        Args:
+            bot (Bot): Экземпляр бота.
+            update (Update): Обновление Telegram.
+
+        Returns:
+            Any: Результат обработки обновления.
+        """
+        response = await self.dispatcher.feed_update(bot, update, **{LANE_DISPATCHED_KEY: True})
+        if isinstance(response, TelegramMethod):
+            await self.dispatcher.silent_call_request(bot, response)
+        return response
+
+    async def _run_lane(self, key: Hashable, lane: Deque[Tuple[Bot, Update]]) -> None:
+        """
+        Последовательно обрабатывает обновления одной полосы.
+
+        Полоса удаляется, как только в ней не осталось обновлений.
+
+        Args:
+            key (Hashable): Ключ полосы.
+            lane (Deque[Tuple[Bot, Update]]): Очередь обновлений полосы.
+        """
+        try:
+            while lane:
+                bot, update = lane.popleft()
+                try:
+                    async with self._concurrency:
+                        self._active += 1
+                        try:
+                            await self.process_update(bot, update)
+                            self._processed += 1
+                        finally:
+                            self._active -= 1
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    self._failed += 1
+                    logging.exception(
+                        "Ошибка обработки обновления id=%d: %s",
+                        update.update_id,
+                        e
+                    )
+                finally:
+                    self._release()
+        finally:
+            # Обновления, оставшиеся в отмененной полосе, освобождают емкость
+            for _ in range(len(lane)):
+                self._release()
+            lane.clear()
+            del self._lanes[key]
+
+    def _supersede(self, lane: Deque[Tuple[Bot, Update]], bot: Bot, update: Update) -> bool:
+        """
+        Заменяет ожидающий inline-запрос полосы более новым.
+
+        Клиент Telegram отправляет inline-запрос на каждое нажатие клавиши,
+        и ответ на устаревший запрос уже никому не нужен. Поэтому, пока
+        предыдущий запрос пользователя ждет в полосе, новый занимает его
+        место, а старый не обрабатывается.
+
+        Args:
+            lane (Deque[Tuple[Bot, Update]]): Очередь обновлений полосы.
+            bot (Bot): Экземпляр бота.
+            update (Update): Новое обновление с inline-запросом.
+
+        Returns:
+            bool: True, если ожидающий запрос заменен.
+        """
+        for index in range(len(lane) - 1, -1, -1):
+            if lane[index][1].inline_query is not None:
+                lane[index] = (bot, update)
+                self._superseded += 1
+                self._release()
+                return True
+        return False
+
+    def _release(self) -> None:
+        """
+        Освобождает место под одно ожидающее обновление.
+        """
+        self._pending -= 1
+        self._capacity.release()
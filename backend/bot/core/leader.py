@@ -0,0 +1,204 @@
+"""
+Модуль выбора ведущего процесса.
+
+При запуске API в несколько воркеров каждый процесс обслуживает HTTP и
+вебхук, но установку вебхука, polling и фоновые задачи (рассылки) должен
+выполнять ровно один процесс - ведущий. `LeaderElector` выбирает его
+блокировкой, которую держит только один процесс:
+- в PostgreSQL - сессионной advisory-блокировкой на отдельном соединении;
+- иначе - блокировкой файла (`fcntl.flock`).
+
+Обе блокировки снимаются при завершении процесса или обрыве соединения,
+поэтому остальные процессы, периодически пытающиеся ее взять,
+автоматически заменяют упавшего ведущего.
+
+Классы:
+- LeaderElector: Выбор ведущего процесса.
+"""
+import asyncio
+import logging
+import os
+from pathlib import Path
+from typing import Awaitable, Callable, IO
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+# Обработчик смены роли процесса
+LeadershipCallback = Callable[[], Awaitable[None]]
+
+
+class LeaderElector:
+    """
+    Выбор ведущего процесса по блокировке.
+
+    Args:
+        engine (AsyncEngine): Движок базы данных (для advisory-блокировки).
+        lock_file (Path): Файл блокировки, если база данных не PostgreSQL.
+        lock_key (int): Ключ advisory-блокировки.
+        interval (float): Интервал попыток взять блокировку и проверки
+            соединения, секунды.
+        backend (str): "auto", "postgres" или "file".
+    """
+    def __init__(
+        self,
+        engine: AsyncEngine,
+        lock_file: Path,
+        lock_key: int,
+        interval: float = 5.0,
+        backend: str = "auto"
+    ):
+        """
+        Инициализирует выбор ведущего.
+
+        Args:
+            engine (AsyncEngine): Движок базы данных.
+            lock_file (Path): Файл блокировки.
+            lock_key (int): Ключ advisory-блокировки.
+            interval (float): Интервал попыток, секунды.
+            backend (str): "auto", "postgres" или "file".
+        """
+        if backend == "auto":
+            backend = "postgres" if engine.dialect.name == "postgresql" else "file"
+        if backend == "file" and fcntl is None:
+            raise RuntimeError("Блокировка файла не поддерживается на этой платформе")
+        self.engine = engine
+        self.lock_file = Path(lock_file)
+        self.lock_key = lock_key
+        self.interval = interval
+        self.backend = backend
+        self.is_leader = False
+        self._connection: AsyncConnection | None = None
+        self._file: IO | None = None
+        self._task: asyncio.Task | None = None
+
+    def start(self, on_elected: LeadershipCallback, on_demoted: LeadershipCallback) -> None:
+        """
+        Запускает фоновую задачу выбора ведущего.
+
+        Args:
+            on_elected (LeadershipCallback): Вызывается, когда процесс стал ведущим.
+            on_demoted (LeadershipCallback): Вызывается, когда процесс потерял
+                блокировку (например, при обрыве соединения с базой).
+        """
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(on_elected, on_demoted))
+
+    async def stop(self) -> None:
+        """
+        Останавливает выбор ведущего и снимает блокировку.
+        """
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await self._release()
+
+    async def _run(self, on_elected: LeadershipCallback, on_demoted: LeadershipCallback) -> None:
+        """
+        Пытается взять блокировку и, став ведущим, проверяет, что она удерживается.
+
+        Args:
+            on_elected (LeadershipCallback): Обработчик получения роли ведущего.
+            on_demoted (LeadershipCallback): Обработчик потери роли ведущего.
+        """
+        while True:
+            if not self.is_leader:
+                if await self._acquire():
+                    self.is_leader = True
+                    logging.info("Процесс %d стал ведущим (%s)", os.getpid(), self.backend)
+                    await on_elected()
+            elif not await self._check():
+                self.is_leader = False
+                logging.warning("Процесс %d потерял роль ведущего", os.getpid())
+                await self._release()
+                await on_demoted()
+            await asyncio.sleep(self.interval)
+
+    async def _acquire(self) -> bool:
+        """
+        Пытается взять блокировку без ожидания.
+
+        Returns:
+            bool: True, если блокировка получена.
+        """
+        if self.backend == "file":
+            return self._acquire_file()
+        try:
+            connection = await self.engine.connect()
+            connection = await connection.execution_options(isolation_level="AUTOCOMMIT")
+            locked = await connection.scalar(
+                text("SELECT pg_try_advisory_lock(:key)"),
+                {"key": self.lock_key}
+            )
+        except Exception as e:
+            logging.error("Ошибка получения блокировки ведущего: %s", e)
+            return False
+        if not locked:
+            await connection.close()
+            return False
+        self._connection = connection
+        return True
+
+    def _acquire_file(self) -> bool:
+        """
+        Пытается взять блокировку файла.
+
+        Returns:
+            bool: True, если блокировка получена.
+        """
+        lock = open(self.lock_file, "a+", encoding="utf-8")
+        try:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock.close()
+            return False
+        lock.truncate(0)
+        lock.write(str(os.getpid()))
+        lock.flush()
+        self._file = lock
+        return True
+
+    async def _check(self) -> bool:
+        """
+        Проверяет, что блокировка по-прежнему удерживается.
+
+        Returns:
+            bool: False, если соединение с блокировкой потеряно.
+        """
+        if self.backend == "file":
+            return self._file is not None
+        try:
+            await self._connection.execute(text("SELECT 1"))
+            return True
+        except Exception as e:
+            logging.error("Соединение с блокировкой ведущего потеряно: %s", e)
+            return False
+
+    async def _release(self) -> None:
+        """
+        Снимает блокировку.
+        """
+        if self._file is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            self._file.close()
+            self._file = None
+        if self._connection is not None:
+            try:
+                await self._connection.execute(
+                    text("SELECT pg_advisory_unlock(:key)"),
+                    {"key": self.lock_key}
+                )
+            except Exception:
+                # Соединение разорвано - сервер уже снял блокировку
+                pass
+            try:
+                await self._connection.close()
+            except Exception:
+                pass
+            self._connection = None
+        self.is_leader = False
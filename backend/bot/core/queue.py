@@ -0,0 +1,229 @@
+"""
+Модуль очереди входящих обновлений Telegram.
+
+Этот модуль определяет класс `UpdateQueue` - ограниченную in-process очередь,
+в которую вебхук складывает провалидированные обновления и сразу отвечает
+Telegram. Обновления обрабатывает пул фоновых воркеров, поэтому медленные
+обработчики (сессия БД, исходящие запросы к API) больше не задерживают
+ответ на вебхук.
+
+Классы:
+- UpdateQueueStats: Снимок метрик очереди.
+- UpdateQueue: Ограниченная очередь обновлений с пулом воркеров.
+"""
+import asyncio
+import logging
+from dataclasses import dataclass, asdict
+from typing import Any, Dict, List
+from aiogram import Bot, Dispatcher
+from aiogram.methods import TelegramMethod
+from aiogram.types import Update
+
+
+@dataclass(frozen=True)
+class UpdateQueueStats:
+    """
+    Снимок метрик очереди обновлений.
+
+    Args:
+        depth (int): Текущее количество обновлений в очереди.
+        maxsize (int): Максимальный размер очереди.
+        workers (int): Количество воркеров.
+        busy (int): Количество воркеров, обрабатывающих обновление прямо сейчас.
+        accepted (int): Количество принятых обновлений.
+        rejected (int): Количество отклоненных обновлений (очередь переполнена).
+        processed (int): Количество обработанных обновлений.
+        failed (int): Количество обновлений, обработка которых завершилась ошибкой.
+    """
+    depth: int
+    maxsize: int
+    workers: int
+    busy: int
+    accepted: int
+    rejected: int
+    processed: int
+    failed: int
+
+    def to_dict(self) -> Dict[str, int]:
+        """
+        Преобразует метрики в словарь.
+
+        Returns:
+            Dict[str, int]: Словарь с метриками.
+        """
+        return asdict(self)
+
+
+class UpdateQueue:
+    """
+    Ограниченная очередь обновлений Telegram с пулом воркеров.
+
+    Вебхук кладет обновление в очередь методом `put` и сразу возвращает
+    ответ. Если очередь заполнена, `put` возвращает False - вебхук отвечает
+    429, и Telegram повторит доставку позже (backpressure).
+
+    Args:
+        dispatcher (Dispatcher): Диспетчер, обрабатывающий обновления.
+        bot (Bot): Экземпляр бота.
+        maxsize (int): Максимальный размер очереди.
+        workers (int): Количество воркеров.
+    """
+    def __init__(self, dispatcher: Dispatcher, bot: Bot, maxsize: int = 1000, workers: int = 4):
+        """
+        Инициализирует очередь обновлений.
+
+        Args:
+            dispatcher (Dispatcher): Диспетчер, обрабатывающий обновления.
+            bot (Bot): Экземпляр бота.
+            maxsize (int): Максимальный размер очереди.
+            workers (int): Количество воркеров.
+        """
+        self.dispatcher = dispatcher
+        self.bot = bot
+        self.maxsize = maxsize
+        self.workers = workers
+        self._queue: asyncio.Queue[Update] | None = None
+        self._tasks: List[asyncio.Task] = []
+        self._accepting = False
+        self._busy = 0
+        self._accepted = 0
+        self._rejected = 0
+        self._processed = 0
+        self._failed = 0
+
+    @property
+    def running(self) -> bool:
+        """
+        Запущены ли воркеры очереди.
+        """
+        return bool(self._tasks)
+
+    def start(self) -> None:
+        """
+        Запускает пул воркеров.
+
+        Очередь создается здесь, а не в конструкторе, чтобы она была
+        привязана к работающему event loop приложения.
+        """
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.maxsize)
+        self._tasks = [
+            asyncio.create_task(self._worker(), name=f"update-worker-{number}")
+            for number in range(self.workers)
+        ]
+        self._accepting = True
+        logging.info(
+            "Очередь обновлений запущена: размер %d, воркеров %d",
+            self.maxsize,
+            self.workers
+        )
+
+    def put(self, update: Update) -> bool:
+        """
+        Добавляет обновление в очередь без ожидания.
+
+        Args:
+            update (Update): Провалидированное обновление Telegram.
+
+        Returns:
+            bool: True, если обновление принято, False, если очередь
+            заполнена или остановлена.
+        """
+        if not self._accepting:
+            self._rejected += 1
+            return False
+        try:
+            self._queue.put_nowait(update)
+        except asyncio.QueueFull:
+            self._rejected += 1
+            return False
+        self._accepted += 1
+        return True
+
+    async def stop(self, timeout: float = 10.0) -> None:
+        """
+        Останавливает прием обновлений и дожидается обработки очереди.
+
+        Если очередь не успела опустеть за `timeout` секунд, оставшиеся
+        обновления отбрасываются (Telegram доставит их повторно), а воркеры
+        отменяются.
+
+        Args:
+            timeout (float): Максимальное время ожидания в секундах.
+        """
+        if not self.running:
+            return
+        self._accepting = False
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout=timeout)
+        except asyncio.TimeoutError:
+            logging.warning(
+                "Очередь обновлений не опустела за %.1f с, осталось %d",
+                timeout,
+                self._queue.qsize()
+            )
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        logging.info("Очередь обновлений остановлена: %s", self.stats().to_dict())
+
+    def stats(self) -> UpdateQueueStats:
+        """
+        Возвращает текущие метрики очереди.
+
+        Returns:
+            UpdateQueueStats: Снимок метрик.
+        """
+        return UpdateQueueStats(
+            depth=self._queue.qsize() if self._queue else 0,
+            maxsize=self.maxsize,
+            workers=len(self._tasks),
+            busy=self._busy,
+            accepted=self._accepted,
+            rejected=self._rejected,
+            processed=self._processed,
+            failed=self._failed
+        )
+
+    async def process_update(self, update: Update) -> Any:
+        """
+        Передает обновление в диспетчер.
+
+        Если обработчик вернул метод Telegram (ответ в вебхук), он
+        выполняется отдельным запросом, так как ответ на вебхук уже отправлен.
+
+        Args:
+            update (Update): Обновление Telegram.
+
+        Returns:
+            Any: Результат обработки обновления.
+        """
+        response = await self.dispatcher.feed_update(self.bot, update)
+        if isinstance(response, TelegramMethod):
+            await self.dispatcher.silent_call_request(self.bot, response)
+        return response
+
+    async def _worker(self) -> None:
+        """
+        Цикл воркера: забирает обновления из очереди и обрабатывает их.
+        """
+        while True:
+            update = await self._queue.get()
+            self._busy += 1
+            try:
+                await self.process_update(update)
+                self._processed += 1
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self._failed += 1
+                logging.exception(
+                    "Ошибка обработки обновления id=%d: %s",
+                    update.update_id,
+                    e
+                )
+            finally:
+                self._busy -= 1
+                self._queue.task_done()
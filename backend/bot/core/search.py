@@ -0,0 +1,145 @@
+"""
+Модуль поиска постов для inline-режима бота.
+
+Inline-запросы приходят на каждое нажатие клавиши, поэтому класс
+`InlineSearch` отвечает на них по быстрому пути:
+- результаты поиска кэшируются по нормализованной строке запроса на
+  `ttl` секунд (столько же Telegram кэширует ответ по `cache_time`),
+  поэтому повторный запрос не обращается к базе данных;
+- для каждого поста один раз собирается компактная карточка -
+  готовый `InlineQueryResultArticle`, - которая переиспользуется во всех
+  ответах, пока пост не изменится.
+
+Классы:
+- InlineSearch: Кэш результатов поиска и карточек постов.
+"""
+import html
+import time
+from collections import OrderedDict
+from datetime import datetime
+from typing import Awaitable, Callable, List, Tuple
+from aiogram.types import InlineQueryResultArticle, InputTextMessageContent
+from sqlalchemy import Row
+
+# Функция поиска: (строка запроса, лимит) -> строки постов
+SearchFunc = Callable[[str, int], Awaitable[List[Row]]]
+
+
+class InlineSearch:
+    """
+    Кэш результатов inline-поиска и карточек постов.
+
+    Args:
+        ttl (float): Время жизни результатов поиска, секунды.
+        limit (int): Максимальное количество результатов в ответе.
+        cache_size (int): Максимальное количество кэшируемых запросов.
+        cards_size (int): Максимальное количество кэшируемых карточек.
+    """
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        limit: int = 20,
+        cache_size: int = 1000,
+        cards_size: int = 5000
+    ):
+        """
+        Инициализирует кэш.
+
+        Args:
+            ttl (float): Время жизни результатов поиска, секунды.
+            limit (int): Максимальное количество результатов в ответе.
+            cache_size (int): Максимальное количество кэшируемых запросов.
+            cards_size (int): Максимальное количество кэшируемых карточек.
+        """
+        self.ttl = ttl
+        self.limit = limit
+        self.cache_size = cache_size
+        self.cards_size = cards_size
+        self.hits = 0
+        self.misses = 0
+        self._results: OrderedDict[str, Tuple[float, List[InlineQueryResultArticle]]] = OrderedDict()
+        self._cards: OrderedDict[int, Tuple[datetime, InlineQueryResultArticle]] = OrderedDict()
+
+    @staticmethod
+    def normalize(query: str) -> str:
+        """
+        Нормализует строку запроса для ключа кэша.
+
+        Args:
+            query (str): Строка запроса.
+
+        Returns:
+            str: Строка в нижнем регистре с одиночными пробелами.
+        """
+        return " ".join(query.lower().split())
+
+    def cached(self, query: str) -> List[InlineQueryResultArticle] | None:
+        """
+        Возвращает результаты из кэша, если они не устарели.
+
+        Args:
+            query (str): Нормализованная строка запроса.
+
+        Returns:
+            List[InlineQueryResultArticle] | None: Результаты или None при промахе.
+        """
+        entry = self._results.get(query)
+        if entry is None or time.monotonic() - entry[0] >= self.ttl:
+            return None
+        self._results.move_to_end(query)
+        self.hits += 1
+        return entry[1]
+
+    async def search(self, query: str, search_func: SearchFunc) -> List[InlineQueryResultArticle]:
+        """
+        Возвращает результаты поиска из кэша или выполняет поиск.
+
+        Args:
+            query (str): Строка запроса.
+            search_func (SearchFunc): Функция поиска в базе данных.
+
+        Returns:
+            List[InlineQueryResultArticle]: Результаты для ответа на inline-запрос.
+        """
+        query = self.normalize(query)
+        results = self.cached(query)
+        if results is not None:
+            return results
+
+        self.misses += 1
+        rows = await search_func(query, self.limit)
+        results = [self._card(row) for row in rows]
+        self._results[query] = (time.monotonic(), results)
+        self._results.move_to_end(query)
+        while len(self._results) > self.cache_size:
+            self._results.popitem(last=False)
+        return results
+
+    def _card(self, row: Row) -> InlineQueryResultArticle:
+        """
+        Возвращает карточку поста, собирая ее только при изменении поста.
+
+        Args:
+            row (Row): Строка поста (id, name, content, rating, updated_at).
+
+        Returns:
+            InlineQueryResultArticle: Карточка поста.
+        """
+        entry = self._cards.get(row.id)
+        if entry is not None and entry[0] == row.updated_at:
+            self._cards.move_to_end(row.id)
+            return entry[1]
+
+        card = InlineQueryResultArticle(
+            id=str(row.id),
+            title=row.name,
+            description=f"★ {row.rating} · {row.content[:80]}",
+            input_message_content=InputTextMessageContent(
+                message_text=f"<b>{html.escape(row.name)}</b>\n\n{html.escape(row.content)}"
+            )
+        )
+        self._cards[row.id] = (row.updated_at, card)
+        self._cards.move_to_end(row.id)
+        while len(self._cards) > self.cards_size:
+            self._cards.popitem(last=False)
+        return card
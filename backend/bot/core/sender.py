@@ -0,0 +1,418 @@
+"""
+Модуль ограничения скорости исходящих запросов к Telegram Bot API.
+
+Telegram ограничивает рассылку примерно 30 сообщениями в секунду на бота,
+одним сообщением в секунду на личный чат и 20 сообщениями в минуту на группу.
+При превышении API возвращает `RetryAfter`, и обработчик простаивает.
+
+Этот модуль определяет:
+- SendPriority: Приоритет исходящего запроса (интерактивные ответы
+  обслуживаются раньше массовых рассылок).
+- send_priority: Контекстный менеджер для установки приоритета.
+- TokenBucket: Корзина токенов с очередью ожидающих по приоритету.
+- ThrottlingRequestMiddleware: Промежуточный слой сессии бота, который
+  пропускает запросы через глобальную и per-chat корзины и автоматически
+  повторяет запрос после `RetryAfter`.
+
+Корзины хранятся в памяти процесса, поэтому лимиты действуют в пределах
+одного процесса. При нескольких воркерах API обновления и рассылки
+обрабатывает только ведущий процесс, но запущенная отдельно команда
+`broadcast` может превысить общий лимит Telegram, и превышение
+обрабатывается только повтором после `RetryAfter`.
+"""
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, asdict
+from enum import IntEnum
+from typing import Dict, Generator, List, Tuple
+from aiogram import Bot
+from aiogram.client.session.middlewares.base import BaseRequestMiddleware, NextRequestMiddlewareType
+from aiogram.exceptions import TelegramRetryAfter
+from aiogram.methods import Response, TelegramMethod
+from aiogram.methods.base import TelegramType
+
+
+class SendPriority(IntEnum):
+    """
+    Приоритет исходящего запроса. Меньшее значение обслуживается раньше.
+
+    Args:
+        INTERACTIVE (int): Ответы пользователю в рамках обработки обновления.
+        BULK (int): Массовые рассылки.
+    """
+    INTERACTIVE = 0
+    BULK = 1
+
+
+_current_priority: ContextVar[SendPriority] = ContextVar(
+    "send_priority",
+    default=SendPriority.INTERACTIVE
+)
+
+
+@contextmanager
+def send_priority(priority: SendPriority) -> Generator[None, None, None]:
+    """
+    Устанавливает приоритет для всех запросов к API внутри блока.
+
+    Args:
+        priority (SendPriority): Приоритет запросов.
+    """
+    token = _current_priority.set(priority)
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+class TokenBucket:
+    """
+    Корзина токенов с очередью ожидающих по приоритету.
+
+    Пока есть токены и нет ожидающих, `acquire` не приостанавливает
+    корутину. Иначе запрос встает в очередь, упорядоченную по приоритету
+    и времени поступления, и будится таймером, когда накопится токен.
+
+    Args:
+        rate (float): Скорость пополнения, токенов в секунду.
+        capacity (float): Емкость корзины (допустимый всплеск).
+    """
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Инициализирует корзину токенов.
+
+        Args:
+            rate (float): Скорость пополнения, токенов в секунду.
+            capacity (float): Емкость корзины.
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+        self._timer: asyncio.TimerHandle | None = None
+
+    @property
+    def idle(self) -> bool:
+        """
+        Корзина полна и никто ее не ждет - ее можно удалить.
+        """
+        self._refill()
+        return not self._waiters and self._tokens >= self.capacity
+
+    async def acquire(self, priority: int = SendPriority.INTERACTIVE) -> float:
+        """
+        Забирает один токен, при необходимости дожидаясь его.
+
+        Args:
+            priority (int): Приоритет запроса.
+
+        Returns:
+            float: Время ожидания в секундах.
+        """
+        self._refill()
+        if not self._waiters and self._tokens >= 1 and self._updated >= self._paused_until:
+            self._tokens -= 1
+            return 0.0
+
+        started_at = time.monotonic()
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), waiter))
+        self._schedule()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # Токен уже выдан, но запрос отменен: возвращаем токен корзине
+            if waiter.done() and not waiter.cancelled():
+                self._tokens = min(self.capacity, self._tokens + 1)
+                if self._timer:
+                    self._timer.cancel()
+                    self._timer = None
+                if self._waiters:
+                    self._schedule()
+            raise
+        return time.monotonic() - started_at
+
+    def pause(self, seconds: float) -> None:
+        """
+        Приостанавливает выдачу токенов (например, после `RetryAfter`).
+
+        Args:
+            seconds (float): Длительность паузы в секундах.
+        """
+        self._refill()
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        # После паузы доступен ровно один запрос, дальше - обычная скорость
+        self._tokens = min(1.0, self.capacity)
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        if self._waiters:
+            self._schedule()
+
+    def _refill(self) -> None:
+        """
+        Пополняет корзину пропорционально прошедшему времени.
+        """
+        now = time.monotonic()
+        if now > self._paused_until:
+            elapsed = now - max(self._updated, self._paused_until)
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated = now
+
+    def _schedule(self) -> None:
+        """
+        Планирует пробуждение ожидающих к моменту появления токена.
+        """
+        if self._timer is not None:
+            return
+        now = time.monotonic()
+        delay = max(self._paused_until - now, (1 - self._tokens) / self.rate, 0.0)
+        self._timer = asyncio.get_running_loop().call_later(delay, self._release)
+
+    def _release(self) -> None:
+        """
+        Раздает накопившиеся токены ожидающим в порядке приоритета.
+        """
+        self._timer = None
+        self._refill()
+        while self._waiters and self._tokens >= 1 and self._updated >= self._paused_until:
+            _, _, waiter = heapq.heappop(self._waiters)
+            if waiter.done():
+                continue
+            self._tokens -= 1
+            waiter.set_result(None)
+        # Отмененные ожидающие не должны держать таймер
+        while self._waiters and self._waiters[0][2].done():
+            heapq.heappop(self._waiters)
+        if self._waiters:
+            self._schedule()
+
+
+@dataclass(frozen=True)
+class SenderStats:
+    """
+    Снимок метрик исходящих запросов.
+
+    Args:
+        sent (int): Количество успешных запросов.
+        sent_interactive (int): Из них интерактивных.
+        sent_bulk (int): Из них массовых.
+        failed (int): Количество запросов, завершившихся ошибкой.
+        throttled (int): Количество запросов, ожидавших токен.
+        wait_seconds (float): Суммарное время ожидания токенов.
+        retry_after (int): Количество полученных `RetryAfter`.
+        chats (int): Количество отслеживаемых per-chat корзин.
+        uptime (float): Время с момента создания, секунды.
+        throughput (float): Средняя скорость успешных запросов, в секунду.
+    """
+    sent: int
+    sent_interactive: int
+    sent_bulk: int
+    failed: int
+    throttled: int
+    wait_seconds: float
+    retry_after: int
+    chats: int
+    uptime: float
+    throughput: float
+
+    def to_dict(self) -> Dict[str, float]:
+        """
+        Преобразует метрики в словарь.
+
+        Returns:
+            Dict[str, float]: Словарь с метриками.
+        """
+        return asdict(self)
+
+
+class ThrottlingRequestMiddleware(BaseRequestMiddleware):
+    """
+    Промежуточный слой сессии бота с ограничением скорости отправки.
+
+    Ограничиваются только методы, адресованные чату (у метода есть поле
+    `chat_id`): отправка, редактирование, пересылка сообщений. Служебные
+    методы (getMe, setWebhook, answerCallbackQuery) проходят без ожидания.
+
+    Args:
+        global_rate (float): Глобальный лимит, запросов в секунду.
+        chat_rate (float): Лимит для личного чата, запросов в секунду.
+        group_rate (float): Лимит для группы, запросов в секунду.
+        chat_burst (float): Допустимый всплеск в одном чате.
+        max_retries (int): Максимальное количество повторов после `RetryAfter`.
+        max_chats (int): Количество per-chat корзин, после которого
+            неактивные корзины удаляются.
+    """
+    def __init__(
+        self,
+        global_rate: float = 30.0,
+        chat_rate: float = 1.0,
+        group_rate: float = 20 / 60,
+        chat_burst: float = 3.0,
+        max_retries: int = 3,
+        max_chats: int = 10000
+    ):
+        """
+        Инициализирует промежуточный слой.
+
+        Args:
+            global_rate (float): Глобальный лимит, запросов в секунду.
+            chat_rate (float): Лимит для личного чата, запросов в секунду.
+            group_rate (float): Лимит для группы, запросов в секунду.
+            chat_burst (float): Допустимый всплеск в одном чате.
+            max_retries (int): Максимальное количество повторов после `RetryAfter`.
+            max_chats (int): Порог очистки неактивных per-chat корзин.
+        """
+        self.chat_rate = chat_rate
+        self.group_rate = group_rate
+        self.chat_burst = chat_burst
+        self.max_retries = max_retries
+        self.max_chats = max_chats
+        self._global = TokenBucket(rate=global_rate, capacity=global_rate)
+        self._chats: Dict[int | str, TokenBucket] = {}
+        self._started_at = time.monotonic()
+        self._sent = {SendPriority.INTERACTIVE: 0, SendPriority.BULK: 0}
+        self._failed = 0
+        self._throttled = 0
+        self._wait_seconds = 0.0
+        self._retry_after = 0
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType[TelegramType],
+        bot: Bot,
+        method: TelegramMethod[TelegramType]
+    ) -> Response[TelegramType]:
+        """
+        Выполняет запрос с учетом лимитов и повторяет его после `RetryAfter`.
+
+        Args:
+            make_request (NextRequestMiddlewareType): Следующий обработчик цепочки.
+            bot (Bot): Экземпляр бота.
+            method (TelegramMethod): Метод Telegram API.
+
+        Returns:
+            Response: Ответ Telegram API.
+        """
+        if not hasattr(method, "chat_id"):
+            return await make_request(bot, method)
+
+        priority = _current_priority.get()
+        chat_id = getattr(method, "chat_id", None)
+        attempt = 0
+        while True:
+            await self._acquire(chat_id, priority)
+            try:
+                response = await make_request(bot, method)
+            except TelegramRetryAfter as e:
+                self._retry_after += 1
+                self._pause(chat_id, e.retry_after)
+                if attempt >= self.max_retries:
+                    self._failed += 1
+                    raise
+                attempt += 1
+                logging.warning(
+                    "RetryAfter %d с для %s в чате %s, повтор %d",
+                    e.retry_after,
+                    type(method).__name__,
+                    chat_id,
+                    attempt
+                )
+                continue
+            except Exception:
+                self._failed += 1
+                raise
+            self._sent[priority] += 1
+            return response
+
+    def stats(self) -> SenderStats:
+        """
+        Возвращает текущие метрики исходящих запросов.
+
+        Returns:
+            SenderStats: Снимок метрик.
+        """
+        uptime = time.monotonic() - self._started_at
+        sent = sum(self._sent.values())
+        return SenderStats(
+            sent=sent,
+            sent_interactive=self._sent[SendPriority.INTERACTIVE],
+            sent_bulk=self._sent[SendPriority.BULK],
+            failed=self._failed,
+            throttled=self._throttled,
+            wait_seconds=round(self._wait_seconds, 3),
+            retry_after=self._retry_after,
+            chats=len(self._chats),
+            uptime=round(uptime, 3),
+            throughput=round(sent / uptime, 3) if uptime else 0.0
+        )
+
+    async def _acquire(self, chat_id: int | str | None, priority: SendPriority) -> None:
+        """
+        Забирает токены per-chat и глобальной корзины.
+
+        Сначала ожидается токен чата, чтобы запрос не занимал глобальный
+        токен, пока ждет свой чат.
+
+        Args:
+            chat_id (int | str | None): Идентификатор чата.
+            priority (SendPriority): Приоритет запроса.
+        """
+        waited = 0.0
+        if chat_id is not None:
+            waited += await self._chat_bucket(chat_id).acquire(priority)
+        waited += await self._global.acquire(priority)
+        if waited:
+            self._throttled += 1
+            self._wait_seconds += waited
+
+    def _pause(self, chat_id: int | str | None, seconds: float) -> None:
+        """
+        Приостанавливает отправку после `RetryAfter`.
+
+        Args:
+            chat_id (int | str | None): Идентификатор чата.
+            seconds (float): Длительность паузы.
+        """
+        if chat_id is not None:
+            self._chat_bucket(chat_id).pause(seconds)
+        else:
+            self._global.pause(seconds)
+
+    def _chat_bucket(self, chat_id: int | str) -> TokenBucket:
+        """
+        Возвращает корзину чата, создавая ее при необходимости.
+
+        Args:
+            chat_id (int | str): Идентификатор чата.
+
+        Returns:
+            TokenBucket: Корзина чата.
+        """
+        bucket = self._chats.get(chat_id)
+        if bucket is None:
+            if len(self._chats) >= self.max_chats:
+                self._prune()
+            # Отрицательные id и @username - группы и каналы
+            is_group = isinstance(chat_id, str) or chat_id < 0
+            bucket = TokenBucket(
+                rate=self.group_rate if is_group else self.chat_rate,
+                capacity=self.chat_burst
+            )
+            self._chats[chat_id] = bucket
+        return bucket
+
+    def _prune(self) -> None:
+        """
+        Удаляет per-chat корзины, которые полны и никем не ожидаются.
+        """
+        for chat_id in [chat_id for chat_id, bucket in self._chats.items() if bucket.idle]:
+            del self._chats[chat_id]
@@ -0,0 +1,193 @@
+"""
+Модуль запуска бота.
+
+При каждом запуске процесса бот раньше заново устанавливал команды и
+вебхук, а при остановке удалял вебхук: это лишние запросы к Bot API при
+холодном старте, а между остановкой и запуском Telegram не мог доставить
+обновления. `BotSetup` сравнивает желаемые команды, адрес вебхука и
+`allowed_updates` с `getWebhookInfo` и с отпечатком, сохраненным при
+прошлом запуске, и выполняет только изменившиеся вызовы, параллельно.
+
+`StartupTimer` пишет в лог длительность этапов запуска.
+
+Классы:
+- StartupTimer: Замер этапов запуска.
+- BotSetup: Синхронизация команд и вебхука с Bot API.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Sequence
+from aiogram import Bot
+from aiogram.types import BotCommand, BotCommandScopeDefault
+
+
+class StartupTimer:
+    """
+    Замер длительности этапов запуска.
+    """
+    def __init__(self):
+        """
+        Инициализирует замер, начиная отсчет общего времени.
+        """
+        self.started = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """
+        Замеряет этап запуска и пишет его длительность в лог.
+
+        Args:
+            name (str): Название этапа.
+        """
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = elapsed = time.perf_counter() - started
+            logging.info("Запуск: %s - %.1f мс", name, elapsed * 1000)
+
+    def total(self) -> float:
+        """
+        Возвращает время с начала запуска, секунды.
+        """
+        return time.perf_counter() - self.started
+
+
+def fingerprint(value: Any) -> str:
+    """
+    Возвращает отпечаток значения, сериализуемого в JSON.
+
+    Args:
+        value (Any): Значение.
+
+    Returns:
+        str: SHA-256 канонического JSON.
+    """
+    data = json.dumps(value, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+class BotSetup:
+    """
+    Синхронизация команд и вебхука бота с Bot API.
+
+    Args:
+        bot (Bot): Экземпляр бота.
+        state_path (Path): Файл с отпечатками последней успешной установки.
+    """
+    def __init__(self, bot: Bot, state_path: Path):
+        """
+        Инициализирует синхронизацию.
+
+        Args:
+            bot (Bot): Экземпляр бота.
+            state_path (Path): Файл с отпечатками последней успешной установки.
+        """
+        self.bot = bot
+        self.state_path = Path(state_path)
+
+    async def sync(
+        self,
+        commands: List[BotCommand],
+        webhook_url: str | None,
+        allowed_updates: Sequence[str]
+    ) -> List[str]:
+        """
+        Устанавливает команды и вебхук, если они изменились.
+
+        Команды сравниваются с сохраненным отпечатком (команды нельзя
+        изменить иначе, чем через бота). Вебхук сравнивается и с
+        `getWebhookInfo`, так как его могли изменить или удалить извне.
+        Запрос информации о вебхуке и установка команд выполняются
+        параллельно.
+
+        Args:
+            commands (List[BotCommand]): Команды бота.
+            webhook_url (str | None): Адрес вебхука, None - режим polling
+                (вебхук удаляется, если он установлен).
+            allowed_updates (Sequence[str]): Типы обновлений для вебхука.
+
+        Returns:
+            List[str]: Выполненные изменяющие вызовы Bot API.
+        """
+        allowed = sorted(allowed_updates)
+        stored = self._load()
+        desired = {
+            "commands": fingerprint([command.model_dump(exclude_none=True) for command in commands]),
+            "webhook": fingerprint({"url": webhook_url, "allowed_updates": allowed}),
+        }
+        calls: List[str] = []
+
+        set_commands = None
+        if stored.get("commands") != desired["commands"]:
+            set_commands = asyncio.ensure_future(
+                self.bot.set_my_commands(commands, scope=BotCommandScopeDefault())
+            )
+            calls.append("setMyCommands")
+
+        try:
+            info = await self.bot.get_webhook_info()
+        finally:
+            if set_commands is not None:
+                await set_commands
+
+        if info.last_error_message:
+            logging.warning("Последняя ошибка вебхука: %s", info.last_error_message)
+
+        if webhook_url is None:
+            if info.url:
+                await self.bot.delete_webhook(drop_pending_updates=False)
+                calls.append("deleteWebhook")
+        elif (
+            info.url != webhook_url
+            or sorted(info.allowed_updates or []) != allowed
+            or stored.get("webhook") != desired["webhook"]
+        ):
+            await self.bot.set_webhook(
+                url=webhook_url,
+                allowed_updates=allowed,
+                drop_pending_updates=False
+            )
+            calls.append("setWebhook")
+
+        if stored != desired:
+            self._save(desired)
+        logging.info("Настройка бота: %s", ", ".join(calls) or "без изменений")
+        return calls
+
+    def _load(self) -> Dict[str, str]:
+        """
+        Читает отпечатки прошлой установки.
+
+        Returns:
+            Dict[str, str]: Отпечатки или пустой словарь.
+        """
+        try:
+            state = json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        # Отпечатки другого бота (смена токена) не учитываются
+        if state.get("bot_id") != self.bot.id:
+            return {}
+        return state.get("fingerprints", {})
+
+    def _save(self, fingerprints: Dict[str, str]) -> None:
+        """
+        Сохраняет отпечатки установки.
+
+        Args:
+            fingerprints (Dict[str, str]): Отпечатки команд и вебхука.
+        """
+        try:
+            self.state_path.write_text(
+                json.dumps({"bot_id": self.bot.id, "fingerprints": fingerprints}),
+                encoding="utf-8"
+            )
+        except OSError as e:
+            logging.warning("Не удалось сохранить состояние настройки бота: %s", e)
@@ -0,0 +1,281 @@
+"""
+Модуль хранилища состояний FSM в базе данных.
+
+Этот модуль определяет класс `DatabaseStorage` - реализацию `BaseStorage`
+aiogram поверх SQLAlchemy (таблица `fsmstates`, в PostgreSQL - UNLOGGED).
+В отличие от `MemoryStorage`, состояние диалогов переживает деплой и
+доступно нескольким процессам.
+
+Чтобы многошаговые диалоги не стали медленнее, хранилище:
+- читает через in-process кэш (LRU с TTL), поэтому повторные чтения
+  в рамках диалога не ходят в базу. Кэш не знает об изменениях из других
+  процессов: обновления обрабатывает только ведущий процесс, и при смене
+  ведущего кэш очищается (`close`). В кэш попадают только успешно
+  сохраненные записи;
+- откладывает запись: все изменения состояния и данных, сделанные за время
+  обработки одного обновления, сохраняются одним upsert в конце
+  (см. `DatabaseStorage.coalesce` и `FSMWriteMiddleware`).
+
+Классы:
+- DatabaseStorage: Хранилище FSM в базе данных с кэшем и объединением записей.
+"""
+import copy
+import dataclasses
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, AsyncGenerator, Callable, Dict, Optional
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import BaseStorage, DefaultKeyBuilder, KeyBuilder, StateType, StorageKey
+from sqlalchemy.ext.asyncio import AsyncSession
+from shared.database.session import async_session
+from shared.schemas.fsm import FSMStateSchema
+from shared.services.fsm import FSMDataManager
+
+# Записи, измененные за время обработки текущего обновления
+_pending_writes: ContextVar[Optional[Dict[str, "_CachedRecord"]]] = ContextVar(
+    "fsm_pending_writes",
+    default=None
+)
+
+
+@dataclass
+class _CachedRecord:
+    """
+    Запись кэша состояния FSM.
+
+    Args:
+        state (str | None): Текущее состояние.
+        data (Dict[str, Any]): Данные контекста.
+        loaded_at (float): Время загрузки или изменения записи (monotonic).
+    """
+    state: Optional[str] = None
+    data: Dict[str, Any] = field(default_factory=dict)
+    loaded_at: float = field(default_factory=time.monotonic)
+
+
+class DatabaseStorage(BaseStorage):
+    """
+    Хранилище состояний FSM в базе данных.
+
+    Args:
+        session_factory (Callable[[], AsyncSession]): Фабрика сессий базы данных.
+        key_builder (KeyBuilder | None): Построитель строковых ключей.
+        cache_ttl (float): Время жизни записи в кэше, секунды. Ограничивает,
+            насколько устаревшим может быть состояние, измененное другим
+            процессом; 0 отключает кэш.
+        cache_size (int): Максимальное количество записей в кэше.
+    """
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = async_session,
+        key_builder: KeyBuilder | None = None,
+        cache_ttl: float = 60.0,
+        cache_size: int = 10000
+    ):
+        """
+        Инициализирует хранилище.
+
+        Args:
+            session_factory (Callable[[], AsyncSession]): Фабрика сессий базы данных.
+            key_builder (KeyBuilder | None): Построитель строковых ключей.
+            cache_ttl (float): Время жизни записи в кэше, секунды (0 - без кэша).
+            cache_size (int): Максимальное количество записей в кэше.
+        """
+        self.session_factory = session_factory
+        self.key_builder = key_builder or DefaultKeyBuilder(with_destiny=True)
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self._cache: OrderedDict[str, _CachedRecord] = OrderedDict()
+
+    async def set_state(self, key: StorageKey, state: StateType = None) -> None:
+        """
+        Устанавливает состояние для ключа.
+
+        Args:
+            key (StorageKey): Ключ контекста FSM.
+            state (StateType): Новое состояние.
+        """
+        record = await self._edit_record(key)
+        record.state = state.state if isinstance(state, State) else state
+        await self._write(self.key_builder.build(key), record)
+
+    async def get_state(self, key: StorageKey) -> Optional[str]:
+        """
+        Возвращает состояние для ключа.
+
+        Args:
+            key (StorageKey): Ключ контекста FSM.
+
+        Returns:
+            Optional[str]: Текущее состояние.
+        """
+        return (await self._get_record(key)).state
+
+    async def set_data(self, key: StorageKey, data: Dict[str, Any]) -> None:
+        """
+        Устанавливает данные для ключа.
+
+        Args:
+            key (StorageKey): Ключ контекста FSM.
+            data (Dict[str, Any]): Новые данные.
+        """
+        record = await self._edit_record(key)
+        record.data = copy.deepcopy(data)
+        await self._write(self.key_builder.build(key), record)
+
+    async def get_data(self, key: StorageKey) -> Dict[str, Any]:
+        """
+        Возвращает копию данных для ключа.
+
+        Args:
+            key (StorageKey): Ключ контекста FSM.
+
+        Returns:
+            Dict[str, Any]: Данные контекста.
+        """
+        return copy.deepcopy((await self._get_record(key)).data)
+
+    async def close(self) -> None:
+        """
+        Очищает кэш. Сессии базы данных закрываются после каждого запроса.
+        """
+        self._cache.clear()
+
+    @asynccontextmanager
+    async def coalesce(self) -> AsyncGenerator[None, None]:
+        """
+        Объединяет все записи внутри блока в один upsert при выходе из него.
+
+        Предназначен для оборачивания обработки одного обновления.
+        Вложенные блоки используют внешний.
+        """
+        if _pending_writes.get() is not None:
+            yield
+            return
+
+        pending: Dict[str, _CachedRecord] = {}
+        token = _pending_writes.set(pending)
+        try:
+            yield
+        finally:
+            _pending_writes.reset(token)
+            await self.flush(pending)
+
+    async def flush(self, records: Dict[str, _CachedRecord]) -> None:
+        """
+        Сохраняет записи в базу данных и после успешного сохранения
+        обновляет кэш. При ошибке записи удаляются из кэша, чтобы следующее
+        чтение получило состояние из базы.
+
+        Пустые записи (без состояния и данных) удаляются.
+
+        Args:
+            records (Dict[str, _CachedRecord]): Записи по строковым ключам.
+        """
+        if not records:
+            return
+
+        upserts = []
+        deletes = []
+        for key, record in records.items():
+            if record.state is None and not record.data:
+                deletes.append(key)
+            else:
+                upserts.append(FSMStateSchema(key=key, state=record.state, data=record.data))
+
+        try:
+            async with self.session_factory() as session:
+                data_manager = FSMDataManager(session)
+                await data_manager.upsert_states(upserts)
+                await data_manager.delete_states(deletes)
+        except BaseException:
+            for key in records:
+                self._cache.pop(key, None)
+            raise
+
+        now = time.monotonic()
+        for key, record in records.items():
+            record.loaded_at = now
+            self._remember(key, record)
+
+    async def _get_record(self, key: StorageKey) -> _CachedRecord:
+        """
+        Возвращает запись из кэша, при промахе или устаревании читает из базы.
+
+        Args:
+            key (StorageKey): Ключ контекста FSM.
+
+        Returns:
+            _CachedRecord: Запись кэша.
+        """
+        string_key = self.key_builder.build(key)
+        pending = _pending_writes.get()
+        if pending is not None and string_key in pending:
+            return pending[string_key]
+
+        record = self._cache.get(string_key)
+        if record is not None and time.monotonic() - record.loaded_at < self.cache_ttl:
+            self._cache.move_to_end(string_key)
+            return record
+
+        async with self.session_factory() as session:
+            stored = await FSMDataManager(session).get_state(string_key)
+
+        record = _CachedRecord(
+            state=stored.state if stored else None,
+            data=stored.data if stored else {}
+        )
+        self._remember(string_key, record)
+        return record
+
+    async def _edit_record(self, key: StorageKey) -> _CachedRecord:
+        """
+        Возвращает запись для изменения: отложенную запись текущего
+        обновления или копию записи кэша, чтобы кэш не менялся до сохранения.
+
+        Args:
+            key (StorageKey): Ключ контекста FSM.
+
+        Returns:
+            _CachedRecord: Изменяемая запись.
+        """
+        string_key = self.key_builder.build(key)
+        pending = _pending_writes.get()
+        if pending is not None and string_key in pending:
+            return pending[string_key]
+        # Данные не меняются на месте (set_data заменяет их копией),
+        # поэтому достаточно поверхностной копии
+        return dataclasses.replace(await self._get_record(key))
+
+    async def _write(self, string_key: str, record: _CachedRecord) -> None:
+        """
+        Фиксирует изменение записи: откладывает до конца обновления
+        или сразу сохраняет, если обработка идет вне `coalesce`.
+
+        Args:
+            string_key (str): Строковый ключ контекста FSM.
+            record (_CachedRecord): Измененная запись.
+        """
+        pending = _pending_writes.get()
+        if pending is not None:
+            pending[string_key] = record
+        else:
+            await self.flush({string_key: record})
+
+    def _remember(self, string_key: str, record: _CachedRecord) -> None:
+        """
+        Помещает запись в кэш с вытеснением самых старых записей.
+
+        Args:
+            string_key (str): Строковый ключ контекста FSM.
+            record (_CachedRecord): Запись кэша.
+        """
+        if self.cache_ttl <= 0:
+            return
+        self._cache[string_key] = record
+        self._cache.move_to_end(string_key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
@@ -1,7 +1,7 @@
 from aiogram import Router
-from . import main, help 
+from . import main, help, inline, moderation
 
-__all__ = ["main", "help"]
+__all__ = ["main", "help", "inline", "moderation"]
 
 def all_handlers() -> Router:
     router = Router()
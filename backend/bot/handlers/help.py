@@ -2,10 +2,10 @@ from aiogram import Router, F
 from aiogram.types import Message, CallbackQuery
 from aiogram.filters import Command
 from fluent.runtime import FluentLocalization
-from bot.keyboards.menu import MenuManager
+from bot.keyboards.menu import menu_manager
+from bot.utils.screens import screen_renderer
 
 router = Router()
-menu_manager = MenuManager()
 
 @router.message(Command("help"))
 async def cmd_help(message: Message, l10n: FluentLocalization):
@@ -19,9 +19,8 @@ async def cmd_help(message: Message, l10n: FluentLocalization):
         l10n (FluentLocalization): Локализация.
 
     """
-    keyboard = menu_manager.get_keyboard("help_menu", l10n)
-    text = menu_manager.get_menu_text("help_menu", l10n)
-    await message.answer(text, reply_markup=keyboard.as_markup())
+    menu = menu_manager.get("help_menu", l10n)
+    await screen_renderer.send(message, menu.text, menu.markup, menu.digest)
     
 @router.callback_query(lambda c: c.data == "menu_help")
 async def callback_help(callback_query: CallbackQuery, l10n: FluentLocalization):
@@ -34,9 +33,8 @@ async def callback_help(callback_query: CallbackQuery, l10n: FluentLocalization)
         callback_query (types.CallbackQuery): Запрос обратного вызова.
         l10n (FluentLocalization): Локализация.
     """
-    keyboard = menu_manager.get_keyboard("help_menu", l10n)
-    text = menu_manager.get_menu_text("help_menu", l10n)
-    await callback_query.message.edit_text(text, reply_markup=keyboard.as_markup())
+    menu = menu_manager.get("help_menu", l10n)
+    await screen_renderer.render(callback_query, menu.text, menu.markup, menu.digest)
     
 @router.callback_query(F.data == "help_usage")
 async def process_help_usage(callback_query: CallbackQuery, l10n: FluentLocalization):
@@ -48,9 +46,8 @@ async def process_help_usage(callback_query: CallbackQuery, l10n: FluentLocaliza
         callback_query (CallbackQuery): Колбэк от нажатия кнопки
         l10n (FluentLocalization): Локализация
     """
-    keyboard = menu_manager.get_keyboard("help_menu_usage", l10n)
-    text = menu_manager.get_menu_text("help_menu_usage", l10n)
-    await callback_query.message.edit_text(text, reply_markup=keyboard.as_markup())
+    menu = menu_manager.get("help_menu_usage", l10n)
+    await screen_renderer.render(callback_query, menu.text, menu.markup, menu.digest)
 
 @router.callback_query(F.data == "help_rules")
 async def process_help_rules(callback_query: CallbackQuery, l10n: FluentLocalization):
@@ -62,9 +59,8 @@ async def process_help_rules(callback_query: CallbackQuery, l10n: FluentLocaliza
         callback_query (CallbackQuery): Колбэк от нажатия кнопки
         l10n (FluentLocalization): Локализация для текстов
     """
-    keyboard = menu_manager.get_keyboard("help_menu_rules", l10n)
-    text = menu_manager.get_menu_text("help_menu_rules", l10n)
-    await callback_query.message.edit_text(text, reply_markup=keyboard.as_markup())
+    menu = menu_manager.get("help_menu_rules", l10n)
+    await screen_renderer.render(callback_query, menu.text, menu.markup, menu.digest)
 
 @router.callback_query(F.data == "menu_main")
 async def process_back_to_main(callback_query: CallbackQuery, l10n: FluentLocalization):
@@ -76,9 +72,8 @@ async def process_back_to_main(callback_query: CallbackQuery, l10n: FluentLocali
         callback_query (CallbackQuery): Колбэк от нажатия кнопки
         l10n (FluentLocalization): Локализация
     """
-    keyboard = menu_manager.get_keyboard("main_menu", l10n)
-    text = menu_manager.get_menu_text("main_menu", l10n)
-    await callback_query.message.edit_text(text, reply_markup=keyboard.as_markup())
+    menu = menu_manager.get("main_menu", l10n)
+    await screen_renderer.render(callback_query, menu.text, menu.markup, menu.digest)
     
 @router.callback_query(F.data == "menu_help")
 async def process_back_to_help(callback_query: CallbackQuery, l10n: FluentLocalization):
@@ -90,6 +85,5 @@ async def process_back_to_help(callback_query: CallbackQuery, l10n: FluentLocali
         callback_query (CallbackQuery): Колбэк от нажатия кнопки
         l10n (FluentLocalization): Локализация
     """
-    keyboard = menu_manager.get_keyboard("help_menu", l10n)
-    text = menu_manager.get_menu_text("help_menu", l10n)
-    await callback_query.message.edit_text(text, reply_markup=keyboard.as_markup())
\ No newline at end of file
+    menu = menu_manager.get("help_menu", l10n)
+    await screen_renderer.render(callback_query, menu.text, menu.markup, menu.digest)
\ No newline at end of file
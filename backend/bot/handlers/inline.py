@@ -0,0 +1,36 @@
+"""
+Модуль обработчиков inline-режима бота.
+
+Обработчик `inline_search` отвечает на запросы вида `@bot <запрос>`
+опубликованными постами. Результаты берутся из кэша `inline_search`,
+и при попадании в кэш сессия базы данных не используется (сессия
+SQLAlchemy получает соединение только при первом запросе).
+"""
+from aiogram import Router
+from aiogram.types import InlineQuery
+from sqlalchemy.ext.asyncio import AsyncSession
+from bot.core.instance import inline_search
+from shared.services.posts import PostDataManager
+from settings import settings
+
+router = Router()
+
+@router.inline_query()
+async def inline_search_posts(inline_query: InlineQuery, session: AsyncSession):
+    """
+    Обработчик inline-запроса.
+    Ищет опубликованные посты по названию и содержанию.
+
+    Args:
+        inline_query (InlineQuery): Inline-запрос пользователя.
+        session (AsyncSession): Сессия базы данных.
+    """
+    results = await inline_search.search(
+        inline_query.query,
+        PostDataManager(session).search_published
+    )
+    await inline_query.answer(
+        results,
+        cache_time=settings.inline_cache_time,
+        is_personal=False
+    )
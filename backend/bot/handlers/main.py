@@ -13,10 +13,10 @@ from aiogram import Router
 from aiogram.types import Message
 from aiogram.filters import Command
 from fluent.runtime import FluentLocalization
-from bot.keyboards.menu import MenuManager
+from bot.keyboards.menu import menu_manager
+from bot.utils.screens import screen_renderer
 
 router = Router()
-menu_manager = MenuManager()
 
 @router.message(Command("start"))
 async def cmd_start(message: Message, l10n: FluentLocalization):
@@ -30,6 +30,5 @@ async def cmd_start(message: Message, l10n: FluentLocalization):
         l10n (FluentLocalization): Локализация.
 
     """
-    keyboard = menu_manager.get_keyboard("main_menu", l10n)
-    text = menu_manager.get_menu_text("main_menu", l10n)
-    await message.answer(text, reply_markup=keyboard.as_markup())
+    menu = menu_manager.get("main_menu", l10n)
+    await screen_renderer.send(message, menu.text, menu.markup, menu.digest)
@@ -0,0 +1,132 @@
+"""
+Модуль обработчиков модерации постов в боте.
+
+Команда /moderate выдает модератору первый пост из очереди модерации,
+а кнопки под постом публикуют, отклоняют или пропускают его и сразу
+показывают следующий пост в том же сообщении. Посты берутся из той же
+очереди, что и в REST API, поэтому модераторы в боте и в приложении не
+получают одни и те же посты.
+
+Обработчики:
+- cmd_moderate: Показывает первый пост из очереди.
+- callback_moderate: Применяет решение и показывает следующий пост.
+"""
+import html
+from aiogram import Router
+from aiogram.types import Message, CallbackQuery, InlineKeyboardMarkup
+from aiogram.filters import Command
+from fluent.runtime import FluentLocalization
+from sqlalchemy.ext.asyncio import AsyncSession
+from bot.keyboards.moderation import ModerationCallback, get_moderation_keyboard
+from bot.utils.screens import screen_renderer
+from shared.schemas.users import UserSchema, UserRole
+from shared.schemas.moderation import ModerationDecision
+from shared.services.moderation import ModerationService
+
+router = Router()
+
+MODERATOR_ROLES = (UserRole.ADMIN, UserRole.MODERATOR)
+
+# Уведомления о принятом решении по действию кнопки
+DECISION_NOTICES = {
+    "approve": "moderation-approved",
+    "reject": "moderation-rejected"
+}
+
+
+async def next_post(
+    service: ModerationService,
+    moderator_id: int,
+    l10n: FluentLocalization,
+    after_id: int = 0
+) -> tuple[str, InlineKeyboardMarkup | None]:
+    """
+    Закрепляет за модератором следующий пост и возвращает его текст и клавиатуру.
+
+    Args:
+        service (ModerationService): Сервис модерации.
+        moderator_id (int): ID модератора.
+        l10n (FluentLocalization): Локализация.
+        after_id (int): Выдавать только посты с ID больше указанного.
+
+    Returns:
+        tuple[str, InlineKeyboardMarkup | None]: Текст сообщения и клавиатура
+            (None, если очередь пуста).
+    """
+    posts = await service.claim_posts(moderator_id, limit=1, after_id=after_id)
+    if not posts:
+        return l10n.format_value("moderation-empty"), None
+    post = posts[0]
+    text = "\n\n".join((
+        l10n.format_value("moderation-post-title", {"id": post.id}),
+        f"<b>{html.escape(post.name)}</b>",
+        html.escape(post.content)
+    ))
+    return text, get_moderation_keyboard(post.id, l10n)
+
+
+@router.message(Command("moderate"))
+async def cmd_moderate(
+    message: Message,
+    l10n: FluentLocalization,
+    session: AsyncSession,
+    user: UserSchema | None = None
+):
+    """
+    Обработчик команды /moderate.
+    Показывает модератору первый пост из очереди модерации.
+
+    Args:
+        message (Message): Сообщение пользователя.
+        l10n (FluentLocalization): Локализация.
+        session (AsyncSession): Сессия базы данных.
+        user (UserSchema | None): Пользователь из `UserMiddleware`.
+    """
+    if user is None or user.role not in MODERATOR_ROLES:
+        await message.answer(l10n.format_value("moderation-forbidden"))
+        return
+    text, markup = await next_post(ModerationService(session), user.id, l10n)
+    await screen_renderer.send(message, text, markup)
+
+
+@router.callback_query(ModerationCallback.filter())
+async def callback_moderate(
+    callback_query: CallbackQuery,
+    callback_data: ModerationCallback,
+    l10n: FluentLocalization,
+    session: AsyncSession,
+    user: UserSchema | None = None
+):
+    """
+    Обработчик кнопок модерации.
+    Публикует, отклоняет или пропускает пост и показывает следующий.
+
+    Args:
+        callback_query (CallbackQuery): Нажатие кнопки.
+        callback_data (ModerationCallback): Действие и ID поста.
+        l10n (FluentLocalization): Локализация.
+        session (AsyncSession): Сессия базы данных.
+        user (UserSchema | None): Пользователь из `UserMiddleware`.
+    """
+    if user is None or user.role not in MODERATOR_ROLES:
+        await callback_query.answer(l10n.format_value("moderation-forbidden"), show_alert=True)
+        return
+
+    service = ModerationService(session)
+    after_id = 0
+    if callback_data.action == "skip":
+        await service.release_posts(user.id, [callback_data.post_id])
+        notice = l10n.format_value("moderation-skipped")
+        after_id = callback_data.post_id
+    else:
+        result = await service.decide(
+            user.id,
+            [callback_data.post_id],
+            ModerationDecision(callback_data.action)
+        )
+        notice = l10n.format_value(
+            DECISION_NOTICES[callback_data.action] if result.updated else "moderation-expired"
+        )
+
+    text, markup = await next_post(service, user.id, l10n, after_id)
+    await screen_renderer.render(callback_query, text, markup, notice=notice)
@@ -1,44 +1,240 @@
+"""
+Модуль меню бота.
+
+Меню описаны в `menu.json` и не меняются во время работы, поэтому
+`MenuManager` один раз собирает каждую пару (меню, локаль) в готовый
+`CompiledMenu` - текст и `InlineKeyboardMarkup` - и дальше отдает их из
+неизменяемого кэша без построения клавиатуры и форматирования строк.
+
+При изменении `menu.json` или .ftl файлов кэш пересобирается (проверка
+времени изменения файлов выполняется не чаще `reload_interval` секунд).
+
+Все обработчики используют общий экземпляр `menu_manager`.
+"""
 import json
+import logging
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple
 from fluent.runtime import FluentLocalization
-from aiogram.types import WebAppInfo
+from aiogram.types import InlineKeyboardMarkup, WebAppInfo
 from aiogram.utils.keyboard import InlineKeyboardBuilder
+from bot.locales.localization import reload_localization
+from bot.utils.screens import screen_digest
+from settings import settings
+
+
+@dataclass(frozen=True)
+class CompiledMenu:
+    """
+    Собранное меню для одной локали.
+
+    Разметка используется всеми обработчиками совместно и не должна
+    изменяться.
+
+    Args:
+        text (str): Локализованный текст меню.
+        markup (InlineKeyboardMarkup): Клавиатура меню.
+        digest (int): Хэш экрана для `ScreenRenderer`, считается при сборке.
+    """
+    text: str
+    markup: InlineKeyboardMarkup
+    digest: int = field(init=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "digest", screen_digest(self.text, self.markup))
+
 
 class MenuManager:
-    def __init__(self, menu_path: str = 'bot/keyboards/menu.json'):
-        with open(
-            file=menu_path,
-            mode='r',
-            encoding='utf-8'
-        ) as f:
-            self.menu = json.load(f)
-    
+    """
+    Реестр собранных меню бота.
+
+    Args:
+        menu_path (Path): Путь к файлу описания меню.
+        locales_path (Path): Каталог .ftl файлов локализации.
+        reload_interval (float): Минимальный интервал проверки изменения
+            файлов, секунды. 0 - без горячей перезагрузки.
+    """
+    def __init__(
+        self,
+        menu_path: Path = Path(__file__).parent / "menu.json",
+        locales_path: Path = Path(__file__).parent.parent / "locales",
+        reload_interval: float = 2.0
+    ):
+        """
+        Инициализирует реестр и загружает описание меню.
+
+        Args:
+            menu_path (Path): Путь к файлу описания меню.
+            locales_path (Path): Каталог .ftl файлов локализации.
+            reload_interval (float): Минимальный интервал проверки изменения файлов.
+        """
+        self.menu_path = Path(menu_path)
+        self.locales_path = Path(locales_path)
+        self.reload_interval = reload_interval
+        self.menu: Dict[str, Any] = {}
+        self._compiled: Mapping[Tuple[str, str], CompiledMenu] = MappingProxyType({})
+        self._localizations: Dict[str, FluentLocalization] = {}
+        self._mtimes: Dict[Path, float] = {}
+        self._checked_at = 0.0
+        self._load_menu()
+        self._mtimes = self._scan_mtimes()
+
+    def get(self, menu_id: str, l10n: FluentLocalization) -> CompiledMenu:
+        """
+        Возвращает собранное меню для локали объекта локализации.
+
+        Args:
+            menu_id (str): Идентификатор меню.
+            l10n (FluentLocalization): Локализация.
+
+        Returns:
+            CompiledMenu: Текст и клавиатура меню.
+
+        Raises:
+            ValueError: Если меню не найдено.
+        """
+        self._check_reload()
+        compiled = self._compiled.get((menu_id, l10n.locales[0]))
+        if compiled is None:
+            self.compile(l10n)
+            compiled = self._compiled.get((menu_id, l10n.locales[0]))
+            if compiled is None:
+                raise ValueError(l10n.format_value("err-menu-not-found", { "menu_id": menu_id } ))
+        return compiled
+
     def get_menu_text(self, menu_id: str, l10n: FluentLocalization) -> str:
-        """Получает локализованный текст меню из конфигурации"""
-        menu_item = self.menu.get(menu_id)
-        if not menu_item:
-            raise ValueError(l10n.format_value("err-menu-not-found", { "menu_id": menu_id } ))
-            
-        return l10n.format_value(menu_item['label'])
-    
-    def get_keyboard(self, menu_id: str, l10n: FluentLocalization) -> InlineKeyboardBuilder:
-        menu_item = self.menu.get(menu_id)
-        if not menu_item:
-            raise ValueError(l10n.format_value("err-menu-not-found", { "menu_id": menu_id } ))
-            
+        """
+        Возвращает локализованный текст меню.
+
+        Args:
+            menu_id (str): Идентификатор меню.
+            l10n (FluentLocalization): Локализация.
+
+        Returns:
+            str: Текст меню.
+        """
+        return self.get(menu_id, l10n).text
+
+    def get_keyboard(self, menu_id: str, l10n: FluentLocalization) -> InlineKeyboardMarkup:
+        """
+        Возвращает клавиатуру меню.
+
+        Args:
+            menu_id (str): Идентификатор меню.
+            l10n (FluentLocalization): Локализация.
+
+        Returns:
+            InlineKeyboardMarkup: Клавиатура меню.
+        """
+        return self.get(menu_id, l10n).markup
+
+    def compile(self, l10n: FluentLocalization) -> None:
+        """
+        Собирает все меню для локали объекта локализации.
+
+        Кэш заменяется целиком, поэтому читатели никогда не видят
+        частично собранное состояние.
+
+        Args:
+            l10n (FluentLocalization): Локализация.
+        """
+        locale = l10n.locales[0]
+        self._localizations[locale] = l10n
+        compiled = dict(self._compiled)
+        for menu_id, menu_item in self.menu.items():
+            compiled[(menu_id, locale)] = self._compile_menu(menu_item, l10n)
+        self._compiled = MappingProxyType(compiled)
+
+    @staticmethod
+    def _compile_menu(menu_item: Dict[str, Any], l10n: FluentLocalization) -> CompiledMenu:
+        """
+        Собирает одно меню.
+
+        Args:
+            menu_item (Dict[str, Any]): Описание меню из `menu.json`.
+            l10n (FluentLocalization): Локализация.
+
+        Returns:
+            CompiledMenu: Текст и клавиатура меню.
+        """
         builder = InlineKeyboardBuilder()
-        
+
         for button in menu_item['buttons']:
             kwargs = {
                 "text": l10n.format_value(button['label']),
                 "callback_data": button.get('callback_data')
             }
-            
+
             if "web_app" in button:
                 kwargs["web_app"] = WebAppInfo(url=button["web_app"])
             if "url" in button:
                 kwargs["url"] = button["url"]
-                
+
             builder.button(**kwargs)
-            
+
         builder.adjust(1)
-        return builder
\ No newline at end of file
+        return CompiledMenu(
+            text=l10n.format_value(menu_item['label']),
+            markup=builder.as_markup()
+        )
+
+    def _load_menu(self) -> None:
+        """
+        Загружает описание меню из файла.
+        """
+        with open(
+            file=self.menu_path,
+            mode='r',
+            encoding='utf-8'
+        ) as f:
+            self.menu = json.load(f)
+
+    def _scan_mtimes(self) -> Dict[Path, float]:
+        """
+        Возвращает время изменения файла меню и .ftl файлов.
+
+        Returns:
+            Dict[Path, float]: Время изменения по путям файлов.
+        """
+        paths = [self.menu_path, *self.locales_path.glob("*/*.ftl")]
+        return {path: path.stat().st_mtime for path in paths if path.exists()}
+
+    def _check_reload(self) -> None:
+        """
+        Пересобирает меню, если изменились `menu.json` или .ftl файлы.
+        """
+        if not self.reload_interval:
+            return
+        now = time.monotonic()
+        if now - self._checked_at < self.reload_interval:
+            return
+        self._checked_at = now
+
+        mtimes = self._scan_mtimes()
+        if mtimes == self._mtimes:
+            return
+        changed = {path for path in mtimes.keys() | self._mtimes.keys()
+                   if mtimes.get(path) != self._mtimes.get(path)}
+        self._mtimes = mtimes
+
+        if self.menu_path in changed:
+            try:
+                self._load_menu()
+            except (OSError, ValueError) as e:
+                # Файл мог быть сохранен не полностью - оставляем прежние меню
+                logging.error("Ошибка перезагрузки меню: %s", e)
+                return
+        if any(path.suffix == ".ftl" for path in changed):
+            for l10n in self._localizations.values():
+                reload_localization(l10n)
+
+        self._compiled = MappingProxyType({})
+        for l10n in list(self._localizations.values()):
+            self.compile(l10n)
+
+
+# Общий реестр меню для всех обработчиков
+menu_manager = MenuManager(reload_interval=settings.menu_reload_interval)
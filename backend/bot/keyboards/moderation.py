@@ -0,0 +1,43 @@
+"""
+Модуль клавиатуры модерации постов.
+
+Кнопки содержат действие и ID поста в `ModerationCallback`, поэтому
+обработчику не нужно хранить состояние между нажатиями.
+"""
+from aiogram.filters.callback_data import CallbackData
+from aiogram.types import InlineKeyboardMarkup
+from aiogram.utils.keyboard import InlineKeyboardBuilder
+from fluent.runtime import FluentLocalization
+
+
+class ModerationCallback(CallbackData, prefix="mod"):
+    """
+    Данные кнопки модерации.
+
+    Args:
+        action (str): Действие: approve, reject или skip.
+        post_id (int): ID поста.
+    """
+    action: str
+    post_id: int
+
+
+def get_moderation_keyboard(post_id: int, l10n: FluentLocalization) -> InlineKeyboardMarkup:
+    """
+    Возвращает клавиатуру решения по посту.
+
+    Args:
+        post_id (int): ID поста.
+        l10n (FluentLocalization): Локализация.
+
+    Returns:
+        InlineKeyboardMarkup: Клавиатура с кнопками решения.
+    """
+    builder = InlineKeyboardBuilder()
+    for action in ("approve", "reject", "skip"):
+        builder.button(
+            text=l10n.format_value(f"moderation-{action}"),
+            callback_data=ModerationCallback(action=action, post_id=post_id)
+        )
+    builder.adjust(2, 1)
+    return builder.as_markup()
@@ -1,16 +1,231 @@
+"""
+Модуль локализации бота.
+
+Локали хранятся в каталогах `locales/<locale>/` с файлами `strings.ftl`
+и `errors.ftl`. Реестр `LocalizationRegistry` при запуске только смотрит,
+какие каталоги есть, а бандлы Fluent загружаются при первом обращении
+к локали, поэтому новые локали не замедляют старт.
+
+Классы:
+- CachedLocalization: `FluentLocalization` с кэшем строк без аргументов
+  и скомпилированными форматтерами сообщений.
+- LocalizationRegistry: Реестр локализаций с ленивой загрузкой.
+
+Функции:
+- setup_localization: Создает реестр локализаций.
+- reload_localization: Сбрасывает загруженные бандлы локализации.
+"""
 import logging
 from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence
 from fluent.runtime import FluentLocalization, FluentResourceLoader
-from bot.utils.plural import ru_plural
+from bot.utils.plural import get_plural
+
+# Форматтер сообщения: принимает аргументы и возвращает строку
+Formatter = Callable[[Optional[Dict[str, Any]]], str]
+
+RESOURCE_IDS = ["strings.ftl", "errors.ftl"]
+
+
+class CachedLocalization(FluentLocalization):
+    """
+    Локализация с кэшем форматирования.
+
+    Для каждого сообщения один раз находится бандл и шаблон, и дальше
+    сообщение форматируется готовым вызываемым объектом без перебора
+    бандлов. Строки без аргументов (тексты меню, описания команд)
+    форматируются один раз и дальше берутся из кэша.
+    """
+    def __init__(self, *args: Any, **kwargs: Any):
+        """
+        Инициализирует локализацию с пустыми кэшами.
+
+        Аргументы совпадают с `FluentLocalization`.
+        """
+        super().__init__(*args, **kwargs)
+        self._values: Dict[str, str] = {}
+        self._formatters: Dict[str, Formatter] = {}
+
+    @property
+    def locale(self) -> str:
+        """
+        Основная локаль.
+        """
+        return self.locales[0]
+
+    def format_value(self, msg_id: str, args: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Форматирует сообщение.
+
+        Args:
+            msg_id (str): Идентификатор сообщения.
+            args (Dict[str, Any] | None): Аргументы сообщения.
+
+        Returns:
+            str: Отформатированная строка или `msg_id`, если сообщения нет.
+        """
+        if not args:
+            value = self._values.get(msg_id)
+            if value is None:
+                value = self._values[msg_id] = self.formatter(msg_id)(None)
+            return value
+        return self.formatter(msg_id)(args)
+
+    def formatter(self, msg_id: str) -> Formatter:
+        """
+        Возвращает скомпилированный форматтер сообщения.
+
+        Args:
+            msg_id (str): Идентификатор сообщения.
+
+        Returns:
+            Formatter: Функция форматирования сообщения.
+        """
+        formatter = self._formatters.get(msg_id)
+        if formatter is None:
+            formatter = self._formatters[msg_id] = self._compile(msg_id)
+        return formatter
+
+    def reset(self) -> None:
+        """
+        Сбрасывает кэши и загруженные бандлы, чтобы перечитать .ftl файлы.
+        """
+        self._values.clear()
+        self._formatters.clear()
+        self._bundle_cache.clear()
+        self._bundle_it = self._iterate_bundles()
+
+    def _compile(self, msg_id: str) -> Formatter:
+        """
+        Находит сообщение в бандлах с учетом цепочки локалей.
+
+        Args:
+            msg_id (str): Идентификатор сообщения.
 
-def setup_localization(base_path: Path = Path(__file__).parent) -> FluentLocalization:
+        Returns:
+            Formatter: Функция форматирования сообщения.
+        """
+        for bundle in self._bundles():
+            if not bundle.has_message(msg_id):
+                continue
+            message = bundle.get_message(msg_id)
+            if not message.value:
+                continue
+            pattern = message.value
+            return lambda args, bundle=bundle, pattern=pattern: bundle.format_pattern(pattern, args)[0]
+        return lambda args: msg_id
+
+
+class LocalizationRegistry:
+    """
+    Реестр локализаций с ленивой загрузкой.
+
+    Args:
+        locales_path (Path): Каталог с локалями.
+        default_locale (str): Локаль по умолчанию и последняя в цепочке.
+        resource_ids (Sequence[str]): Имена .ftl файлов локали.
+    """
+    def __init__(
+        self,
+        locales_path: Path,
+        default_locale: str = "ru",
+        resource_ids: Sequence[str] = RESOURCE_IDS
+    ):
+        """
+        Инициализирует реестр и определяет доступные локали.
+
+        Args:
+            locales_path (Path): Каталог с локалями.
+            default_locale (str): Локаль по умолчанию.
+            resource_ids (Sequence[str]): Имена .ftl файлов локали.
+        """
+        self.locales_path = Path(locales_path)
+        self.default_locale = default_locale
+        self.resource_ids = list(resource_ids)
+        self.available = frozenset(
+            path.name for path in self.locales_path.iterdir()
+            if path.is_dir() and any((path / resource_id).exists() for resource_id in self.resource_ids)
+        )
+        self._loader = FluentResourceLoader(str(self.locales_path) + "/{locale}")
+        self._localizations: Dict[str, CachedLocalization] = {}
+
+    @property
+    def default(self) -> CachedLocalization:
+        """
+        Локализация по умолчанию.
+        """
+        return self.get(self.default_locale)
+
+    def resolve(self, language_code: Optional[str]) -> str:
+        """
+        Подбирает доступную локаль для кода языка.
+
+        Args:
+            language_code (str | None): Код языка, например "en-US".
+
+        Returns:
+            str: Доступная локаль или локаль по умолчанию.
+        """
+        if not language_code:
+            return self.default_locale
+        code = language_code.replace("_", "-").lower()
+        if code in self.available:
+            return code
+        base = code.split("-", 1)[0]
+        return base if base in self.available else self.default_locale
+
+    def get(self, language_code: Optional[str]) -> CachedLocalization:
+        """
+        Возвращает локализацию для кода языка, создавая ее при первом обращении.
+
+        Args:
+            language_code (str | None): Код языка.
+
+        Returns:
+            CachedLocalization: Локализация.
+        """
+        locale = self.resolve(language_code)
+        l10n = self._localizations.get(locale)
+        if l10n is None:
+            chain: List[str] = [locale] if locale == self.default_locale else [locale, self.default_locale]
+            l10n = self._localizations[locale] = CachedLocalization(
+                chain,
+                self.resource_ids,
+                self._loader,
+                functions={'PLURAL': get_plural(locale)}
+            )
+            logging.info("Загружена локаль %s", locale)
+        return l10n
+
+
+def setup_localization(base_path: Path = Path(__file__).parent.parent, default_locale: str = "ru") -> LocalizationRegistry:
+    """
+    Создает реестр локализаций.
+
+    Args:
+        base_path (Path): Каталог бота, содержащий `locales`.
+        default_locale (str): Локаль по умолчанию.
+
+    Returns:
+        LocalizationRegistry: Реестр локализаций.
+    """
     logging.info("""Loading localization from %s""", base_path)
-    locales_path = base_path.joinpath("locales")
-    l10n_loader = FluentResourceLoader(str(locales_path) + "/{locale}")
-    
-    return FluentLocalization(
-        ["ru"],
-        ["strings.ftl", "errors.ftl"],
-        l10n_loader,
-        functions={'PLURAL': ru_plural}
-    )
\ No newline at end of file
+    return LocalizationRegistry(base_path.joinpath("locales"), default_locale)
+
+
+def reload_localization(l10n: FluentLocalization) -> None:
+    """
+    Сбрасывает загруженные бандлы локализации.
+
+    `FluentLocalization` читает .ftl файлы один раз и кэширует бандлы,
+    поэтому после изменения файлов кэш нужно сбросить: следующий вызов
+    `format_value` перечитает их с диска.
+
+    Args:
+        l10n (FluentLocalization): Объект локализации.
+    """
+    if isinstance(l10n, CachedLocalization):
+        l10n.reset()
+        return
+    l10n._bundle_cache.clear()
+    l10n._bundle_it = l10n._iterate_bundles()
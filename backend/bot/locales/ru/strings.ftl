@@ -12,4 +12,16 @@ help_usage_text = Инструкция по использованию...
 help_rules_text = Правила использования...
 
 start-description = Запускает бота.
-help-description = Запускает меню помощи.
\ No newline at end of file
+help-description = Запускает меню помощи.
+moderate-description = Очередь модерации постов.
+
+moderation-forbidden = ⛔ Команда доступна только модераторам.
+moderation-empty = ✅ Очередь модерации пуста.
+moderation-post-title = 📝 Пост #{ $id }
+moderation-approve = ✅ Опубликовать
+moderation-reject = ❌ Отклонить
+moderation-skip = ⏭ Пропустить
+moderation-approved = Пост опубликован
+moderation-rejected = Пост отклонен
+moderation-skipped = Пост возвращен в очередь
+moderation-expired = Пост уже обработан другим модератором
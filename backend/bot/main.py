@@ -1,33 +1,168 @@
 import logging
 
 from fastapi import FastAPI
+from fluent.runtime import FluentLocalization
 import asyncio
 from pathlib import Path
 from contextlib import asynccontextmanager
 
 
-from bot.core.instance import dp, bot
+from bot.core.instance import (
+    dp,
+    bot,
+    storage,
+    update_queue,
+    update_inbox,
+    lane_executor,
+    update_deduplicator,
+    broadcaster,
+    leader
+)
 from settings import settings, Environment
-from bot.middlewares import L10nMiddleware, UserMiddleware, DatabaseMiddleware
+from shared.database.session import engine
+from shared.feed import feed, BOT_UPDATES
+from bot.core.storage import DatabaseStorage
+from bot.middlewares import (
+    L10nMiddleware,
+    UserMiddleware,
+    DatabaseMiddleware,
+    LaneMiddleware,
+    FSMWriteMiddleware,
+    UpdateMetricsMiddleware,
+    HandlerMetricsMiddleware
+)
 from bot.handlers import all_handlers
-from .locales.localization import setup_localization
-from .commandsworker import set_bot_commands
-
-async def setup_webhook():
-    
-    logging.info("Webhook приступает к запуску по адресу: %s", settings.webhook_url)
-    
-    await bot.set_webhook(
-        url=settings.webhook_url,
-        allowed_updates=dp.resolve_used_update_types(),
-        drop_pending_updates=True
-    )
-    
-    logging.info("Webhook запущен: %s", settings.webhook_url)
-
-                    
+from bot.keyboards.menu import menu_manager
+from bot.core.startup import BotSetup, StartupTimer
+from .locales.localization import setup_localization, LocalizationRegistry
+from .commandsworker import get_bot_commands
+
+def setup_dispatcher(l10n_registry: LocalizationRegistry):
+    """
+    Подключает промежуточные слои и обработчики к диспетчеру.
+
+    Args:
+        l10n_registry (LocalizationRegistry): Реестр локализаций.
+    """
+    # Подключение промежуточных слоев
+    dp.update.outer_middleware(LaneMiddleware(lane_executor))
+    if settings.metrics_enabled:
+        dp.update.outer_middleware(UpdateMetricsMiddleware())
+        for update_type, observer in dp.observers.items():
+            if update_type not in ("update", "error"):
+                observer.middleware(HandlerMetricsMiddleware(update_type))
+    if isinstance(storage, DatabaseStorage):
+        dp.update.outer_middleware(FSMWriteMiddleware(storage))
+    dp.update.outer_middleware(dp.fsm)
+    dp.update.middleware(L10nMiddleware(l10n_registry))
+    dp.message.middleware(UserMiddleware())
+    dp.callback_query.middleware(UserMiddleware())
+    dp.update.middleware(DatabaseMiddleware())
+
+    # Подключение хендлеров
+    dp.include_router(all_handlers())
+
+async def start_bot(bot_setup: BotSetup, l10n: FluentLocalization, timer: StartupTimer):
+    """
+    Синхронизирует команды и вебхук с Bot API и в режиме разработки
+    запускает polling.
+
+    Выполняется в фоне, чтобы сетевые запросы не задерживали запуск
+    приложения.
+
+    Args:
+        bot_setup (BotSetup): Синхронизация команд и вебхука.
+        l10n (FluentLocalization): Локализация по умолчанию.
+        timer (StartupTimer): Замер этапов запуска.
+    """
+    polling = settings.environment == Environment.DEVELOPMENT
+    try:
+        with timer.phase("команды и вебхук"):
+            await bot_setup.sync(
+                commands=get_bot_commands(l10n),
+                webhook_url=None if polling else settings.webhook_url,
+                allowed_updates=dp.resolve_used_update_types()
+            )
+    except Exception as e:
+        logging.error("Ошибка настройки бота: %s", e)
+    logging.info("Бот готов за %.1f мс", timer.total() * 1000)
+
+    if polling:
+        logging.info("Polling started")
+        await dp.start_polling(bot, polling_timeout=30)
+
+async def run_leader_jobs():
+    """
+    Фоновые задачи ведущего процесса.
+
+    Рассылки, запущенные через API в любом воркере, выполняет только
+    ведущий: он периодически подхватывает рассылки в статусе RUNNING без
+    действующей аренды, в том числе прерванные остановкой предыдущего
+    ведущего. Рассылку, запущенную командой `broadcast start`, отправляет
+    процесс команды, пока держит аренду.
+    """
+    while True:
+        try:
+            await broadcaster.resume_all()
+        except Exception as e:
+            logging.error("Ошибка запуска рассылок: %s", e)
+        await asyncio.sleep(settings.leader_check_interval)
+
+
+class LeaderTasks:
+    """
+    Задачи, которые выполняет только ведущий процесс: установка команд
+    и вебхука, polling, обработка общей очереди обновлений и фоновые
+    задачи.
+
+    Args:
+        l10n (FluentLocalization): Локализация по умолчанию.
+        timer (StartupTimer): Замер этапов запуска.
+    """
+    def __init__(self, l10n: FluentLocalization, timer: StartupTimer):
+        self.l10n = l10n
+        self.timer = timer
+        self.tasks: list[asyncio.Task] = []
+
+    async def start(self):
+        """
+        Запускает задачи ведущего.
+
+        Кэш FSM очищается: пока процесс не был ведущим, состояния
+        изменял другой процесс.
+        """
+        if isinstance(storage, DatabaseStorage):
+            await storage.close()
+        bot_setup = BotSetup(bot, Path(settings.bot_state_file))
+        self.tasks = [
+            asyncio.create_task(start_bot(bot_setup, self.l10n, self.timer)),
+            asyncio.create_task(run_leader_jobs()),
+        ]
+        if update_inbox is not None:
+            feed.listen(BOT_UPDATES, update_inbox.wake)
+            self.tasks.append(asyncio.create_task(update_inbox.run()))
+
+    async def stop(self):
+        """
+        Останавливает задачи ведущего.
+        """
+        if settings.environment == Environment.DEVELOPMENT:
+            try:
+                await dp.stop_polling()
+            except RuntimeError:
+                # Polling еще не запущен
+                pass
+        feed.listen(BOT_UPDATES, None)
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+        self.tasks = []
+        await broadcaster.stop()
+
+
 @asynccontextmanager
 async def lifespan(_app: FastAPI):
+    leader_tasks = None
     try:
         # Настройка логирования
         logging.basicConfig(
@@ -35,26 +170,41 @@ async def lifespan(_app: FastAPI):
             format="%(asctime)s - %(levelname)s - %(name)s - %(message)s"
         )
         
+        timer = StartupTimer()
+
         # Установка локализации
-        l10n = setup_localization(Path(__file__).parent)
+        with timer.phase("локализация"):
+            l10n_registry = setup_localization(Path(__file__).parent, settings.default_locale)
+            l10n = l10n_registry.default
+
+        # Сборка меню до приема первых обновлений
+        with timer.phase("меню"):
+            menu_manager.compile(l10n)
      
-        # Подключение промежуточных слоев
-        dp.update.middleware(L10nMiddleware(l10n))
-        dp.message.middleware(UserMiddleware())
-        dp.update.middleware(DatabaseMiddleware())
-
-        # Подключение хендлеров
-        dp.include_router(all_handlers())
-
-        # Установка команд
-        await set_bot_commands(bot, l10n)
-      
-        # Запуск бота
-        if settings.environment == Environment.DEVELOPMENT:
-            asyncio.create_task(dp.start_polling(bot, polling_timeout=30))
-            logging.info("Polling started")
-        else:
-            asyncio.create_task(setup_webhook())
+        # Подключение промежуточных слоев и хендлеров
+        with timer.phase("диспетчер"):
+            setup_dispatcher(l10n_registry)
+
+        # Запуск воркеров очереди обновлений вебхука
+        await update_deduplicator.start(settings.update_dedup_flush_interval)
+        update_queue.start()
+
+        # Лента событий постов: брокер для передачи событий между воркерами
+        with timer.phase("лента событий"):
+            await feed.start(
+                engine,
+                backend=settings.feed_backend,
+                channel=settings.feed_channel,
+                socket_dir=Path(settings.feed_socket_dir),
+                workers=settings.api_workers
+            )
+
+        # Вебхук, polling, обработка обновлений и рассылки - только в
+        # ведущем процессе: при нескольких воркерах его выбирает блокировка,
+        # и при падении ведущего роль автоматически переходит к другому
+        # воркеру
+        leader_tasks = LeaderTasks(l10n, timer)
+        leader.start(on_elected=leader_tasks.start, on_demoted=leader_tasks.stop)
             
         yield
         
@@ -63,7 +213,15 @@ async def lifespan(_app: FastAPI):
         raise
     finally:
         try:
-            await bot.delete_webhook(drop_pending_updates=True)
+            await update_queue.stop(settings.webhook_drain_timeout)
+            await lane_executor.stop(settings.webhook_drain_timeout)
+            await update_deduplicator.stop()
+            await leader.stop()
+            if leader_tasks is not None:
+                await leader_tasks.stop()
+            await feed.stop()
+            # Вебхук не удаляется: пока процесс перезапускается, Telegram
+            # хранит обновления и доставит их новому процессу
             await bot.session.close()
             logging.info("Бот остановлен")
         except Exception as e:
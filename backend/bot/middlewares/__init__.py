@@ -1,9 +1,16 @@
 from .l10n import L10nMiddleware
 from .user import UserMiddleware
 from .db import DatabaseMiddleware
+from .lanes import LaneMiddleware
+from .fsm import FSMWriteMiddleware
+from .metrics import UpdateMetricsMiddleware, HandlerMetricsMiddleware
 
 __all__ = [
     "L10nMiddleware",
     "UserMiddleware", 
-    "DatabaseMiddleware"
+    "DatabaseMiddleware",
+    "LaneMiddleware",
+    "FSMWriteMiddleware",
+    "UpdateMetricsMiddleware",
+    "HandlerMetricsMiddleware"
 ]
\ No newline at end of file
@@ -0,0 +1,47 @@
+"""
+Модуль для определения промежуточного слоя объединения записей FSM.
+
+Этот модуль содержит класс `FSMWriteMiddleware`, который оборачивает
+обработку одного обновления в `DatabaseStorage.coalesce`. Все вызовы
+`set_state`, `set_data` и `update_data` внутри обработчика попадают
+в кэш хранилища, а в базу данных уходят одним upsert после завершения
+обработки.
+"""
+from typing import Any, Awaitable, Callable, Dict
+from aiogram import BaseMiddleware
+from aiogram.types import TelegramObject
+from bot.core.storage import DatabaseStorage
+
+
+class FSMWriteMiddleware(BaseMiddleware):
+    """
+    Промежуточный слой, объединяющий записи FSM в рамках одного обновления.
+
+    Атрибуты:
+        storage (DatabaseStorage): Хранилище состояний FSM.
+    """
+    def __init__(self, storage: DatabaseStorage):
+        """
+        Инициализирует промежуточный слой с заданным хранилищем.
+
+        :param storage: Хранилище состояний FSM.
+        """
+        self.storage = storage
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any]
+    ) -> Any:
+        """
+        Обрабатывает обновление и сохраняет накопленные изменения FSM.
+
+        :param handler: Следующий обработчик в цепочке.
+        :param event: Входящее обновление.
+        :param data: Контекст данных, передаваемый в обработчик.
+
+        :return: Результат выполнения обработчика.
+        """
+        async with self.storage.coalesce():
+            return await handler(event, data)
@@ -6,14 +6,15 @@
 наследуется от `BaseMiddleware` библиотеки aiogram и позволяет
 доступ к локализованным строкам в обработчиках сообщений.
 
-Класс `L10nMiddleware` включает в себя методы для инициализации
-локализации и обработки входящих сообщений.
+Локаль выбирается по `language_code` пользователя Telegram. Сохраненная
+пользователем локаль применяется позже, в `UserMiddleware`, через
+реестр локализаций из контекста (`l10n_registry`).
 """
 from typing import Callable, Dict, Any, Awaitable
 
 from aiogram import BaseMiddleware
-from aiogram.types import Message
-from fluent.runtime import FluentLocalization
+from aiogram.types import Message, User
+from bot.locales.localization import LocalizationRegistry
 
 
 class L10nMiddleware(BaseMiddleware):
@@ -25,15 +26,15 @@ class L10nMiddleware(BaseMiddleware):
     локализованные строки в ответах бота.
 
     Атрибуты:
-        l10n_object (FluentLocalization): Объект локализации для работы с локализованными строками.
+        registry (LocalizationRegistry): Реестр локализаций.
     """
-    def __init__(self, l10n_object: FluentLocalization):
+    def __init__(self, registry: LocalizationRegistry):
         """
-        Инициализирует промежуточный слой с заданным объектом локализации.
+        Инициализирует промежуточный слой с заданным реестром локализаций.
 
-        :param l10n_object: Объект локализации для использования в обработчиках.
+        :param registry: Реестр локализаций.
         """
-        self.l10n_object = l10n_object
+        self.registry = registry
 
     async def __call__(
         self,
@@ -50,5 +51,7 @@ class L10nMiddleware(BaseMiddleware):
         
         :return: Результат выполнения обработчика.
         """
-        data["l10n"] = self.l10n_object
-        await handler(event, data)
\ No newline at end of file
+        user: User | None = data.get("event_from_user")
+        data["l10n_registry"] = self.registry
+        data["l10n"] = self.registry.get(user.language_code if user else None)
+        return await handler(event, data)
@@ -0,0 +1,61 @@
+"""
+Модуль для определения промежуточного слоя маршрутизации обновлений по полосам.
+
+Этот модуль содержит класс `LaneMiddleware` - внешний (outer) промежуточный
+слой для `dp.update`. Он перехватывает каждое обновление до фильтров и
+обработчиков и передает его в `ChatLaneExecutor` по ключу чата. Исполнитель
+затем повторно подает обновление в диспетчер с пометкой, и на этот раз
+промежуточный слой пропускает его дальше по цепочке.
+
+Благодаря этому упорядочивание по чатам работает одинаково для
+`start_polling` в разработке и для очереди вебхука в продакшене.
+"""
+from typing import Any, Awaitable, Callable, Dict
+from aiogram import BaseMiddleware
+from aiogram.dispatcher.middlewares.user_context import EVENT_CONTEXT_KEY
+from aiogram.types import TelegramObject
+from bot.core.lanes import ChatLaneExecutor, LANE_DISPATCHED_KEY
+
+
+class LaneMiddleware(BaseMiddleware):
+    """
+    Промежуточный слой, направляющий обновления в полосы по чатам.
+
+    Атрибуты:
+        executor (ChatLaneExecutor): Исполнитель полос.
+    """
+    def __init__(self, executor: ChatLaneExecutor):
+        """
+        Инициализирует промежуточный слой с заданным исполнителем.
+
+        :param executor: Исполнитель полос.
+        """
+        self.executor = executor
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any]
+    ) -> Any:
+        """
+        Передает обновление в полосу или пропускает уже направленное.
+
+        :param handler: Следующий обработчик в цепочке.
+        :param event: Входящее обновление.
+        :param data: Контекст данных, передаваемый в обработчик.
+
+        :return: Результат выполнения обработчика или None, если обновление
+            поставлено в полосу.
+        """
+        if data.get(LANE_DISPATCHED_KEY):
+            return await handler(event, data)
+
+        event_context = data.get(EVENT_CONTEXT_KEY)
+        key = None
+        if event_context is not None:
+            key = event_context.chat_id
+            if key is None:
+                key = event_context.user_id
+
+        await self.executor.submit(key, data["bot"], event)
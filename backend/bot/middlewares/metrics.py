@@ -0,0 +1,115 @@
+"""
+Модуль промежуточных слоев метрик бота.
+
+`UpdateMetricsMiddleware` - внешний (outer) слой `dp.update`: считает
+обновления по типу и результату, время их обработки и количество
+обновлений в обработке. Подключается после `LaneMiddleware`, поэтому
+измеряет обработку обновления в полосе, а не постановку в очередь.
+
+`HandlerMetricsMiddleware` - внутренний слой наблюдателей событий
+(message, callback_query, ...). Только внутренние слои вызываются после
+выбора обработчика, поэтому время и ошибки записываются с метками
+обработчика и его модуля (в каждом модуле `bot.handlers` свой роутер).
+"""
+import time
+from typing import Any, Awaitable, Callable, Dict
+from aiogram import BaseMiddleware
+from aiogram.dispatcher.event.bases import UNHANDLED
+from aiogram.types import TelegramObject, Update
+from shared.metrics import (
+    bot_updates_total,
+    bot_update_duration,
+    bot_updates_in_flight,
+    bot_handler_duration,
+    bot_handler_errors_total,
+)
+
+
+class UpdateMetricsMiddleware(BaseMiddleware):
+    """
+    Промежуточный слой метрик обновлений.
+    """
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any]
+    ) -> Any:
+        """
+        Замеряет обработку обновления.
+
+        :param handler: Следующий обработчик в цепочке.
+        :param event: Входящее обновление.
+        :param data: Контекст данных, передаваемый в обработчик.
+        :return: Результат выполнения обработчика.
+        """
+        update_type = event.event_type if isinstance(event, Update) else type(event).__name__
+        bot_updates_in_flight.inc(update_type)
+        started = time.perf_counter()
+        status = "error"
+        try:
+            result = await handler(event, data)
+            status = "unhandled" if result is UNHANDLED else "ok"
+            return result
+        finally:
+            bot_update_duration.observe(time.perf_counter() - started, update_type)
+            bot_updates_in_flight.dec(update_type)
+            bot_updates_total.inc(update_type, status)
+
+
+class HandlerMetricsMiddleware(BaseMiddleware):
+    """
+    Промежуточный слой метрик обработчиков.
+
+    :param update_type: Тип события наблюдателя, к которому подключен слой.
+    """
+    def __init__(self, update_type: str):
+        """
+        Инициализирует слой для наблюдателя событий.
+
+        :param update_type: Тип события наблюдателя.
+        """
+        self.update_type = update_type
+        self._labels: Dict[Callable, tuple] = {}
+
+    async def __call__(
+        self,
+        handler: Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]],
+        event: TelegramObject,
+        data: Dict[str, Any]
+    ) -> Any:
+        """
+        Замеряет выполнение выбранного обработчика.
+
+        :param handler: Следующий обработчик в цепочке.
+        :param event: Событие.
+        :param data: Контекст данных; `data["handler"]` - выбранный обработчик.
+        :return: Результат выполнения обработчика.
+        """
+        handler_object = data.get("handler")
+        if handler_object is None:
+            return await handler(event, data)
+
+        labels = self._labels.get(handler_object.callback)
+        if labels is None:
+            labels = self._labels[handler_object.callback] = self._handler_labels(handler_object.callback)
+
+        started = time.perf_counter()
+        try:
+            return await handler(event, data)
+        except Exception:
+            bot_handler_errors_total.inc(*labels)
+            raise
+        finally:
+            bot_handler_duration.observe(time.perf_counter() - started, *labels)
+
+    def _handler_labels(self, callback: Callable) -> tuple:
+        """
+        Возвращает метки обработчика: имя функции, модуль и тип события.
+
+        :param callback: Функция обработчика.
+        :return: Значения меток (handler, router, update_type).
+        """
+        name = getattr(callback, "__qualname__", None) or type(callback).__name__
+        module = getattr(callback, "__module__", None) or "unknown"
+        return name, module.rsplit(".", 1)[-1], self.update_type
@@ -4,12 +4,16 @@
 Этот модуль содержит класс UserMiddleware, который реализует
 промежуточное ПО для обработки пользователей в приложении на
 основе библиотеки aiogram. Он отвечает за создание или получение
-пользователя в базе данных при получении сообщения от пользователя.
+пользователя в базе данных при получении сообщения или нажатии
+кнопки и передает его обработчикам в `data["user"]`.
+
+Если пользователь выбрал локаль, она заменяет локаль, определенную
+по языку Telegram в `L10nMiddleware`.
 """
 from typing import Any, Awaitable, Callable, Dict
 from aiogram import BaseMiddleware
-from aiogram.types import TelegramObject, Message
-from shared.services.users import AuthService
+from aiogram.types import TelegramObject, Message, CallbackQuery
+from shared.services.users import AuthDataManager
 
 class UserMiddleware(BaseMiddleware):
     """Промежуточное ПО для обработки пользователей.
@@ -28,8 +32,10 @@ class UserMiddleware(BaseMiddleware):
     ) -> Any:
         """Обрабатывает входящие события и вызывает обработчик.
 
-        Если событие является сообщением, то происходит попытка
-        получить или создать пользователя в базе данных.
+        Если событие является сообщением или нажатием кнопки, то
+        происходит попытка получить или создать пользователя в базе
+        данных. Пользователь передается обработчику как `user`, а его
+        сохраненная локаль подменяет `l10n` в контексте.
 
         Args:
             handler (Callable[[TelegramObject, Dict[str, Any]], Awaitable[Any]]): 
@@ -43,12 +49,15 @@ class UserMiddleware(BaseMiddleware):
         Returns:
             Any: Результат вызова обработчика.
         """
-        if isinstance(event, Message):
+        if isinstance(event, (Message, CallbackQuery)):
             session = data.get("session")
             if session:
-                user_service = AuthService(session)
-                await user_service.login_telegram_user(
+                user = await AuthDataManager(session).upsert_telegram_user(
                     chat_id=event.from_user.id,
                     username=event.from_user.username or str(event.from_user.id)
                 )
+                data["user"] = user
+                registry = data.get("l10n_registry")
+                if user.locale and registry:
+                    data["l10n"] = registry.get(user.locale)
         return await handler(event, data)
@@ -1,3 +1,7 @@
+from typing import Callable
+import babel
+import babel.plural
+
 def ru_plural(n: int) -> str:
     """
     Возвращает правильное окончание слова в зависимости от количества.
@@ -11,4 +15,18 @@ def ru_plural(n: int) -> str:
         return 'one'
     if 2 <= n <= 4:
         return 'few'
-    return 'many'
\ No newline at end of file
+    return 'many'
+
+def get_plural(locale: str) -> Callable[[int], str]:
+    """
+    Возвращает функцию PLURAL для локали.
+
+    Для русского используется `ru_plural`, для остальных локалей -
+    правила CLDR из babel. Неизвестная локаль получает русские правила.
+    """
+    if locale == "ru":
+        return ru_plural
+    try:
+        return babel.plural.to_python(babel.Locale.parse(locale.replace("-", "_")).plural_form)
+    except (ValueError, babel.UnknownLocaleError):
+        return ru_plural
@@ -0,0 +1,150 @@
+"""
+Модуль отрисовки экранов бота.
+
+Экран - это текст и клавиатура одного сообщения. Когда пользователь
+нажимает кнопку экрана, на котором он уже находится, `edit_text`
+отклоняется Telegram с ошибкой "message is not modified": это лишний
+запрос к API и лишняя обработка ошибки. `ScreenRenderer` хранит хэш
+последнего отправленного экрана для каждого сообщения и пропускает
+такие правки, только отвечая на нажатие кнопки.
+
+Классы:
+- ScreenRenderer: Отрисовка экранов с пропуском правок без изменений.
+"""
+import logging
+from collections import OrderedDict
+from typing import Tuple
+from aiogram.exceptions import TelegramBadRequest
+from aiogram.types import CallbackQuery, InlineKeyboardMarkup, Message
+from settings import settings
+
+# Ключ экрана: (ID чата, ID сообщения)
+ScreenKey = Tuple[int, int]
+
+
+def screen_digest(text: str, reply_markup: InlineKeyboardMarkup | None = None) -> int:
+    """
+    Возвращает хэш экрана.
+
+    Args:
+        text (str): Текст сообщения.
+        reply_markup (InlineKeyboardMarkup | None): Клавиатура сообщения.
+
+    Returns:
+        int: Хэш текста и клавиатуры.
+    """
+    markup = reply_markup.model_dump_json(exclude_none=True) if reply_markup else None
+    return hash((text, markup))
+
+
+class ScreenRenderer:
+    """
+    Отрисовка экранов с кэшем последних экранов сообщений.
+
+    Args:
+        max_size (int): Максимальное количество запоминаемых сообщений.
+    """
+    def __init__(self, max_size: int = 10000):
+        """
+        Инициализирует кэш экранов.
+
+        Args:
+            max_size (int): Максимальное количество запоминаемых сообщений.
+        """
+        self.max_size = max_size
+        self.skipped = 0
+        self._screens: OrderedDict[ScreenKey, int] = OrderedDict()
+
+    async def send(
+        self,
+        message: Message,
+        text: str,
+        reply_markup: InlineKeyboardMarkup | None = None,
+        digest: int | None = None
+    ) -> Message:
+        """
+        Отправляет экран новым сообщением и запоминает его.
+
+        Args:
+            message (Message): Сообщение, в чат которого отправляется экран.
+            text (str): Текст экрана.
+            reply_markup (InlineKeyboardMarkup | None): Клавиатура экрана.
+            digest (int | None): Готовый хэш экрана (см. `CompiledMenu.digest`).
+
+        Returns:
+            Message: Отправленное сообщение.
+        """
+        sent = await message.answer(text, reply_markup=reply_markup)
+        self._remember(
+            (sent.chat.id, sent.message_id),
+            screen_digest(text, reply_markup) if digest is None else digest
+        )
+        return sent
+
+    async def render(
+        self,
+        callback_query: CallbackQuery,
+        text: str,
+        reply_markup: InlineKeyboardMarkup | None = None,
+        digest: int | None = None,
+        notice: str | None = None
+    ) -> bool:
+        """
+        Показывает экран в сообщении с нажатой кнопкой и отвечает на нажатие.
+
+        Если сообщение уже показывает этот экран, правка не отправляется.
+
+        Args:
+            callback_query (CallbackQuery): Нажатие кнопки.
+            text (str): Текст экрана.
+            reply_markup (InlineKeyboardMarkup | None): Клавиатура экрана.
+            digest (int | None): Готовый хэш экрана (см. `CompiledMenu.digest`).
+            notice (str | None): Всплывающее уведомление в ответе на нажатие.
+
+        Returns:
+            bool: True, если сообщение было изменено.
+        """
+        message = callback_query.message
+        if not isinstance(message, Message):
+            # Сообщение недоступно (слишком старое) - править нечего
+            await callback_query.answer(notice)
+            return False
+
+        key = (message.chat.id, message.message_id)
+        if digest is None:
+            digest = screen_digest(text, reply_markup)
+        if self._screens.get(key) == digest:
+            self._screens.move_to_end(key)
+            self.skipped += 1
+            await callback_query.answer(notice)
+            return False
+
+        edited = True
+        try:
+            await message.edit_text(text, reply_markup=reply_markup)
+        except TelegramBadRequest as e:
+            # Экран мог быть показан до перезапуска, когда кэш был пуст
+            if "message is not modified" not in e.message:
+                raise
+            logging.debug("Экран сообщения %s уже показан", key)
+            edited = False
+        self._remember(key, digest)
+        await callback_query.answer(notice)
+        return edited
+
+    def _remember(self, key: ScreenKey, digest: int) -> None:
+        """
+        Запоминает хэш экрана сообщения, вытесняя самые старые записи.
+
+        Args:
+            key (ScreenKey): (ID чата, ID сообщения).
+            digest (int): Хэш экрана.
+        """
+        self._screens[key] = digest
+        self._screens.move_to_end(key)
+        while len(self._screens) > self.max_size:
+            self._screens.popitem(last=False)
+
+
+# Общий экземпляр для всех обработчиков меню
+screen_renderer = ScreenRenderer(settings.screen_cache_size)
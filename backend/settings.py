@@ -9,7 +9,7 @@
 подключения к базе данных.
 """
 from os import getenv
-from typing import List
+from typing import Dict, List
 from enum import Enum
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field, SecretStr, PostgresDsn
@@ -35,7 +35,7 @@ class Settings(BaseSettings):
     app_name: str = Field(default="SuckYearBot")
     app_version: str = Field(default="0.1.0")
     app_description: str = Field(default="SuckYearBot - бот, определяющий пользователя года")
-    api_versions: List[str] = ["v1"]
+    api_versions: List[str] = ["v1", "v2"]
     
     # Токен бота
     bot_token: SecretStr = SecretStr(
@@ -48,6 +48,128 @@ class Settings(BaseSettings):
     @property 
     def webhook_url(self) -> str:
         return f"{self.webhook_host}/api/v1/bot/webhook"
+
+    # Очередь обновлений вебхука
+    webhook_queue_size: int = Field(default=1000)
+    webhook_workers: int = Field(default=4)
+    webhook_drain_timeout: float = Field(default=10.0)
+    webhook_retry_after: int = Field(default=1)
+
+    # Количество воркеров API. При нескольких воркерах вебхук, polling и
+    # рассылки выполняет один ведущий процесс, выбранный блокировкой:
+    # advisory-блокировкой PostgreSQL или блокировкой файла ("auto" -
+    # по диалекту базы данных). Обновления вебхука любой воркер сохраняет
+    # в общую очередь в базе данных, а обрабатывает только ведущий
+    api_workers: int = Field(default=1)
+    leader_backend: str = Field(default="auto")
+    leader_lock_file: str = Field(default=".bot_leader.lock")
+    leader_lock_key: int = Field(default=720_431_001)
+    leader_check_interval: float = Field(default=5.0)
+
+    # Общая очередь входящих обновлений при нескольких воркерах: размер
+    # выборки, интервал опроса без сигнала и время хранения обработанных
+    # обновлений для дедупликации, секунды
+    update_inbox_batch_size: int = Field(default=100)
+    update_inbox_poll_interval: float = Field(default=1.0)
+    update_inbox_retention: float = Field(default=3600.0)
+
+    # Минимальный размер ответа для сжатия brotli/gzip, байты
+    compression_minimum_size: int = Field(default=1024)
+
+    # Лента событий постов (SSE/WebSocket /api/v1/feed): брокер между
+    # воркерами ("auto", "postgres" - LISTEN/NOTIFY, "local" - Unix-сокеты
+    # в feed_socket_dir, "memory" - только текущий процесс), буфер клиента,
+    # интервал объединения изменений рейтинга и heartbeat, секунды
+    feed_backend: str = Field(default="auto")
+    feed_channel: str = Field(default="suckyear_feed")
+    feed_socket_dir: str = Field(default=".feed")
+    feed_client_buffer: int = Field(default=256)
+    feed_coalesce_interval: float = Field(default=0.5)
+    feed_heartbeat: float = Field(default=15.0)
+
+    # Объединение одинаковых параллельных чтений постов (single-flight) и
+    # необязательный кэш результатов: время хранения, секунды (0 - без
+    # кэша) и максимум записей
+    read_singleflight: bool = Field(default=True)
+    read_cache_ttl: float = Field(default=0.0)
+    read_cache_size: int = Field(default=1000)
+
+    # Максимум ID в одном запросе пакетного получения (/posts/batch и т.п.)
+    batch_max_ids: int = Field(default=100)
+
+    # Максимальный размер страницы ленты с курсором (API v2)
+    cursor_page_max: int = Field(default=100)
+
+    # Cache-Control по имени эндпоинта для публичных данных (ETag и
+    # Last-Modified отдаются всегда) и для непубличных данных
+    cache_control: Dict[str, str] = Field(default={
+        "get_post": "public, max-age=60",
+        "get_posts": "public, max-age=15",
+    })
+    cache_control_private: str = Field(default="private, no-cache")
+
+    # Метрики Prometheus (GET /metrics) для бота и HTTP
+    metrics_enabled: bool = Field(default=True)
+
+    # Файл с отпечатками установленных команд и вебхука: при запуске
+    # вызовы setMyCommands/setWebhook выполняются, только если они изменились
+    bot_state_file: str = Field(default=".bot_state.json")
+
+    # Параллельная обработка обновлений (по полосам чатов)
+    update_max_concurrency: int = Field(default=32)
+    update_max_pending: int = Field(default=1000)
+
+    # Дедупликация обновлений по update_id
+    update_dedup_window: int = Field(default=4096)
+    update_dedup_path: str | None = Field(default=None)
+    update_dedup_flush_interval: float = Field(default=5.0)
+
+    # Хранилище состояний FSM: "database" или "memory"
+    fsm_storage: str = Field(default="database")
+    fsm_cache_ttl: float = Field(default=60.0)
+    fsm_cache_size: int = Field(default=10000)
+
+    # Ограничение скорости исходящих запросов к Bot API
+    send_global_rate: float = Field(default=30.0)
+    send_chat_rate: float = Field(default=1.0)
+    send_group_rate: float = Field(default=20 / 60)
+    send_chat_burst: float = Field(default=3.0)
+    send_max_retries: int = Field(default=3)
+
+    # Локаль бота по умолчанию (и последняя в цепочке поиска строк)
+    default_locale: str = Field(default="ru")
+
+    # Интервал проверки изменений menu.json и .ftl файлов, 0 - без перезагрузки
+    menu_reload_interval: float = Field(default=2.0)
+
+    # Количество сообщений, для которых запоминается последний показанный экран
+    screen_cache_size: int = Field(default=10000)
+
+    # Inline-поиск постов: время кэширования (и cache_time для Telegram)
+    inline_cache_time: int = Field(default=60)
+    inline_results_limit: int = Field(default=20)
+    inline_cache_size: int = Field(default=1000)
+
+    # Рассылки; срок аренды - время, через которое рассылку упавшего
+    # процесса продолжит другой процесс, секунды
+    broadcast_chunk_size: int = Field(default=100)
+    broadcast_concurrency: int = Field(default=20)
+    broadcast_lease_seconds: float = Field(default=60.0)
+
+    # Массовый импорт постов (NDJSON): строк в порции (одна транзакция),
+    # максимальная длина строки, байт, и максимум ошибок в отчете
+    import_chunk_size: int = Field(default=500)
+    import_max_line: int = Field(default=16384)
+    import_max_errors: int = Field(default=1000)
+
+    # Модерация: размер порции очереди, максимум постов в одном запросе
+    # и срок, на который пост закрепляется за модератором, секунды
+    moderation_batch_size: int = Field(default=10)
+    moderation_max_batch: int = Field(default=100)
+    moderation_lease_seconds: int = Field(default=600)
+
+    # Адрес локального (или тестового) Bot API сервера, None - api.telegram.org
+    bot_api_server: str | None = Field(default=None)
     
     # Токен для доступа к API
     auth_url: str = "token"
@@ -0,0 +1,16 @@
+from typing import Iterable
+from fastapi import HTTPException
+
+class InvalidFieldsError(HTTPException):
+    def __init__(self, unknown: Iterable[str], allowed: Iterable[str]):
+        super().__init__(
+            status_code=400,
+            detail=f"Неизвестные поля: {', '.join(unknown)}. Доступные поля: {', '.join(allowed)}"
+        )
+
+class InvalidCursorError(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=400,
+            detail="Некорректный курсор страницы"
+        )
@@ -0,0 +1,10 @@
+from fastapi import HTTPException
+from settings import settings
+
+class WebhookQueueFullError(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=429,
+            detail="Очередь обновлений переполнена, повторите позже",
+            headers={"Retry-After": str(settings.webhook_retry_after)}
+        )
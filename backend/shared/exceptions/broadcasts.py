@@ -0,0 +1,15 @@
+from fastapi import HTTPException
+
+class BroadcastNotFoundError(HTTPException):
+    def __init__(self, broadcast_id: int):
+        super().__init__(
+            status_code=404,
+            detail=f"Рассылка с ID {broadcast_id} не найдена"
+        )
+
+class BroadcastStateError(HTTPException):
+    def __init__(self, broadcast_id: int, status: str):
+        super().__init__(
+            status_code=409,
+            detail=f"Рассылка {broadcast_id} в статусе {status}, действие недоступно"
+        )
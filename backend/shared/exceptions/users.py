@@ -33,4 +33,11 @@ class AuthenticationError(HTTPException):
         super().__init__(
             status_code=401,
             detail="Неверные учетные данные, попробуйте снова"
-        )
\ No newline at end of file
+        )
+
+class ForbiddenError(HTTPException):
+    def __init__(self):
+        super().__init__(
+            status_code=403,
+            detail="Недостаточно прав"
+        )
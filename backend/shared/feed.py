@@ -0,0 +1,494 @@
+"""
+Модуль ленты событий постов.
+
+Веб-приложение раньше узнавало о новых постах и изменении рейтинга,
+опрашивая `/posts`. Теперь сервисы публикуют события в шину `feed`, а
+API раздает их клиентам по SSE или WebSocket (`/api/v1/feed`).
+
+- Публикация синхронная и не блокирует сервис: событие сразу
+  раскладывается по очередям подписчиков процесса или отправляется
+  брокеру в фоновой задаче.
+- Изменения рейтинга объединяются: за интервал
+  `settings.feed_coalesce_interval` по каждому посту отправляется только
+  последнее значение.
+- У каждого клиента ограниченный буфер. Непрочитанное изменение рейтинга
+  поста заменяется новым, а при переполнении буфер очищается и клиент
+  получает событие `reset`: ему нужно заново загрузить список постов.
+- При нескольких воркерах события передаются между процессами через
+  брокер: `LISTEN/NOTIFY` в PostgreSQL или, для других баз, датаграммы
+  через Unix-сокеты в общем каталоге. Брокер доставляет событие всем
+  процессам, включая отправителя.
+- Служебные события (например, `bot.updates` - сигнал ведущему процессу
+  о новых обновлениях бота) передаются тем же брокером, но клиентам не
+  раздаются: их получает обработчик, зарегистрированный через `listen`.
+
+Классы:
+- FeedEvent: Событие ленты.
+- FeedSubscription: Ограниченная очередь событий клиента.
+- PostgresFeedBroker: Передача событий через LISTEN/NOTIFY.
+- LocalFeedBroker: Передача событий через Unix-сокеты.
+- FeedBus: Шина событий процесса.
+
+Общая шина `feed` определена в конце модуля.
+"""
+import asyncio
+import json
+import logging
+import os
+import socket
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Hashable, Set
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from shared.metrics import feed_subscribers, feed_events_total, feed_overflows_total
+from settings import settings
+
+# Типы событий
+POST_STATUS = "post.status"
+POST_RATING = "post.rating"
+# Служебное событие: в таблице входящих обновлений бота есть новые записи
+BOT_UPDATES = "bot.updates"
+
+
+@dataclass(frozen=True)
+class FeedEvent:
+    """
+    Событие ленты.
+
+    Args:
+        type (str): Тип события (`post.status`, `post.rating`).
+        post_id (int): ID поста.
+        data (Dict[str, Any]): Данные события.
+    """
+    type: str
+    post_id: int
+    data: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def key(self) -> Hashable | None:
+        """
+        Ключ объединения: события с одинаковым ключом заменяют друг друга.
+        """
+        return (self.type, self.post_id) if self.type == POST_RATING else None
+
+    def to_json(self) -> str:
+        """
+        Возвращает событие в JSON.
+        """
+        return json.dumps(
+            {"type": self.type, "post_id": self.post_id, "data": self.data},
+            ensure_ascii=False,
+            separators=(",", ":"),
+            default=str
+        )
+
+    @classmethod
+    def from_json(cls, payload: str | bytes) -> "FeedEvent":
+        """
+        Восстанавливает событие из JSON.
+
+        Args:
+            payload (str | bytes): JSON события.
+
+        Returns:
+            FeedEvent: Событие.
+        """
+        value = json.loads(payload)
+        return cls(value["type"], value["post_id"], value.get("data") or {})
+
+
+class FeedSubscription:
+    """
+    Ограниченная очередь событий клиента.
+
+    Args:
+        maxsize (int): Максимум непрочитанных событий.
+    """
+    def __init__(self, maxsize: int):
+        """
+        Инициализирует пустую очередь.
+
+        Args:
+            maxsize (int): Максимум непрочитанных событий.
+        """
+        self.maxsize = maxsize
+        self.overflowed = False
+        self._events: OrderedDict[Hashable, FeedEvent] = OrderedDict()
+        self._ready = asyncio.Event()
+        self._sequence = 0
+
+    def put(self, event: FeedEvent) -> None:
+        """
+        Добавляет событие без ожидания.
+
+        Непрочитанное событие с тем же ключом заменяется на месте. Если
+        буфер заполнен, он очищается, и `get` вернет None.
+
+        Args:
+            event (FeedEvent): Событие.
+        """
+        if self.overflowed:
+            return
+        key = event.key
+        if key is None:
+            self._sequence += 1
+            key = self._sequence
+        if key not in self._events and len(self._events) >= self.maxsize:
+            self.overflowed = True
+            self._events.clear()
+            feed_overflows_total.inc()
+        else:
+            self._events[key] = event
+        self._ready.set()
+
+    async def get(self) -> FeedEvent | None:
+        """
+        Ожидает следующее событие.
+
+        Returns:
+            FeedEvent | None: Событие или None, если буфер переполнился
+                и клиенту нужно заново загрузить данные.
+        """
+        while not self._events and not self.overflowed:
+            self._ready.clear()
+            await self._ready.wait()
+        if self.overflowed:
+            return None
+        return self._events.popitem(last=False)[1]
+
+
+class PostgresFeedBroker:
+    """
+    Передача событий между процессами через `LISTEN/NOTIFY` PostgreSQL.
+
+    Уведомления слушает отдельное соединение asyncpg, отправка выполняется
+    через пул движка. NOTIFY доставляется и отправившему процессу.
+
+    Args:
+        engine (AsyncEngine): Движок базы данных PostgreSQL (asyncpg).
+        channel (str): Канал уведомлений.
+        on_event (Callable[[FeedEvent], None]): Обработчик полученного события.
+    """
+    def __init__(self, engine: AsyncEngine, channel: str, on_event: Callable[[FeedEvent], None]):
+        self.engine = engine
+        self.channel = channel
+        self.on_event = on_event
+        self._connection: AsyncConnection | None = None
+
+    async def start(self) -> None:
+        """
+        Открывает соединение и подписывается на канал.
+        """
+        self._connection = await self.engine.connect()
+        raw = await self._connection.get_raw_connection()
+        await raw.driver_connection.add_listener(self.channel, self._on_notify)
+
+    async def stop(self) -> None:
+        """
+        Отписывается от канала и закрывает соединение.
+        """
+        if self._connection is None:
+            return
+        try:
+            raw = await self._connection.get_raw_connection()
+            await raw.driver_connection.remove_listener(self.channel, self._on_notify)
+        except Exception:
+            pass
+        await self._connection.close()
+        self._connection = None
+
+    async def send(self, event: FeedEvent) -> None:
+        """
+        Отправляет событие всем процессам.
+
+        Args:
+            event (FeedEvent): Событие.
+        """
+        async with self.engine.connect() as connection:
+            await connection.execute(
+                text("SELECT pg_notify(:channel, :payload)"),
+                {"channel": self.channel, "payload": event.to_json()}
+            )
+            await connection.commit()
+
+    def _on_notify(self, _connection: Any, _pid: int, _channel: str, payload: str) -> None:
+        """
+        Обрабатывает уведомление asyncpg.
+        """
+        try:
+            self.on_event(FeedEvent.from_json(payload))
+        except (ValueError, KeyError) as e:
+            logging.error("Некорректное событие ленты: %s", e)
+
+
+class LocalFeedBroker:
+    """
+    Передача событий между процессами одной машины через Unix-сокеты.
+
+    Заменяет `LISTEN/NOTIFY`, если база данных не PostgreSQL: каждый
+    процесс слушает датаграммный сокет `<pid>.sock` в общем каталоге, а
+    событие отправляется во все сокеты каталога. Сокеты завершившихся
+    процессов удаляются при отправке.
+
+    Args:
+        directory (Path): Каталог сокетов.
+        on_event (Callable[[FeedEvent], None]): Обработчик полученного события.
+    """
+    def __init__(self, directory: Path, on_event: Callable[[FeedEvent], None]):
+        self.directory = Path(directory)
+        self.on_event = on_event
+        self._socket: socket.socket | None = None
+        self._path: Path | None = None
+
+    async def start(self) -> None:
+        """
+        Создает сокет процесса и начинает прием событий.
+        """
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._path = self.directory / f"{os.getpid()}.sock"
+        self._path.unlink(missing_ok=True)
+        self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._socket.bind(str(self._path))
+        self._socket.setblocking(False)
+        asyncio.get_running_loop().add_reader(self._socket.fileno(), self._on_readable)
+
+    async def stop(self) -> None:
+        """
+        Прекращает прием событий и удаляет сокет процесса.
+        """
+        if self._socket is None:
+            return
+        asyncio.get_running_loop().remove_reader(self._socket.fileno())
+        self._socket.close()
+        self._socket = None
+        self._path.unlink(missing_ok=True)
+
+    async def send(self, event: FeedEvent) -> None:
+        """
+        Отправляет событие во все сокеты каталога.
+
+        Args:
+            event (FeedEvent): Событие.
+        """
+        payload = event.to_json().encode()
+        for path in self.directory.glob("*.sock"):
+            try:
+                self._socket.sendto(payload, str(path))
+            except (ConnectionRefusedError, FileNotFoundError):
+                # Процесс завершился, не удалив сокет
+                path.unlink(missing_ok=True)
+            except BlockingIOError:
+                logging.warning("Процесс %s не успевает принимать события ленты", path.stem)
+
+    def _on_readable(self) -> None:
+        """
+        Читает все полученные датаграммы.
+        """
+        while True:
+            try:
+                payload = self._socket.recv(65536)
+            except (BlockingIOError, OSError):
+                return
+            try:
+                self.on_event(FeedEvent.from_json(payload))
+            except (ValueError, KeyError) as e:
+                logging.error("Некорректное событие ленты: %s", e)
+
+
+class FeedBus:
+    """
+    Шина событий постов процесса.
+
+    Args:
+        coalesce_interval (float): Интервал объединения изменений рейтинга, секунды.
+    """
+    def __init__(self, coalesce_interval: float = 0.5):
+        """
+        Инициализирует шину без брокера (только текущий процесс).
+
+        Args:
+            coalesce_interval (float): Интервал объединения изменений рейтинга.
+        """
+        self.coalesce_interval = coalesce_interval
+        self._subscribers: Set[FeedSubscription] = set()
+        self._broker: PostgresFeedBroker | LocalFeedBroker | None = None
+        self._ratings: Dict[int, int] = {}
+        self._flush: asyncio.TimerHandle | None = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._handlers: Dict[str, Callable[[FeedEvent], None]] = {}
+
+    async def start(
+        self,
+        engine: AsyncEngine,
+        backend: str = "auto",
+        channel: str = "feed",
+        socket_dir: Path = Path(".feed"),
+        workers: int = 1
+    ) -> None:
+        """
+        Подключает брокер для передачи событий между процессами.
+
+        Args:
+            engine (AsyncEngine): Движок базы данных.
+            backend (str): "auto", "postgres", "local" или "memory".
+                "auto" - PostgreSQL по диалекту базы, иначе Unix-сокеты при
+                нескольких воркерах и только текущий процесс при одном.
+            channel (str): Канал LISTEN/NOTIFY.
+            socket_dir (Path): Каталог сокетов локального брокера.
+            workers (int): Количество воркеров API.
+        """
+        if backend == "auto":
+            if engine.dialect.name == "postgresql":
+                backend = "postgres"
+            else:
+                backend = "local" if workers > 1 else "memory"
+        if backend == "postgres":
+            broker = PostgresFeedBroker(engine, channel, self._deliver)
+        elif backend == "local":
+            broker = LocalFeedBroker(socket_dir, self._deliver)
+        else:
+            return
+        try:
+            await broker.start()
+        except Exception as e:
+            logging.error("Брокер ленты (%s) недоступен, события только в процессе: %s", backend, e)
+            return
+        self._broker = broker
+        logging.info("Лента событий: брокер %s", backend)
+
+    async def stop(self) -> None:
+        """
+        Отправляет накопленные изменения рейтинга и отключает брокер.
+        """
+        if self._flush is not None:
+            self._flush.cancel()
+            self._flush_ratings()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._broker is not None:
+            await self._broker.stop()
+            self._broker = None
+
+    def listen(self, event_type: str, handler: Callable[[FeedEvent], None] | None) -> None:
+        """
+        Назначает обработчик служебных событий типа; такие события не
+        раздаются клиентам.
+
+        Args:
+            event_type (str): Тип события.
+            handler (Callable[[FeedEvent], None] | None): Обработчик;
+                None - снять обработчик.
+        """
+        if handler is None:
+            self._handlers.pop(event_type, None)
+        else:
+            self._handlers[event_type] = handler
+
+    def subscribe(self, maxsize: int) -> FeedSubscription:
+        """
+        Подписывает клиента на события.
+
+        Args:
+            maxsize (int): Размер буфера клиента.
+
+        Returns:
+            FeedSubscription: Очередь событий клиента.
+        """
+        subscription = FeedSubscription(maxsize)
+        self._subscribers.add(subscription)
+        feed_subscribers.inc()
+        return subscription
+
+    def unsubscribe(self, subscription: FeedSubscription) -> None:
+        """
+        Отписывает клиента.
+
+        Args:
+            subscription (FeedSubscription): Очередь событий клиента.
+        """
+        if subscription in self._subscribers:
+            self._subscribers.discard(subscription)
+            feed_subscribers.dec()
+
+    def publish(self, event: FeedEvent) -> None:
+        """
+        Публикует событие без ожидания.
+
+        Args:
+            event (FeedEvent): Событие.
+        """
+        if self._broker is None:
+            self._deliver(event)
+            return
+        task = asyncio.ensure_future(self._send(event))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def publish_status(self, post_id: int, status: str) -> None:
+        """
+        Публикует изменение статуса поста (в том числе публикацию).
+
+        Args:
+            post_id (int): ID поста.
+            status (str): Новый статус.
+        """
+        self.publish(FeedEvent(POST_STATUS, post_id, {"status": status}))
+
+    def publish_rating(self, post_id: int, rating: int) -> None:
+        """
+        Публикует рейтинг поста с объединением частых изменений.
+
+        Args:
+            post_id (int): ID поста.
+            rating (int): Текущий рейтинг.
+        """
+        self._ratings[post_id] = rating
+        if self._flush is None:
+            self._flush = asyncio.get_running_loop().call_later(
+                self.coalesce_interval,
+                self._flush_ratings
+            )
+
+    def _flush_ratings(self) -> None:
+        """
+        Публикует накопленные рейтинги, по одному событию на пост.
+        """
+        self._flush = None
+        ratings, self._ratings = self._ratings, {}
+        for post_id, rating in ratings.items():
+            self.publish(FeedEvent(POST_RATING, post_id, {"rating": rating}))
+
+    async def _send(self, event: FeedEvent) -> None:
+        """
+        Отправляет событие брокеру; при ошибке доставляет его только в процесс.
+
+        Args:
+            event (FeedEvent): Событие.
+        """
+        try:
+            await self._broker.send(event)
+        except Exception as e:
+            logging.error("Ошибка отправки события ленты: %s", e)
+            self._deliver(event)
+
+    def _deliver(self, event: FeedEvent) -> None:
+        """
+        Раскладывает событие по очередям подписчиков процесса.
+
+        Args:
+            event (FeedEvent): Событие.
+        """
+        if event.type == BOT_UPDATES or event.type in self._handlers:
+            handler = self._handlers.get(event.type)
+            if handler is not None:
+                handler(event)
+            return
+        feed_events_total.inc(event.type)
+        for subscription in self._subscribers:
+            subscription.put(event)
+
+
+# Общая шина событий процесса
+feed = FeedBus(settings.feed_coalesce_interval)
@@ -0,0 +1,72 @@
+"""
+Модуль командной строки для массового импорта постов.
+
+Команды:
+- poetry run importposts <файл.ndjson> - Импортировать посты из файла
+- poetry run importposts - < <файл.ndjson> - Импортировать посты из stdin
+
+Файл читается порциями и обрабатывается так же, как загрузка через
+`POST /api/v1/imports/posts` (см. `shared.services.imports`).
+
+Functions:
+- main: Точка входа скрипта `importposts`.
+"""
+import argparse
+import asyncio
+import logging
+import sys
+from typing import AsyncIterator, BinaryIO
+from shared.database.session import async_session
+from shared.services.imports import ImportService
+
+# Размер блока чтения файла, байт
+READ_SIZE = 64 * 1024
+
+async def _read(file: BinaryIO) -> AsyncIterator[bytes]:
+    """
+    Читает файл блоками, не блокируя цикл событий.
+
+    Args:
+        file: Открытый бинарный файл.
+
+    Yields:
+        Блоки файла.
+    """
+    while chunk := await asyncio.to_thread(file.read, READ_SIZE):
+        yield chunk
+
+async def _run(args: argparse.Namespace) -> int:
+    """
+    Выполняет импорт и выводит отчет.
+
+    Args:
+        args: Аргументы командной строки.
+
+    Returns:
+        Код завершения: 0 - без ошибок, 1 - есть строки с ошибками.
+    """
+    file = sys.stdin.buffer if args.path == "-" else open(args.path, "rb")
+    try:
+        async with async_session() as session:
+            report = await ImportService(session).import_posts(_read(file))
+    finally:
+        if file is not sys.stdin.buffer:
+            file.close()
+
+    for error in report.errors:
+        print(f"строка {error.line}: {error.error}")
+    if report.failed > len(report.errors):
+        print(f"... и еще {report.failed - len(report.errors)} ошибок")
+    print(f"Строк: {report.total}, импортировано: {report.imported}, с ошибками: {report.failed}")
+    return 1 if report.failed else 0
+
+def main():
+    """
+    Точка входа скрипта `importposts`.
+    """
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+
+    parser = argparse.ArgumentParser(prog="importposts", description="Массовый импорт постов из NDJSON")
+    parser.add_argument("path", help="Путь к файлу NDJSON, - для stdin")
+
+    sys.exit(asyncio.run(_run(parser.parse_args())))
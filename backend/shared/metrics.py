@@ -0,0 +1,389 @@
+"""
+Модуль метрик приложения в формате Prometheus.
+
+Метрики собираются в памяти процесса: счетчики, датчики и гистограммы с
+фиксированными границами корзин. Запись значения - это поиск корзины
+(`bisect`) и несколько сложений без блокировок и логирования, поэтому
+метрики можно держать включенными в продакшене. `MetricsRegistry.render`
+отдает все метрики в текстовом формате Prometheus для эндпоинта
+`/metrics`.
+
+Классы:
+- Counter: Монотонный счетчик.
+- Gauge: Датчик текущего значения.
+- Histogram: Гистограмма с фиксированными корзинами.
+- MetricsRegistry: Реестр метрик и их вывод в формате Prometheus.
+
+Общий реестр `metrics` и метрики бота, HTTP, ленты событий и
+объединения чтений определены в конце модуля.
+"""
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from typing import Dict, List, Sequence, Tuple
+
+# Границы корзин задержки по умолчанию, секунды
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelValues = Tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    """
+    Экранирует значение метки для текстового формата Prometheus.
+
+    Args:
+        value (str): Значение метки.
+
+    Returns:
+        str: Экранированное значение.
+    """
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """
+    Форматирует метки серии.
+
+    Args:
+        names (Sequence[str]): Имена меток.
+        values (Sequence[str]): Значения меток.
+
+    Returns:
+        str: Метки в фигурных скобках или пустая строка.
+    """
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)) + "}"
+
+
+def _format_value(value: float) -> str:
+    """
+    Форматирует значение серии.
+
+    Args:
+        value (float): Значение.
+
+    Returns:
+        str: Целое без дробной части, иначе repr числа.
+    """
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class _Metric(ABC):
+    """
+    Базовый класс метрики с именованными метками.
+
+    Args:
+        name (str): Имя метрики.
+        documentation (str): Описание метрики (HELP).
+        labelnames (Sequence[str]): Имена меток.
+    """
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        """
+        Инициализирует метрику.
+
+        Args:
+            name (str): Имя метрики.
+            documentation (str): Описание метрики (HELP).
+            labelnames (Sequence[str]): Имена меток.
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def render(self) -> List[str]:
+        """
+        Возвращает строки метрики в текстовом формате Prometheus.
+        """
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+            *self._samples(),
+        ]
+
+    @abstractmethod
+    def _samples(self) -> List[str]:
+        """
+        Возвращает строки значений метрики.
+        """
+
+
+class Counter(_Metric):
+    """
+    Монотонный счетчик.
+    """
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[LabelValues, float] = {}
+
+    def inc(self, *labels: str, value: float = 1.0) -> None:
+        """
+        Увеличивает счетчик.
+
+        Args:
+            *labels (str): Значения меток в порядке `labelnames`.
+            value (float): Величина увеличения.
+        """
+        self._values[labels] = self._values.get(labels, 0.0) + value
+
+    def get(self, *labels: str) -> float:
+        """
+        Возвращает значение счетчика.
+
+        Args:
+            *labels (str): Значения меток.
+
+        Returns:
+            float: Значение.
+        """
+        return self._values.get(labels, 0.0)
+
+    def _samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in sorted(self._values.items())
+        ]
+
+
+class Gauge(Counter):
+    """
+    Датчик текущего значения.
+    """
+    type_name = "gauge"
+
+    def dec(self, *labels: str, value: float = 1.0) -> None:
+        """
+        Уменьшает значение датчика.
+
+        Args:
+            *labels (str): Значения меток.
+            value (float): Величина уменьшения.
+        """
+        self._values[labels] = self._values.get(labels, 0.0) - value
+
+    def set(self, *labels: str, value: float) -> None:
+        """
+        Устанавливает значение датчика.
+
+        Args:
+            *labels (str): Значения меток.
+            value (float): Значение.
+        """
+        self._values[labels] = value
+
+
+class Histogram(_Metric):
+    """
+    Гистограмма с фиксированными корзинами.
+
+    Для каждой серии хранятся количества по корзинам (некумулятивно),
+    сумма и количество наблюдений. Кумулятивные значения считаются
+    только при выводе.
+
+    Args:
+        name (str): Имя метрики.
+        documentation (str): Описание метрики.
+        labelnames (Sequence[str]): Имена меток.
+        buckets (Sequence[float]): Верхние границы корзин по возрастанию.
+    """
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[LabelValues, list] = {}
+
+    def observe(self, value: float, *labels: str) -> None:
+        """
+        Записывает наблюдение.
+
+        Args:
+            value (float): Наблюдаемое значение.
+            *labels (str): Значения меток.
+        """
+        series = self._series.get(labels)
+        if series is None:
+            # [количества по корзинам + корзина +Inf, сумма, количество]
+            series = self._series[labels] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+        series[0][bisect_left(self.buckets, value)] += 1
+        series[1] += value
+        series[2] += 1
+
+    def count(self, *labels: str) -> int:
+        """
+        Возвращает количество наблюдений серии.
+
+        Args:
+            *labels (str): Значения меток.
+
+        Returns:
+            int: Количество наблюдений.
+        """
+        series = self._series.get(labels)
+        return series[2] if series else 0
+
+    def _samples(self) -> List[str]:
+        lines = []
+        for labels, (counts, total, count) in sorted(self._series.items()):
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += bucket_count
+                le = bound if bound == "+Inf" else repr(float(bound))
+                bucket_labels = _format_labels((*self.labelnames, "le"), (*labels, le))
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            series_labels = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{series_labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{series_labels} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Реестр метрик.
+    """
+    def __init__(self):
+        """
+        Инициализирует пустой реестр.
+        """
+        self._metrics: Dict[str, _Metric] = {}
+
+    def register(self, metric: _Metric) -> _Metric:
+        """
+        Добавляет метрику в реестр.
+
+        Args:
+            metric (_Metric): Метрика.
+
+        Returns:
+            _Metric: Та же метрика.
+
+        Raises:
+            ValueError: Если метрика с таким именем уже есть.
+        """
+        if metric.name in self._metrics:
+            raise ValueError(f"Метрика {metric.name} уже зарегистрирована")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        """
+        Создает и регистрирует счетчик.
+        """
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Gauge:
+        """
+        Создает и регистрирует датчик.
+        """
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS
+    ) -> Histogram:
+        """
+        Создает и регистрирует гистограмму.
+        """
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self) -> str:
+        """
+        Возвращает все метрики в текстовом формате Prometheus.
+
+        Returns:
+            str: Текст для ответа `/metrics`.
+        """
+        lines: List[str] = []
+        for metric in self._metrics.values():
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+# Общий реестр метрик процесса
+metrics = MetricsRegistry()
+
+# Обновления бота
+bot_updates_total = metrics.counter(
+    "bot_updates_total",
+    "Обработанные обновления бота по типу и результату",
+    ("update_type", "status")
+)
+bot_update_duration = metrics.histogram(
+    "bot_update_duration_seconds",
+    "Время обработки обновления бота",
+    ("update_type",)
+)
+bot_updates_in_flight = metrics.gauge(
+    "bot_updates_in_flight",
+    "Обновления бота в обработке",
+    ("update_type",)
+)
+
+# Обработчики бота
+bot_handler_duration = metrics.histogram(
+    "bot_handler_duration_seconds",
+    "Время выполнения обработчика бота",
+    ("handler", "router", "update_type")
+)
+bot_handler_errors_total = metrics.counter(
+    "bot_handler_errors_total",
+    "Исключения в обработчиках бота",
+    ("handler", "router", "update_type")
+)
+
+# HTTP
+http_requests_total = metrics.counter(
+    "http_requests_total",
+    "HTTP-запросы по методу, маршруту и статусу",
+    ("method", "route", "status")
+)
+http_request_duration = metrics.histogram(
+    "http_request_duration_seconds",
+    "Время обработки HTTP-запроса",
+    ("method", "route")
+)
+http_requests_in_flight = metrics.gauge(
+    "http_requests_in_flight",
+    "HTTP-запросы в обработке"
+)
+
+# Лента событий постов
+feed_subscribers = metrics.gauge(
+    "feed_subscribers",
+    "Подключенные клиенты ленты событий"
+)
+feed_events_total = metrics.counter(
+    "feed_events_total",
+    "События ленты, разосланные подписчикам процесса",
+    ("type",)
+)
+feed_overflows_total = metrics.counter(
+    "feed_overflows_total",
+    "Переполнения буфера клиента ленты (клиенту отправлен reset)"
+)
+
+# Объединение параллельных чтений (single-flight)
+singleflight_calls_total = metrics.counter(
+    "singleflight_calls_total",
+    "Чтения по результату: executed - запрос выполнен, shared - получен "
+    "результат параллельного запроса, cached - результат из кэша",
+    ("group", "outcome")
+)
+singleflight_coalescing_ratio = metrics.gauge(
+    "singleflight_coalescing_ratio",
+    "Доля чтений без собственного запроса (shared и cached) с запуска процесса",
+    ("group",)
+)
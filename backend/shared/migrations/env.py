@@ -10,6 +10,8 @@ from alembic import context
 from shared.models.base import SQLModel
 from shared.models.users import User
 from shared.models.posts import Post
+from shared.models.fsm import FSMState
+from shared.models.broadcasts import Broadcast, BroadcastDelivery
 from settings import settings
 
 # this is the Alembic Config object, which provides
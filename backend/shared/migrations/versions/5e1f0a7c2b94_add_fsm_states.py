@@ -0,0 +1,39 @@
+"""Add fsm states
+
+Revision ID: 5e1f0a7c2b94
+Revises: c3bb0d36f77b
+Create Date: 2026-10-19 10:12:41.204518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e1f0a7c2b94'
+down_revision: Union[str, None] = 'c3bb0d36f77b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Состояние FSM не критично к потере при сбое, поэтому в PostgreSQL
+    # таблица не пишется в WAL
+    prefixes = ['UNLOGGED'] if op.get_bind().dialect.name == 'postgresql' else []
+    op.create_table('fsmstates',
+    sa.Column('key', sa.String(length=255), nullable=False),
+    sa.Column('state', sa.String(length=255), nullable=True),
+    sa.Column('data', sa.JSON(), nullable=False),
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('created_at', sa.TIMESTAMP(), nullable=False),
+    sa.Column('updated_at', sa.TIMESTAMP(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('key'),
+    prefixes=prefixes
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('fsmstates')
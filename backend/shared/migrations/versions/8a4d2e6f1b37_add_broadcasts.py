@@ -0,0 +1,55 @@
+"""Add broadcasts
+
+Revision ID: 8a4d2e6f1b37
+Revises: 5e1f0a7c2b94
+Create Date: 2026-10-19 11:02:17.530941
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8a4d2e6f1b37'
+down_revision: Union[str, None] = '5e1f0a7c2b94'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('is_blocked', sa.Boolean(), server_default=sa.false(), nullable=False))
+    op.create_table('broadcasts',
+    sa.Column('text', sa.Text(), nullable=False),
+    sa.Column('status', sa.Enum('PENDING', 'RUNNING', 'PAUSED', 'COMPLETED', name='broadcaststatus'), nullable=False),
+    sa.Column('cursor', sa.Integer(), nullable=False),
+    sa.Column('sent', sa.Integer(), nullable=False),
+    sa.Column('blocked', sa.Integer(), nullable=False),
+    sa.Column('failed', sa.Integer(), nullable=False),
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('created_at', sa.TIMESTAMP(), nullable=False),
+    sa.Column('updated_at', sa.TIMESTAMP(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_table('broadcastdeliveries',
+    sa.Column('broadcast_id', sa.Integer(), nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('status', sa.Enum('SENT', 'BLOCKED', 'FAILED', name='deliverystatus'), nullable=False),
+    sa.Column('error', sa.String(length=255), nullable=True),
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('created_at', sa.TIMESTAMP(), nullable=False),
+    sa.Column('updated_at', sa.TIMESTAMP(), nullable=False),
+    sa.ForeignKeyConstraint(['broadcast_id'], ['broadcasts.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('broadcast_id', 'user_id', name='uq_broadcast_user')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('broadcastdeliveries')
+    op.drop_table('broadcasts')
+    sa.Enum(name='deliverystatus').drop(op.get_bind(), checkfirst=True)
+    sa.Enum(name='broadcaststatus').drop(op.get_bind(), checkfirst=True)
+    op.drop_column('users', 'is_blocked')
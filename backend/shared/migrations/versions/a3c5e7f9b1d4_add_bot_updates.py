@@ -0,0 +1,37 @@
+"""Add bot updates
+
+Revision ID: a3c5e7f9b1d4
+Revises: f1b3d5a7c9e2
+Create Date: 2026-10-21 09:48:05.612093
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3c5e7f9b1d4'
+down_revision: Union[str, None] = 'f1b3d5a7c9e2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('botupdates',
+    sa.Column('update_id', sa.BigInteger(), nullable=False),
+    sa.Column('payload', sa.JSON(), nullable=False),
+    sa.Column('handled', sa.Boolean(), server_default=sa.false(), nullable=False),
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('created_at', sa.TIMESTAMP(), nullable=False),
+    sa.Column('updated_at', sa.TIMESTAMP(), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('update_id')
+    )
+    op.create_index('ix_botupdates_handled_update_id', 'botupdates', ['handled', 'update_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_botupdates_handled_update_id', table_name='botupdates')
+    op.drop_table('botupdates')
@@ -0,0 +1,26 @@
+"""Add user locale
+
+Revision ID: b7c9e1d3a5f2
+Revises: 8a4d2e6f1b37
+Create Date: 2026-10-19 12:40:05.118364
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7c9e1d3a5f2'
+down_revision: Union[str, None] = '8a4d2e6f1b37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('users', sa.Column('locale', sa.String(length=10), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('users', 'locale')
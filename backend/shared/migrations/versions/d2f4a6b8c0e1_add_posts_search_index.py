@@ -0,0 +1,42 @@
+"""Add posts search index
+
+Revision ID: d2f4a6b8c0e1
+Revises: b7c9e1d3a5f2
+Create Date: 2026-10-19 13:21:48.640127
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2f4a6b8c0e1'
+down_revision: Union[str, None] = 'b7c9e1d3a5f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Триграммные индексы ускоряют ILIKE '%...%' в поиске опубликованных
+    # постов (inline-режим бота). Индексы частичные: ищем только PUBLISHED
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for column in ('name', 'content'):
+        op.create_index(
+            f'ix_posts_{column}_trgm',
+            'posts',
+            [column],
+            postgresql_using='gin',
+            postgresql_ops={column: 'gin_trgm_ops'},
+            postgresql_where=sa.text("status = 'PUBLISHED'")
+        )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != 'postgresql':
+        return
+    op.drop_index('ix_posts_content_trgm', table_name='posts')
+    op.drop_index('ix_posts_name_trgm', table_name='posts')
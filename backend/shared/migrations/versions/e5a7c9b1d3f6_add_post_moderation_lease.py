@@ -0,0 +1,35 @@
+"""Add post moderation lease
+
+Revision ID: e5a7c9b1d3f6
+Revises: d2f4a6b8c0e1
+Create Date: 2026-10-19 14:05:33.902417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a7c9b1d3f6'
+down_revision: Union[str, None] = 'd2f4a6b8c0e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('posts') as batch_op:
+        batch_op.add_column(sa.Column('moderator_id', sa.Integer(), nullable=True))
+        batch_op.add_column(sa.Column('claimed_until', sa.TIMESTAMP(), nullable=True))
+        batch_op.create_foreign_key('fk_posts_moderator_id_users', 'users', ['moderator_id'], ['id'])
+    # Очередь модерации: посты на проверке в порядке поступления
+    op.create_index('ix_posts_status_id', 'posts', ['status', 'id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_posts_status_id', table_name='posts')
+    with op.batch_alter_table('posts') as batch_op:
+        batch_op.drop_constraint('fk_posts_moderator_id_users', type_='foreignkey')
+        batch_op.drop_column('claimed_until')
+        batch_op.drop_column('moderator_id')
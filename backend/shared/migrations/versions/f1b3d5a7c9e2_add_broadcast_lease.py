@@ -0,0 +1,30 @@
+"""Add broadcast lease
+
+Revision ID: f1b3d5a7c9e2
+Revises: e5a7c9b1d3f6
+Create Date: 2026-10-20 10:12:47.318520
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1b3d5a7c9e2'
+down_revision: Union[str, None] = 'e5a7c9b1d3f6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table('broadcasts') as batch_op:
+        batch_op.add_column(sa.Column('owner', sa.String(length=100), nullable=True))
+        batch_op.add_column(sa.Column('lease_until', sa.TIMESTAMP(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('broadcasts') as batch_op:
+        batch_op.drop_column('lease_until')
+        batch_op.drop_column('owner')
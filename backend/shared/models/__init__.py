@@ -1,5 +1,8 @@
 from shared.models.users import User
 from shared.models.posts import Post, PostStatus
 from shared.models.votes import Vote
+from shared.models.fsm import FSMState
+from shared.models.broadcasts import Broadcast, BroadcastDelivery
+from shared.models.bot_updates import BotUpdate
 
-__all__ = ["User", "Post", "PostStatus", "Vote"]
\ No newline at end of file
+__all__ = ["User", "Post", "PostStatus", "Vote", "FSMState", "Broadcast", "BroadcastDelivery", "BotUpdate"]
\ No newline at end of file
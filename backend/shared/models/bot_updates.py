@@ -0,0 +1,35 @@
+"""
+Модуль, содержащий модель входящих обновлений бота.
+
+Этот модуль определяет следующие модели SQLAlchemy:
+- BotUpdate: обновление Telegram, принятое вебхуком одного из воркеров API.
+
+При нескольких воркерах API вебхук любого воркера сохраняет обновление в
+таблицу, а обрабатывает его только ведущий процесс. Уникальный `update_id`
+отсекает повторные доставки, принятые разными воркерами. Обработанные
+обновления хранятся ограниченное время, чтобы повтор, пришедший позже,
+тоже был отсечен.
+"""
+from typing import Any, Dict
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import BigInteger, Boolean, Index, JSON, false
+from shared.models.base import SQLModel
+
+
+class BotUpdate(SQLModel):
+    """
+    Модель входящего обновления Telegram.
+
+    Args:
+        update_id (int): Идентификатор обновления.
+        payload (Dict[str, Any]): Обновление в JSON.
+        handled (bool): Обновление передано в обработку ведущим процессом.
+    """
+    update_id: Mapped[int] = mapped_column(BigInteger, unique=True)
+    payload: Mapped[Dict[str, Any]] = mapped_column(JSON)
+    handled: Mapped[bool] = mapped_column(Boolean, default=False, server_default=false())
+
+    # Ведущий выбирает необработанные обновления в порядке update_id
+    __table_args__ = (
+        Index('ix_botupdates_handled_update_id', 'handled', 'update_id'),
+    )
@@ -0,0 +1,67 @@
+"""
+Модуль, содержащий модели данных для рассылок.
+
+Этот модуль определяет следующие модели SQLAlchemy:
+- Broadcast: рассылка сообщения всем пользователям бота.
+- BroadcastDelivery: результат доставки рассылки одному пользователю.
+
+Рассылка обходит пользователей в порядке возрастания id и хранит
+курсор - id последнего обработанного пользователя. Курсор и результаты
+доставки сохраняются одной транзакцией на каждую порцию получателей,
+поэтому прерванная рассылка продолжается с места остановки.
+
+Отправляет рассылку только процесс, владеющий арендой (`owner`,
+`lease_until`), поэтому рассылка, запущенная через CLI, не отправляется
+повторно ведущим процессом API.
+"""
+from sqlalchemy.orm import Mapped, mapped_column
+from datetime import datetime
+from sqlalchemy import ForeignKey, Integer, String, Text, TIMESTAMP, UniqueConstraint
+from shared.models.base import SQLModel
+from shared.schemas.broadcasts import BroadcastStatus, DeliveryStatus
+
+
+class Broadcast(SQLModel):
+    """
+    Модель для представления рассылки.
+
+    Args:
+        text (str): Текст сообщения.
+        status (BroadcastStatus): Статус рассылки.
+        cursor (int): Идентификатор последнего обработанного пользователя.
+        sent (int): Количество доставленных сообщений.
+        blocked (int): Количество пользователей, заблокировавших бота.
+        failed (int): Количество ошибок отправки.
+        owner (str | None): Процесс, который выполняет рассылку.
+        lease_until (datetime | None): Срок аренды рассылки процессом.
+    """
+    text: Mapped[str] = mapped_column(Text)
+    status: Mapped[BroadcastStatus] = mapped_column(default=BroadcastStatus.PENDING)
+    cursor: Mapped[int] = mapped_column(Integer, default=0)
+    sent: Mapped[int] = mapped_column(Integer, default=0)
+    blocked: Mapped[int] = mapped_column(Integer, default=0)
+    failed: Mapped[int] = mapped_column(Integer, default=0)
+    owner: Mapped[str] = mapped_column(String(100), nullable=True)
+    lease_until: Mapped[datetime] = mapped_column(TIMESTAMP, nullable=True)
+
+
+class BroadcastDelivery(SQLModel):
+    """
+    Модель для представления доставки рассылки одному пользователю.
+
+    Args:
+        broadcast_id (int): Идентификатор рассылки.
+        user_id (int): Идентификатор пользователя.
+        status (DeliveryStatus): Результат доставки.
+        error (str | None): Текст ошибки отправки.
+    """
+    __tablename__ = "broadcastdeliveries"
+
+    broadcast_id: Mapped[int] = mapped_column(ForeignKey("broadcasts.id", ondelete="CASCADE"))
+    user_id: Mapped[int] = mapped_column(ForeignKey("users.id", ondelete="CASCADE"))
+    status: Mapped[DeliveryStatus] = mapped_column()
+    error: Mapped[str] = mapped_column(String(255), nullable=True)
+
+    __table_args__ = (
+        UniqueConstraint('broadcast_id', 'user_id', name='uq_broadcast_user'),
+    )
@@ -0,0 +1,29 @@
+"""
+Модуль, содержащий модель хранилища состояний FSM бота.
+
+Этот модуль определяет следующие модели SQLAlchemy:
+- FSMState: состояние и данные конечного автомата (FSM) aiogram для одного ключа.
+
+Ключ строится `KeyBuilder` aiogram (бот, чат, пользователь, destiny), поэтому
+одна строка соответствует одному контексту FSM. В PostgreSQL таблица
+создается как UNLOGGED: состояние диалогов не критично к потере при сбое,
+а запись в нее не нагружает WAL.
+"""
+from typing import Any, Dict
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy import String, JSON
+from shared.models.base import SQLModel
+
+
+class FSMState(SQLModel):
+    """
+    Модель для хранения состояния FSM.
+
+    Args:
+        key (str): Ключ контекста FSM.
+        state (str | None): Текущее состояние.
+        data (Dict[str, Any]): Данные контекста.
+    """
+    key: Mapped[str] = mapped_column(String(255), unique=True)
+    state: Mapped[str] = mapped_column(String(255), nullable=True)
+    data: Mapped[Dict[str, Any]] = mapped_column(JSON, default=dict)
@@ -14,9 +14,10 @@
 для выполнения операций с базой данных, связанных с инструкциями по эксплуатации.
 """
 
+from datetime import datetime
 from typing import List
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, Integer, ForeignKey
+from sqlalchemy import String, Integer, ForeignKey, Index, TIMESTAMP
 from shared.models.base import SQLModel
 from shared.schemas.posts import PostStatus
 from shared.models.types import TYPE_CHECKING
@@ -35,6 +36,8 @@ class Post(SQLModel):
         content (str): Подробное описание поста.
         rating (int): Рейтинг поста, основанный на голосах пользователей.
         status (PostStatus): Статус поста.
+        moderator_id (int | None): Модератор, взявший пост на проверку.
+        claimed_until (datetime | None): Срок, до которого пост закреплен за модератором.
         
         user (User): Пользователь, связанный с постом.
         votes (List[Vote]): Список голосов, связанных с постом.
@@ -46,7 +49,14 @@ class Post(SQLModel):
     content: Mapped[str] = mapped_column(String(1000))
     rating: Mapped[int] = mapped_column(Integer, default=0)
     status: Mapped[PostStatus] = mapped_column(default=PostStatus.DRAFT)
+    moderator_id: Mapped[int] = mapped_column(ForeignKey("users.id"), nullable=True)
+    claimed_until: Mapped[datetime] = mapped_column(TIMESTAMP, nullable=True)
     
-    user: Mapped["User"] = relationship(back_populates="posts")
+    user: Mapped["User"] = relationship(back_populates="posts", foreign_keys=[author])
     votes: Mapped[List["Vote"]] = relationship(back_populates="post", cascade="all, delete")
-    tags: Mapped[List["Tag"]] = relationship(secondary="posttags", back_populates="posts")
\ No newline at end of file
+    tags: Mapped[List["Tag"]] = relationship(secondary="posttags", back_populates="posts")
+
+    # Очередь модерации выбирается по статусу в порядке ID
+    __table_args__ = (
+        Index('ix_posts_status_id', 'status', 'id'),
+    )
@@ -15,7 +15,7 @@
 """
 from typing import List
 from sqlalchemy.orm import Mapped, mapped_column, relationship
-from sqlalchemy import String, BigInteger
+from sqlalchemy import String, BigInteger, Boolean, false
 from shared.models.base import SQLModel
 from shared.models.types import TYPE_CHECKING
 from shared.schemas.users import UserRole
@@ -35,15 +35,20 @@ class User(SQLModel):
         posts (List[Post]): Список постовых историй, связанных с пользователем.
         role (UserRole): Роль пользователя в системе.
         hashed_password (str): Хэшированный пароль пользователя.
+        is_blocked (bool): Пользователь заблокировал бота, рассылки его пропускают.
+        locale (str | None): Выбранная пользователем локаль бота.
     """
     chat_id: Mapped[int] = mapped_column(BigInteger, unique=True, nullable=True)
     username: Mapped[str] = mapped_column(String(100))
     email: Mapped[str] = mapped_column(String(100), unique=True, nullable=True)
     role: Mapped[UserRole] = mapped_column(default=UserRole.USER)
     hashed_password: Mapped[str] = mapped_column(String(100), nullable=True)
+    is_blocked: Mapped[bool] = mapped_column(Boolean, default=False, server_default=false())
+    locale: Mapped[str] = mapped_column(String(10), nullable=True)
     
     posts: Mapped[List["Post"]] = relationship(
         back_populates="user",
+        foreign_keys="Post.author",
         lazy='joined',
         cascade="all, delete-orphan",
     )
@@ -8,9 +8,17 @@
 
 Класс `BaseSchema` включает в себя настройки, которые позволяют
 использовать атрибуты модели в качестве полей схемы.
+
+Также здесь определены общие схемы страницы (`Page`, `CursorPage`),
+пакетного получения записей по ID (`BatchRequestSchema`, `BatchResult`)
+и зависимость выбора полей ответа (`sparse_fields`).
 """
-from typing import TypeVar, Generic, List
-from pydantic import BaseModel, ConfigDict
+import base64
+import json
+from typing import Any, Callable, TypeVar, Generic, List, Sequence, Tuple, Type
+from pydantic import BaseModel, ConfigDict, Field
+from shared.exceptions.base import InvalidCursorError, InvalidFieldsError
+from settings import settings
 
 
 class BaseSchema(BaseModel):
@@ -34,6 +42,79 @@ class Page(BaseModel, Generic[T]):
     total: int
     page: int
     size: int
+
+
+class CursorPage(BaseModel, Generic[T]):
+    """
+    Страница с курсором (API v2).
+
+    Вместо общего количества записей (отдельный COUNT) возвращается
+    курсор следующей страницы.
+
+    Args:
+        items (List[T]): Записи страницы.
+        next (str | None): Курсор следующей страницы, None - страница последняя.
+    """
+    items: List[T]
+    next: str | None = None
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """
+    Кодирует значения ключа сортировки последней записи в курсор.
+
+    Args:
+        values (Sequence[Any]): Значения (JSON-совместимые).
+
+    Returns:
+        str: Курсор (base64url без выравнивания).
+    """
+    data = json.dumps(list(values), separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> List[Any]:
+    """
+    Декодирует курсор.
+
+    Args:
+        cursor (str): Курсор из `CursorPage.next`.
+
+    Returns:
+        List[Any]: Значения ключа сортировки.
+
+    Raises:
+        InvalidCursorError: Если курсор поврежден.
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except ValueError as e:
+        raise InvalidCursorError() from e
+    if not isinstance(values, list):
+        raise InvalidCursorError()
+    return values
+
+
+class BatchRequestSchema(BaseSchema):
+    """
+    Запрос пакетного получения записей.
+
+    Args:
+        ids (List[int]): ID записей (не больше `settings.batch_max_ids`).
+    """
+    ids: List[int] = Field(min_length=1, max_length=settings.batch_max_ids)
+
+
+class BatchResult(BaseModel, Generic[T]):
+    """
+    Результат пакетного получения записей.
+
+    Args:
+        items (List[T]): Найденные записи в порядке запроса (без повторов).
+        missing (List[int]): ID, для которых записи не найдены.
+    """
+    items: List[T]
+    missing: List[int]
     
 
 class PaginationParams:
@@ -51,4 +132,47 @@ class PaginationParams:
 
     @property
     def page(self) -> int:
-        return self.skip // self.limit + 1
\ No newline at end of file
+        return self.skip // self.limit + 1
+
+
+def sparse_fields(
+    schema: Type[BaseModel],
+    required: Tuple[str, ...] = ("id",)
+) -> Callable[[str | None], Tuple[str, ...] | None]:
+    """
+    Создает зависимость параметра `fields` - списка полей ответа через запятую.
+
+    Поля проверяются по схеме ответа, обязательные поля (ID) добавляются
+    всегда. Менеджеры данных выбирают из базы только эти колонки.
+
+    Args:
+        schema (Type[BaseModel]): Схема ответа.
+        required (Tuple[str, ...]): Поля, которые возвращаются всегда.
+
+    Returns:
+        Callable[[str | None], Tuple[str, ...] | None]: Зависимость FastAPI.
+    """
+    allowed = tuple(schema.model_fields)
+
+    def dependency(fields: str | None = None) -> Tuple[str, ...] | None:
+        """
+        Разбирает и проверяет параметр `fields`.
+
+        Args:
+            fields (str | None): Поля через запятую, None - все поля.
+
+        Returns:
+            Tuple[str, ...] | None: Выбранные поля или None.
+
+        Raises:
+            InvalidFieldsError: Если указаны поля, которых нет в схеме.
+        """
+        if not fields:
+            return None
+        names = [name.strip() for name in fields.split(",") if name.strip()]
+        unknown = [name for name in names if name not in schema.model_fields]
+        if unknown:
+            raise InvalidFieldsError(unknown, allowed)
+        return tuple(dict.fromkeys((*required, *names)))
+
+    return dependency
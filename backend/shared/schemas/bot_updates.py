@@ -0,0 +1,13 @@
+from typing import Any, Dict
+from shared.schemas.base import BaseSchema
+
+class BotUpdateSchema(BaseSchema):
+    """
+    Схема входящего обновления Telegram.
+    Этот класс определяет структуру обновления, сохраненного вебхуком.
+    Args:
+        update_id (int): Идентификатор обновления.
+        payload (Dict[str, Any]): Обновление в JSON.
+    """
+    update_id: int
+    payload: Dict[str, Any]
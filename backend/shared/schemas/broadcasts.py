@@ -0,0 +1,71 @@
+"""
+Модуль для определения схем рассылок.
+
+Этот модуль содержит схемы для создания рассылки и представления ее
+состояния, а также перечисления статусов рассылки и доставки.
+"""
+from enum import Enum
+from datetime import datetime
+from shared.schemas.base import BaseSchema
+
+class BroadcastStatus(str, Enum):
+    """
+    Статусы рассылки.
+
+    Args:
+        PENDING (str): Создана, но еще не запускалась.
+        RUNNING (str): Выполняется.
+        PAUSED (str): Приостановлена, может быть продолжена.
+        COMPLETED (str): Отправлена всем получателям.
+    """
+    PENDING = "pending"
+    RUNNING = "running"
+    PAUSED = "paused"
+    COMPLETED = "completed"
+
+class DeliveryStatus(str, Enum):
+    """
+    Статусы доставки рассылки одному получателю.
+
+    Args:
+        SENT (str): Сообщение доставлено.
+        BLOCKED (str): Пользователь заблокировал бота.
+        FAILED (str): Ошибка отправки.
+    """
+    SENT = "sent"
+    BLOCKED = "blocked"
+    FAILED = "failed"
+
+class CreateBroadcastSchema(BaseSchema):
+    """
+    Схема для создания рассылки.
+
+    Args:
+        text (str): Текст сообщения (HTML).
+    """
+    text: str
+
+class BroadcastSchema(BaseSchema):
+    """
+    Схема для представления рассылки и ее прогресса.
+
+    Args:
+        id (int): Идентификатор рассылки.
+        text (str): Текст сообщения.
+        status (BroadcastStatus): Статус рассылки.
+        cursor (int): Идентификатор последнего обработанного пользователя.
+        sent (int): Количество доставленных сообщений.
+        blocked (int): Количество пользователей, заблокировавших бота.
+        failed (int): Количество ошибок отправки.
+        created_at (datetime | None): Дата создания.
+        updated_at (datetime | None): Дата последнего изменения.
+    """
+    id: int
+    text: str
+    status: BroadcastStatus
+    cursor: int = 0
+    sent: int = 0
+    blocked: int = 0
+    failed: int = 0
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
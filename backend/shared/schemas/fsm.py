@@ -0,0 +1,16 @@
+from typing import Any, Dict
+from pydantic import Field
+from shared.schemas.base import BaseSchema
+
+class FSMStateSchema(BaseSchema):
+    """
+    Схема состояния FSM.
+    Этот класс определяет структуру данных контекста конечного автомата бота.
+    Args:
+        key (str): Ключ контекста FSM.
+        state (str | None): Текущее состояние.
+        data (Dict[str, Any]): Данные контекста.
+    """
+    key: str
+    state: str | None = None
+    data: Dict[str, Any] = Field(default_factory=dict)
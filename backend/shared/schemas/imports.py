@@ -0,0 +1,58 @@
+"""
+Модуль для определения схем массового импорта постов.
+
+Импорт принимает NDJSON: по одному посту (`PostImportSchema`) в строке.
+Результат импорта - отчет (`ImportReportSchema`) с ошибками по номерам
+строк.
+"""
+from datetime import datetime
+from typing import Annotated, List
+from pydantic import Field, StringConstraints
+from shared.schemas.base import BaseSchema
+from shared.schemas.posts import PostCreateSchema, PostStatus
+
+TagName = Annotated[str, StringConstraints(strip_whitespace=True, to_lower=True, min_length=1, max_length=50)]
+
+class PostImportSchema(PostCreateSchema):
+    """
+    Схема строки импорта поста.
+
+    Args:
+        author (int): ID автора поста.
+        status (PostStatus): Статус поста (по умолчанию опубликован).
+        rating (int): Рейтинг поста.
+        tags (List[str]): Названия тегов (создаются, если их нет).
+        created_at (datetime | None): Дата создания, None - текущая.
+    """
+    author: int
+    status: PostStatus = PostStatus.PUBLISHED
+    rating: int = 0
+    tags: List[TagName] = Field(default_factory=list, max_length=20)
+    created_at: datetime | None = None
+
+class ImportErrorSchema(BaseSchema):
+    """
+    Ошибка строки импорта.
+
+    Args:
+        line (int): Номер строки (с 1).
+        error (str): Описание ошибки.
+    """
+    line: int
+    error: str
+
+class ImportReportSchema(BaseSchema):
+    """
+    Отчет об импорте.
+
+    Args:
+        total (int): Количество непустых строк.
+        imported (int): Количество импортированных постов.
+        failed (int): Количество строк с ошибками.
+        errors (List[ImportErrorSchema]): Ошибки строк (не больше
+            `settings.import_max_errors`, остальные только учитываются в `failed`).
+    """
+    total: int = 0
+    imported: int = 0
+    failed: int = 0
+    errors: List[ImportErrorSchema] = Field(default_factory=list)
@@ -0,0 +1,63 @@
+"""
+Модуль для определения схем модерации постов.
+
+Этот модуль содержит схемы очереди модерации: пост, закрепленный за
+модератором, запрос на массовое решение и результат решения.
+"""
+from enum import Enum
+from datetime import datetime
+from typing import List
+from pydantic import Field
+from shared.schemas.base import BaseSchema
+from settings import settings
+
+class ModerationDecision(str, Enum):
+    """
+    Решение модератора по посту.
+
+    Args:
+        APPROVE (str): Опубликовать пост.
+        REJECT (str): Вернуть пост автору в черновики.
+    """
+    APPROVE = "approve"
+    REJECT = "reject"
+
+class ModerationPostSchema(BaseSchema):
+    """
+    Схема поста в очереди модерации.
+
+    Args:
+        id (int): Идентификатор поста.
+        name (str): Название поста.
+        content (str): Содержание поста.
+        author (int): Идентификатор автора.
+        claimed_until (datetime | None): Срок, до которого пост закреплен за модератором.
+    """
+    id: int
+    name: str
+    content: str
+    author: int
+    claimed_until: datetime | None = None
+
+class ModerationDecisionSchema(BaseSchema):
+    """
+    Схема массового решения модератора.
+
+    Args:
+        post_ids (List[int]): Идентификаторы постов.
+        decision (ModerationDecision): Решение по всем постам.
+    """
+    post_ids: List[int] = Field(min_length=1, max_length=settings.moderation_max_batch)
+    decision: ModerationDecision
+
+class ModerationResultSchema(BaseSchema):
+    """
+    Схема результата массового решения.
+
+    Args:
+        updated (List[int]): Посты, статус которых изменен.
+        skipped (List[int]): Посты, которые уже не на проверке или
+            закреплены за другим модератором.
+    """
+    updated: List[int]
+    skipped: List[int]
@@ -30,6 +30,18 @@ class PostStatus(str, Enum):
     CHECKING = "checking"
     PUBLISHED = "published"
     DELETED = "deleted"
+
+
+class PostSort(str, Enum):
+    """
+    Порядок постов в ленте с курсором (API v2).
+
+    Args:
+        NEW (str): Сначала новые.
+        TOP (str): Сначала с наибольшим рейтингом.
+    """
+    NEW = "new"
+    TOP = "top"
     
 class PostCreateSchema(BaseSchema):
     """
@@ -10,6 +10,7 @@
 """
 from enum import Enum
 from datetime import datetime
+from pydantic import Field
 from shared.schemas.base import BaseSchema
 
 class UserRole(str, Enum):
@@ -53,10 +54,12 @@ class UserUpdateSchema(BaseSchema):
         username (str): Имя пользователя.
         email (str): Электронная почта пользователя.
         password (str): Пароль пользователя.
+        locale (str): Локаль бота, например "ru" или "en".
         """
     username: str | None = None
     email: str | None = None
     password: str | None = None
+    locale: str | None = Field(default=None, max_length=10)
 
 class UserSchema(BaseSchema):
     """
@@ -69,13 +72,31 @@ class UserSchema(BaseSchema):
         id (int | None): Уникальный идентификатор пользователя (по умолчанию None).
         chat_id (int): ID чата пользователя.
         username (str): Имя пользователя.
+        email (str | None): Email пользователя (в токене не передается).
         role (UserRole): Роль пользователя.
+        locale (str | None): Выбранная локаль бота.
         created_at (datetime | None): Дата и время создания пользователя (по умолчанию None).
     """
     id: int | None = None
     username: str
     chat_id: int | None
-    email: str | None
+    email: str | None = None
+    role: UserRole = UserRole.USER
+    locale: str | None = None
+    created_at: datetime | None = None
+
+class UserPublicSchema(BaseSchema):
+    """
+    Публичные данные пользователя (без контактов и ID чата).
+
+    Args:
+        id (int): Уникальный идентификатор пользователя.
+        username (str): Имя пользователя.
+        role (UserRole): Роль пользователя.
+        created_at (datetime | None): Дата и время создания пользователя.
+    """
+    id: int
+    username: str
     role: UserRole = UserRole.USER
     created_at: datetime | None = None
     
@@ -8,10 +8,13 @@
 
 Класс `BaseService` включает в себя инициализацию сессии базы данных.
 """
-from typing import TypeVar, Generic, Type, Any, List
+from typing import TypeVar, Generic, Type, Any, Dict, List, Callable, Iterable, Sequence
 import logging
-from sqlalchemy import select, func, desc, asc
-from sqlalchemy.sql.expression import Executable
+from sqlalchemy import select, func, desc, asc, tuple_
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.sql.expression import Executable, Insert, Select
+from sqlalchemy.orm.interfaces import ORMOption
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import SQLAlchemyError
 from shared.schemas.base import BaseSchema, PaginationParams
@@ -20,6 +23,30 @@ from shared.models.base import SQLModel
 M = TypeVar("M", bound=SQLModel)
 T = TypeVar("T", bound=BaseSchema)
 
+def dialect_insert(session: AsyncSession) -> Callable[..., Insert]:
+    """
+    Возвращает конструктор INSERT для диалекта текущей сессии.
+
+    Диалектные конструкторы PostgreSQL и SQLite поддерживают
+    `on_conflict_do_nothing` / `on_conflict_do_update`, которых нет
+    у общего `sqlalchemy.insert`.
+
+    Args:
+        session (AsyncSession): Асинхронная сессия базы данных.
+
+    Returns:
+        Callable[..., Insert]: Функция `insert` нужного диалекта.
+
+    Raises:
+        NotImplementedError: Если диалект не поддерживает upsert.
+    """
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        return postgresql_insert
+    if dialect == "sqlite":
+        return sqlite_insert
+    raise NotImplementedError(f"Upsert не поддерживается для диалекта {dialect}")
+
 class SessionMixin:
     """
     Миксин для предоставления экземпляра сессии базы данных.
@@ -200,10 +227,169 @@ class BaseDataManager(SessionMixin, Generic[T]):
             logging.error("Ошибка при получении записей: %s", e)
             return []
 
+    def column_fields(self, fields: Sequence[str]) -> bool:
+        """
+        Проверяет, что все поля - колонки таблицы модели.
+
+        Args:
+            fields (Sequence[str]): Имена полей.
+
+        Returns:
+            bool: True, если поля можно выбрать без загрузки записей целиком.
+        """
+        columns = self.model.__table__.columns
+        return all(name in columns for name in fields)
+
+    async def get_fields(
+        self,
+        select_statement: Select,
+        fields: Sequence[str],
+        schema: Type[BaseSchema] | None = None,
+        extra: Sequence[str] = (),
+    ) -> List[Dict[str, Any]]:
+        """
+        Получает только выбранные поля записей.
+
+        Если все поля - колонки модели, запрос выбирает только их
+        (`with_only_columns`). Иначе (например, связь `user`) записи
+        загружаются целиком, а в результат попадают выбранные поля схемы.
+
+        Args:
+            select_statement (Select): SQL-запрос выборки модели.
+            fields (Sequence[str]): Поля результата.
+            schema (Type[BaseSchema] | None): Схема, None - схема менеджера.
+            extra (Sequence[str]): Колонки, которые нужно выбрать, но не
+                возвращать (например, колонка сортировки для DISTINCT).
+
+        Returns:
+            List[Dict[str, Any]]: Записи с выбранными полями.
+        """
+        try:
+            if self.column_fields(fields):
+                names = dict.fromkeys((*fields, *extra))
+                statement = select_statement.with_only_columns(
+                    *(getattr(self.model, name) for name in names)
+                )
+                result = await self.session.execute(statement)
+                return [{name: row._mapping[name] for name in fields} for row in result]
+
+            result = await self.session.execute(select_statement)
+            schema = schema or self.schema
+            include = set(fields)
+            items = [
+                schema.model_validate(item).model_dump(include=include)
+                for item in result.unique().scalars()
+            ]
+            return [{name: item[name] for name in fields} for item in items]
+        except SQLAlchemyError as e:
+            logging.error("Ошибка при получении полей записей: %s", e)
+            return []
+
+    async def get_many(
+        self,
+        ids: Iterable[int],
+        *options: ORMOption,
+        schema: Type[BaseSchema] | None = None,
+        fields: Sequence[str] | None = None,
+    ) -> tuple[List[T], List[int]]:
+        """
+        Получает записи по списку ID одним запросом `IN`.
+
+        Args:
+            ids (Iterable[int]): ID записей; повторы отбрасываются.
+            *options (ORMOption): Опции загрузки (например, `joinedload`).
+            schema (Type[BaseSchema] | None): Схема результата, None - схема
+                менеджера.
+            fields (Sequence[str] | None): Поля результата (должны включать
+                `id`), None - все поля схемы.
+
+        Returns:
+            tuple[List[T], List[int]]: Записи (или словари выбранных полей)
+                в порядке запрошенных ID и список ID, для которых записи не
+                найдены.
+
+        Raises:
+            SQLAlchemyError: Если произошла ошибка при получении записей.
+        """
+        ids = list(dict.fromkeys(ids))
+        schema = schema or self.schema
+        statement = select(self.model).where(self.model.id.in_(ids))
+        if fields is not None:
+            if not self.column_fields(fields):
+                statement = statement.options(*options)
+            rows = await self.get_fields(statement, fields, schema)
+            found = {row["id"]: row for row in rows}
+            return (
+                [found[item_id] for item_id in ids if item_id in found],
+                [item_id for item_id in ids if item_id not in found],
+            )
+
+        statement = statement.options(*options)
+        try:
+            result = await self.session.execute(statement)
+        except SQLAlchemyError as e:
+            logging.error("Ошибка при получении записей по ID: %s", e)
+            raise
+        found = {item.id: schema.model_validate(item) for item in result.unique().scalars()}
+        return (
+            [found[item_id] for item_id in ids if item_id in found],
+            [item_id for item_id in ids if item_id not in found],
+        )
+
+    async def get_cursor_page(
+        self,
+        select_statement: Select,
+        order_by: Sequence[Any],
+        limit: int,
+        after: Sequence[Any] | None = None,
+        fields: Sequence[str] | None = None,
+    ) -> tuple[List[T], tuple | None]:
+        """
+        Получает страницу записей по ключу (keyset) без OFFSET и COUNT.
+
+        Записи сортируются по убыванию колонок `order_by` (последняя должна
+        быть уникальной, например `id`), следующая страница начинается
+        после ключа `after`. Выбирается `limit + 1` запись, чтобы узнать,
+        есть ли следующая страница.
+
+        Args:
+            select_statement (Select): SQL-запрос выборки модели.
+            order_by (Sequence[Any]): Колонки ключа сортировки.
+            limit (int): Размер страницы.
+            after (Sequence[Any] | None): Ключ последней записи предыдущей страницы.
+            fields (Sequence[str] | None): Поля записей, None - все поля схемы.
+
+        Returns:
+            tuple[List[T], tuple | None]: Записи (или словари выбранных
+                полей) и ключ последней записи, если есть следующая страница.
+        """
+        keys = [column.key for column in order_by]
+        if after is not None:
+            select_statement = select_statement.where(tuple_(*order_by) < tuple_(*after))
+        select_statement = select_statement.order_by(*(desc(column) for column in order_by))
+        select_statement = select_statement.limit(limit + 1)
+
+        if fields is None:
+            items = await self.get_all(select_statement)
+            last_key = (lambda item: tuple(getattr(item, key) for key in keys))
+        else:
+            # Колонки ключа выбираются для курсора и удаляются из ответа
+            rows = await self.get_fields(select_statement, list(dict.fromkeys((*fields, *keys))))
+            last_key = (lambda item: tuple(item[key] for key in keys))
+            items = rows
+
+        next_key = last_key(items[limit - 1]) if len(items) > limit else None
+        items = items[:limit]
+        if fields is not None:
+            items = [{name: item[name] for name in fields} for item in items]
+        return items, next_key
+
     async def get_paginated(
         self,
         select_statement: Executable,
         pagination: PaginationParams,
+        total: int | None = None,
+        fields: Sequence[str] | None = None,
     ) -> tuple[List[T], int]:
         """
         Получает пагинированные записи из базы данных.
@@ -211,17 +397,22 @@ class BaseDataManager(SessionMixin, Generic[T]):
         Args:
             select_statement (Executable): SQL-запрос для выборки.
             pagination (PaginationParams): Параметры пагинации.
+            total (int | None): Уже посчитанное общее количество записей,
+                None - посчитать отдельным запросом.
+            fields (Sequence[str] | None): Поля записей, None - все поля схемы.
 
         Returns:
-            tuple[List[T], int]: Список пагинированных записей и общее количество записей.
+            tuple[List[T], int]: Список пагинированных записей (или словарей
+                выбранных полей) и общее количество записей.
         
         Raises:
             SQLAlchemyError: Если произошла ошибка при получении пагинированных записей.
         """
         try:
-            total = await self.session.scalar(
-                select(func.count()).select_from(select_statement.subselect_statement())
-            )
+            if total is None:
+                total = await self.session.scalar(
+                    select(func.count()).select_from(select_statement.subquery())
+                )
 
             sort_column = getattr(self.model, pagination.sort_by)
 
@@ -231,7 +422,11 @@ class BaseDataManager(SessionMixin, Generic[T]):
 
             select_statement = select_statement.offset(pagination.skip).limit(pagination.limit)
 
-            items = await self.get_all(select_statement)
+            if fields is None:
+                items = await self.get_all(select_statement)
+            else:
+                # Колонка сортировки нужна в SELECT DISTINCT (PostgreSQL)
+                items = await self.get_fields(select_statement, fields, extra=(pagination.sort_by,))
 
             return items, total
         except SQLAlchemyError as e:
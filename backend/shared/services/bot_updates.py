@@ -0,0 +1,99 @@
+from datetime import datetime
+from typing import Any, Dict, List
+from sqlalchemy import select, update, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from shared.models.bot_updates import BotUpdate
+from shared.schemas.bot_updates import BotUpdateSchema
+
+from .base import BaseDataManager, dialect_insert
+
+class BotUpdateDataManager(BaseDataManager[BotUpdateSchema]):
+    """
+    Менеджер данных входящих обновлений бота.
+
+    Args:
+        session (AsyncSession): Асинхронная сессия базы данных.
+        model (Type[BotUpdate]): Модель обновления.
+        schema (Type[BotUpdateSchema]): Схема обновления.
+    """
+    def __init__(self, session: AsyncSession):
+        """
+        Инициализация менеджера данных входящих обновлений.
+        """
+        super().__init__(
+                session=session,
+                schema=BotUpdateSchema,
+                model=BotUpdate
+            )
+
+    async def add_update(self, update_id: int, payload: Dict[str, Any]) -> bool:
+        """
+        Сохраняет обновление одним запросом INSERT ... ON CONFLICT (update_id).
+
+        Args:
+            update_id (int): Идентификатор обновления.
+            payload (Dict[str, Any]): Обновление в JSON.
+
+        Returns:
+            bool: True, если обновление новое, False, если оно уже было
+                принято (повторная доставка).
+        """
+        now = datetime.now()
+        insert = dialect_insert(self.session)
+        statement = (
+            insert(self.model)
+            .values(update_id=update_id, payload=payload, created_at=now, updated_at=now)
+            .on_conflict_do_nothing(index_elements=[self.model.update_id])
+            .returning(self.model.id)
+        )
+        inserted = (await self.session.execute(statement)).scalar_one_or_none() is not None
+        await self.session.commit()
+        return inserted
+
+    async def get_pending(self, limit: int) -> List[BotUpdateSchema]:
+        """
+        Получает необработанные обновления в порядке update_id.
+
+        Args:
+            limit (int): Максимальное количество обновлений.
+
+        Returns:
+            List[BotUpdateSchema]: Обновления.
+        """
+        statement = (
+            select(self.model)
+            .where(self.model.handled.is_(False))
+            .order_by(self.model.update_id)
+            .limit(limit)
+        )
+        return await self.get_all(statement)
+
+    async def mark_handled(self, update_ids: List[int]) -> None:
+        """
+        Отмечает обновления переданными в обработку.
+
+        Args:
+            update_ids (List[int]): Идентификаторы обновлений.
+        """
+        if not update_ids:
+            return
+        await self.session.execute(
+            update(self.model)
+            .where(self.model.update_id.in_(update_ids))
+            .values(handled=True)
+        )
+        await self.session.commit()
+
+    async def delete_handled(self, before: datetime) -> None:
+        """
+        Удаляет обработанные обновления, принятые раньше указанного времени.
+
+        Args:
+            before (datetime): Граница времени приема.
+        """
+        await self.delete_all(
+            delete(self.model).where(
+                self.model.handled.is_(True),
+                self.model.created_at < before
+            )
+        )
@@ -0,0 +1,398 @@
+import logging
+from collections import Counter
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Tuple
+from sqlalchemy import exists, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+from shared.models.broadcasts import Broadcast, BroadcastDelivery
+from shared.models.users import User
+from shared.schemas.broadcasts import (
+    BroadcastSchema,
+    BroadcastStatus,
+    CreateBroadcastSchema,
+    DeliveryStatus
+)
+from shared.exceptions.broadcasts import BroadcastNotFoundError, BroadcastStateError
+
+from .base import BaseService, BaseDataManager, dialect_insert
+
+class BroadcastService(BaseService):
+    """
+    Сервис для управления рассылками.
+
+    Сервис меняет только состояние рассылки в базе данных. Отправкой
+    занимается `Broadcaster` бота, который на каждой порции получателей
+    перечитывает статус, поэтому пауза действует и на рассылку,
+    запущенную в другом процессе.
+    """
+    async def create_broadcast(self, data: CreateBroadcastSchema) -> BroadcastSchema:
+        """
+        Создает рассылку в статусе PENDING.
+
+        Args:
+            data: Данные рассылки.
+
+        Returns:
+            Созданная рассылка.
+        """
+        return await BroadcastDataManager(self.session).add_one(Broadcast(text=data.text))
+
+    async def get_broadcast(self, broadcast_id: int) -> BroadcastSchema:
+        """
+        Получает рассылку по ID.
+
+        Args:
+            broadcast_id: ID рассылки.
+
+        Returns:
+            Рассылка.
+
+        Raises:
+            BroadcastNotFoundError: Если рассылка не найдена.
+        """
+        broadcast = await BroadcastDataManager(self.session).get_broadcast(broadcast_id)
+        if broadcast is None:
+            raise BroadcastNotFoundError(broadcast_id)
+        return broadcast
+
+    async def get_broadcasts(self) -> List[BroadcastSchema]:
+        """
+        Получает все рассылки, новые первыми.
+
+        Returns:
+            Список рассылок.
+        """
+        return await BroadcastDataManager(self.session).get_broadcasts()
+
+    async def start_broadcast(self, broadcast_id: int) -> BroadcastSchema:
+        """
+        Переводит новую или приостановленную рассылку в статус RUNNING.
+
+        Args:
+            broadcast_id: ID рассылки.
+
+        Returns:
+            Рассылка.
+
+        Raises:
+            BroadcastNotFoundError: Если рассылка не найдена.
+            BroadcastStateError: Если рассылка уже выполняется или завершена.
+        """
+        return await self._change_status(
+            broadcast_id,
+            BroadcastStatus.RUNNING,
+            [BroadcastStatus.PENDING, BroadcastStatus.PAUSED]
+        )
+
+    async def pause_broadcast(self, broadcast_id: int) -> BroadcastSchema:
+        """
+        Приостанавливает выполняющуюся рассылку.
+
+        Отправка останавливается после текущей порции получателей.
+
+        Args:
+            broadcast_id: ID рассылки.
+
+        Returns:
+            Рассылка.
+
+        Raises:
+            BroadcastNotFoundError: Если рассылка не найдена.
+            BroadcastStateError: Если рассылка не выполняется.
+        """
+        return await self._change_status(
+            broadcast_id,
+            BroadcastStatus.PAUSED,
+            [BroadcastStatus.RUNNING]
+        )
+
+    async def _change_status(
+        self,
+        broadcast_id: int,
+        status: BroadcastStatus,
+        allowed: List[BroadcastStatus]
+    ) -> BroadcastSchema:
+        """
+        Меняет статус рассылки, если текущий статус входит в разрешенные.
+
+        Args:
+            broadcast_id: ID рассылки.
+            status: Новый статус.
+            allowed: Статусы, из которых разрешен переход.
+
+        Returns:
+            Рассылка.
+        """
+        data_manager = BroadcastDataManager(self.session)
+        broadcast = await data_manager.set_status(broadcast_id, status, allowed)
+        if broadcast is None:
+            current = await self.get_broadcast(broadcast_id)
+            raise BroadcastStateError(broadcast_id, current.status.value)
+        return broadcast
+
+class BroadcastDataManager(BaseDataManager[BroadcastSchema]):
+    """
+    Менеджер данных для рассылок.
+
+    Args:
+        session (AsyncSession): Асинхронная сессия базы данных.
+        model (Type[Broadcast]): Модель рассылки.
+        schema (Type[BroadcastSchema]): Схема рассылки.
+    """
+    def __init__(self, session: AsyncSession):
+        """
+        Инициализация менеджера данных для рассылок.
+        """
+        super().__init__(
+                session=session,
+                schema=BroadcastSchema,
+                model=Broadcast
+            )
+
+    async def get_broadcast(self, broadcast_id: int) -> BroadcastSchema | None:
+        """
+        Получает рассылку по ID.
+
+        Args:
+            broadcast_id: ID рассылки.
+
+        Returns:
+            Рассылка или None, если она не найдена.
+        """
+        statement = select(self.model).where(self.model.id == broadcast_id)
+        broadcast = await self.get_one(statement)
+        return self.schema.model_validate(broadcast) if broadcast else None
+
+    async def get_broadcasts(self, status: BroadcastStatus | None = None) -> List[BroadcastSchema]:
+        """
+        Получает рассылки, новые первыми.
+
+        Args:
+            status: Фильтр по статусу.
+
+        Returns:
+            Список рассылок.
+        """
+        statement = select(self.model).order_by(self.model.id.desc())
+        if status is not None:
+            statement = statement.where(self.model.status == status)
+        return await self.get_all(statement)
+
+    async def get_unleased(self) -> List[BroadcastSchema]:
+        """
+        Получает выполняющиеся рассылки, которые не отправляет ни один процесс
+        (аренда свободна или истекла).
+
+        Returns:
+            Список рассылок.
+        """
+        statement = select(self.model).where(
+            self.model.status == BroadcastStatus.RUNNING,
+            or_(self.model.owner.is_(None), self.model.lease_until < datetime.now())
+        ).order_by(self.model.id)
+        return await self.get_all(statement)
+
+    async def set_status(
+        self,
+        broadcast_id: int,
+        status: BroadcastStatus,
+        allowed: List[BroadcastStatus]
+    ) -> BroadcastSchema | None:
+        """
+        Атомарно меняет статус рассылки, если текущий статус входит в разрешенные.
+
+        Args:
+            broadcast_id: ID рассылки.
+            status: Новый статус.
+            allowed: Статусы, из которых разрешен переход.
+
+        Returns:
+            Обновленная рассылка или None, если переход не выполнен.
+        """
+        statement = (
+            update(self.model)
+            .where(self.model.id == broadcast_id, self.model.status.in_(allowed))
+            .values(status=status)
+            .returning(self.model)
+        )
+        try:
+            result = await self.session.execute(
+                statement,
+                execution_options={"populate_existing": True}
+            )
+            broadcast = result.scalar_one_or_none()
+            await self.session.commit()
+            return self.schema.model_validate(broadcast) if broadcast else None
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logging.error("Ошибка при смене статуса рассылки %s: %s", broadcast_id, e)
+            raise
+
+    async def acquire_lease(self, broadcast_id: int, owner: str, seconds: float) -> bool:
+        """
+        Атомарно берет или продлевает аренду выполняющейся рассылки.
+
+        Аренду можно взять, если рассылка в статусе RUNNING и аренда
+        свободна, истекла или уже принадлежит этому процессу. Дата
+        изменения рассылки при этом не меняется.
+
+        Args:
+            broadcast_id: ID рассылки.
+            owner: Идентификатор процесса.
+            seconds: Срок аренды, секунды.
+
+        Returns:
+            True, если аренда принадлежит процессу.
+        """
+        now = datetime.now()
+        statement = (
+            update(self.model)
+            .where(
+                self.model.id == broadcast_id,
+                self.model.status == BroadcastStatus.RUNNING,
+                or_(
+                    self.model.owner.is_(None),
+                    self.model.owner == owner,
+                    self.model.lease_until < now
+                )
+            )
+            .values(
+                owner=owner,
+                lease_until=now + timedelta(seconds=seconds),
+                updated_at=self.model.updated_at
+            )
+            .returning(self.model.id)
+        )
+        try:
+            acquired = (await self.session.execute(statement)).scalar_one_or_none() is not None
+            await self.session.commit()
+            return acquired
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logging.error("Ошибка при аренде рассылки %s: %s", broadcast_id, e)
+            raise
+
+    async def release_lease(self, broadcast_id: int, owner: str) -> None:
+        """
+        Освобождает аренду рассылки, если она принадлежит процессу.
+
+        Args:
+            broadcast_id: ID рассылки.
+            owner: Идентификатор процесса.
+        """
+        statement = (
+            update(self.model)
+            .where(self.model.id == broadcast_id, self.model.owner == owner)
+            .values(owner=None, lease_until=None, updated_at=self.model.updated_at)
+        )
+        try:
+            await self.session.execute(statement)
+            await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logging.error("Ошибка при освобождении рассылки %s: %s", broadcast_id, e)
+            raise
+
+    async def get_recipients(
+        self,
+        broadcast_id: int,
+        after_user_id: int,
+        limit: int
+    ) -> List[Tuple[int, int]]:
+        """
+        Получает следующую порцию получателей рассылки.
+
+        Выборка по ключу (`id > after_user_id ORDER BY id LIMIT n`) не
+        деградирует к концу таблицы, в отличие от OFFSET. Пользователи,
+        которым рассылка уже доставлялась (остановка посреди порции),
+        пропускаются.
+
+        Args:
+            broadcast_id: ID рассылки.
+            after_user_id: ID последнего обработанного пользователя.
+            limit: Размер порции.
+
+        Returns:
+            Список пар (ID пользователя, ID чата).
+        """
+        statement = (
+            select(User.id, User.chat_id)
+            .where(
+                User.id > after_user_id,
+                User.chat_id.is_not(None),
+                User.is_blocked.is_(False),
+                ~exists().where(
+                    BroadcastDelivery.broadcast_id == broadcast_id,
+                    BroadcastDelivery.user_id == User.id
+                )
+            )
+            .order_by(User.id)
+            .limit(limit)
+        )
+        result = await self.session.execute(statement)
+        return [(user_id, chat_id) for user_id, chat_id in result.all()]
+
+    async def save_progress(
+        self,
+        broadcast_id: int,
+        cursor: int,
+        deliveries: List[Dict[str, Any]]
+    ) -> None:
+        """
+        Сохраняет результаты доставки порции получателей одной транзакцией.
+
+        Записывает результаты доставки, увеличивает счетчики рассылки,
+        сдвигает курсор и помечает пользователей, заблокировавших бота.
+        Счетчики учитывают только вставленные результаты: повторно
+        сохраненная доставка (например, после перезапуска) их не меняет.
+
+        Args:
+            broadcast_id: ID рассылки.
+            cursor: ID последнего обработанного пользователя.
+            deliveries: Результаты доставки (`user_id`, `status`, `error`).
+        """
+        counts: Counter = Counter()
+        blocked_ids = [
+            delivery["user_id"]
+            for delivery in deliveries
+            if delivery["status"] == DeliveryStatus.BLOCKED
+        ]
+        try:
+            if deliveries:
+                now = datetime.now()
+                insert = dialect_insert(self.session)
+                inserted = await self.session.execute(
+                    insert(BroadcastDelivery)
+                    .values([
+                        {
+                            "broadcast_id": broadcast_id,
+                            "created_at": now,
+                            "updated_at": now,
+                            **delivery
+                        }
+                        for delivery in deliveries
+                    ])
+                    .on_conflict_do_nothing(index_elements=["broadcast_id", "user_id"])
+                    .returning(BroadcastDelivery.status)
+                )
+                counts.update(inserted.scalars().all())
+            await self.session.execute(
+                update(self.model)
+                .where(self.model.id == broadcast_id)
+                .values(
+                    cursor=cursor,
+                    sent=self.model.sent + counts[DeliveryStatus.SENT],
+                    blocked=self.model.blocked + counts[DeliveryStatus.BLOCKED],
+                    failed=self.model.failed + counts[DeliveryStatus.FAILED]
+                )
+            )
+            if blocked_ids:
+                await self.session.execute(
+                    update(User).where(User.id.in_(blocked_ids)).values(is_blocked=True)
+                )
+            await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logging.error("Ошибка при сохранении прогресса рассылки %s: %s", broadcast_id, e)
+            raise
@@ -0,0 +1,83 @@
+from datetime import datetime
+from sqlalchemy import select, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from shared.models.fsm import FSMState
+from shared.schemas.fsm import FSMStateSchema
+
+from .base import BaseDataManager, dialect_insert
+
+class FSMDataManager(BaseDataManager[FSMStateSchema]):
+    """
+    Менеджер данных для хранилища состояний FSM бота.
+
+    Args:
+        session (AsyncSession): Асинхронная сессия базы данных.
+        model (Type[FSMState]): Модель состояния FSM.
+        schema (Type[FSMStateSchema]): Схема состояния FSM.
+    """
+    def __init__(self, session: AsyncSession):
+        """
+        Инициализация менеджера данных для состояний FSM.
+        """
+        super().__init__(
+                session=session,
+                schema=FSMStateSchema,
+                model=FSMState
+            )
+
+    async def get_state(self, key: str) -> FSMStateSchema | None:
+        """
+        Получает состояние и данные FSM по ключу.
+
+        Args:
+            key (str): Ключ контекста FSM.
+
+        Returns:
+            FSMStateSchema | None: Состояние FSM или None, если записи нет.
+        """
+        statement = select(self.model).where(self.model.key == key)
+        record = await self.get_one(statement)
+        return self.schema.model_validate(record) if record else None
+
+    async def upsert_states(self, records: list[FSMStateSchema]) -> None:
+        """
+        Сохраняет состояния FSM одним запросом INSERT ... ON CONFLICT (key).
+
+        Args:
+            records (list[FSMStateSchema]): Состояния для сохранения.
+        """
+        if not records:
+            return
+        now = datetime.now()
+        insert = dialect_insert(self.session)
+        statement = insert(self.model).values([
+            {
+                "key": record.key,
+                "state": record.state,
+                "data": record.data,
+                "created_at": now,
+                "updated_at": now
+            }
+            for record in records
+        ])
+        statement = statement.on_conflict_do_update(
+            index_elements=[self.model.key],
+            set_={
+                "state": statement.excluded.state,
+                "data": statement.excluded.data,
+                "updated_at": statement.excluded.updated_at
+            }
+        )
+        await self.session.execute(statement)
+        await self.session.commit()
+
+    async def delete_states(self, keys: list[str]) -> None:
+        """
+        Удаляет состояния FSM по ключам.
+
+        Args:
+            keys (list[str]): Ключи контекстов FSM.
+        """
+        if not keys:
+            return
+        await self.delete_all(delete(self.model).where(self.model.key.in_(keys)))
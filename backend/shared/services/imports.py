@@ -0,0 +1,293 @@
+"""
+Модуль массового импорта постов.
+
+Посты из архива канала загружаются NDJSON-потоком (один пост в строке)
+вместо тысяч вызовов `POST /posts` и `/tags/post-tags`. Поток разбирается
+построчно по мере чтения, строки проверяются и сохраняются порциями по
+`settings.import_chunk_size`:
+
+- авторы порции проверяются одним запросом;
+- теги порции находятся одним запросом, недостающие создаются одной
+  многострочной вставкой;
+- посты и связи с тегами вставляются многострочными INSERT;
+- каждая порция фиксируется отдельной транзакцией.
+
+В памяти находятся только текущая строка и текущая порция, в отчет
+попадают не больше `settings.import_max_errors` ошибок, поэтому память не
+зависит от размера загрузки. Ошибка базы данных отменяет только свою
+порцию: ее строки попадают в отчет, импорт продолжается.
+
+Classes:
+- ImportService: Импорт постов из NDJSON-потока.
+- ImportDataManager: Многострочные вставки порции постов и тегов.
+
+Functions:
+- read_lines: Разбивает поток байтов на строки.
+"""
+import logging
+from datetime import datetime
+from typing import AsyncIterable, AsyncIterator, Dict, List, Set, Tuple
+from pydantic import ValidationError
+from sqlalchemy import insert, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from shared.models.posts import Post
+from shared.models.tags import Tag
+from shared.models.post_tags import PostTag
+from shared.models.users import User
+from shared.schemas.imports import ImportErrorSchema, ImportReportSchema, PostImportSchema
+from shared.schemas.posts import PostSchema
+from settings import settings
+from .base import BaseService, BaseDataManager, dialect_insert
+from .posts import post_reads
+
+# Строка импорта: номер строки и проверенный пост
+ImportLine = Tuple[int, PostImportSchema]
+
+
+async def read_lines(chunks: AsyncIterable[bytes], max_length: int) -> AsyncIterator[Tuple[int, bytes | None]]:
+    """
+    Разбивает поток байтов на строки.
+
+    Строка длиннее `max_length` не накапливается: ее остаток пропускается
+    до конца строки, а вместо содержимого возвращается None.
+
+    Args:
+        chunks (AsyncIterable[bytes]): Поток байтов (тело запроса, файл).
+        max_length (int): Максимальная длина строки, байт.
+
+    Yields:
+        Tuple[int, bytes | None]: Номер строки (с 1) и ее содержимое.
+    """
+    buffer = bytearray()
+    number = 0
+    overflow = False
+    async for chunk in chunks:
+        start = 0
+        while True:
+            end = chunk.find(b"\n", start)
+            if end < 0:
+                if not overflow:
+                    buffer += chunk[start:]
+                    if len(buffer) > max_length:
+                        overflow = True
+                        buffer.clear()
+                break
+            number += 1
+            if not overflow:
+                buffer += chunk[start:end]
+                overflow = len(buffer) > max_length
+            yield number, None if overflow else bytes(buffer)
+            buffer.clear()
+            overflow = False
+            start = end + 1
+    if buffer or overflow:
+        yield number + 1, None if overflow else bytes(buffer)
+
+
+class ImportService(BaseService):
+    """
+    Сервис массового импорта постов.
+
+    Args:
+        session (AsyncSession): Асинхронная сессия базы данных.
+
+    Methods:
+        import_posts: Импортирует посты из NDJSON-потока.
+    """
+    async def import_posts(self, chunks: AsyncIterable[bytes]) -> ImportReportSchema:
+        """
+        Импортирует посты из NDJSON-потока.
+
+        Args:
+            chunks (AsyncIterable[bytes]): Поток байтов NDJSON.
+
+        Returns:
+            ImportReportSchema: Отчет с количеством постов и ошибками строк.
+        """
+        report = ImportReportSchema()
+        manager = ImportDataManager(self.session)
+        batch: List[ImportLine] = []
+
+        async for number, line in read_lines(chunks, settings.import_max_line):
+            if line is None:
+                report.total += 1
+                self._add_error(report, number, f"Строка длиннее {settings.import_max_line} байт")
+                continue
+            if not line.strip():
+                continue
+            report.total += 1
+            try:
+                batch.append((number, PostImportSchema.model_validate_json(line)))
+            except ValidationError as e:
+                self._add_error(report, number, self._describe(e))
+                continue
+            if len(batch) >= settings.import_chunk_size:
+                await self._save(manager, batch, report)
+                batch = []
+
+        if batch:
+            await self._save(manager, batch, report)
+        # Ошибки базы данных добавляются после ошибок проверки строк порции
+        report.errors.sort(key=lambda item: item.line)
+        if report.imported:
+            post_reads.clear()
+        return report
+
+    async def _save(self, manager: "ImportDataManager", batch: List[ImportLine], report: ImportReportSchema) -> None:
+        """
+        Сохраняет порцию постов отдельной транзакцией.
+
+        Args:
+            manager (ImportDataManager): Менеджер данных импорта.
+            batch (List[ImportLine]): Порция проверенных строк.
+            report (ImportReportSchema): Отчет импорта.
+        """
+        try:
+            imported, errors = await manager.insert_posts(batch)
+            await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logging.error("Ошибка импорта строк %d-%d: %s", batch[0][0], batch[-1][0], e)
+            for number, _ in batch:
+                self._add_error(report, number, f"Ошибка базы данных: {e.__class__.__name__}")
+            return
+        report.imported += imported
+        for number, error in errors:
+            self._add_error(report, number, error)
+
+    @staticmethod
+    def _add_error(report: ImportReportSchema, number: int, error: str) -> None:
+        """
+        Добавляет ошибку строки в отчет.
+
+        Args:
+            report (ImportReportSchema): Отчет импорта.
+            number (int): Номер строки.
+            error (str): Описание ошибки.
+        """
+        report.failed += 1
+        if len(report.errors) < settings.import_max_errors:
+            report.errors.append(ImportErrorSchema(line=number, error=error))
+
+    @staticmethod
+    def _describe(error: ValidationError) -> str:
+        """
+        Формирует краткое описание ошибок проверки строки.
+
+        Args:
+            error (ValidationError): Ошибка проверки.
+
+        Returns:
+            str: Ошибки полей через "; ".
+        """
+        return "; ".join(
+            f"{'.'.join(str(part) for part in item['loc']) or 'строка'}: {item['msg']}"
+            for item in error.errors(include_url=False)
+        )
+
+
+class ImportDataManager(BaseDataManager[PostSchema]):
+    """
+    Менеджер данных массового импорта постов.
+
+    Args:
+        session (AsyncSession): Асинхронная сессия базы данных.
+        schema (Type[PostSchema]): Схема данных поста.
+        model (Type[Post]): Модель данных поста.
+    """
+    def __init__(self, session: AsyncSession):
+        """
+        Инициализация менеджера данных импорта.
+        """
+        super().__init__(
+                session=session,
+                schema=PostSchema,
+                model=Post
+            )
+
+    async def insert_posts(self, batch: List[ImportLine]) -> Tuple[int, List[Tuple[int, str]]]:
+        """
+        Вставляет порцию постов с тегами (без фиксации транзакции).
+
+        Args:
+            batch (List[ImportLine]): Порция проверенных строк.
+
+        Returns:
+            Tuple[int, List[Tuple[int, str]]]: Количество вставленных постов
+                и ошибки строк (номер строки, описание).
+        """
+        authors = await self.existing_users({post.author for _, post in batch})
+        errors = [
+            (number, f"Пользователь с ID {post.author} не найден")
+            for number, post in batch if post.author not in authors
+        ]
+        posts = [post for _, post in batch if post.author in authors]
+        if not posts:
+            return 0, errors
+
+        tag_ids = await self.resolve_tags({name for post in posts for name in post.tags})
+
+        now = datetime.now()
+        statement = insert(Post).returning(Post.id, sort_by_parameter_order=True)
+        post_ids = (await self.session.execute(statement, [
+            {
+                "name": post.name,
+                "content": post.content,
+                "author": post.author,
+                "status": post.status,
+                "rating": post.rating,
+                "created_at": post.created_at or now,
+                "updated_at": post.created_at or now,
+            }
+            for post in posts
+        ])).scalars().all()
+
+        post_tags = [
+            {"post_id": post_id, "tag_id": tag_ids[name]}
+            for post_id, post in zip(post_ids, posts)
+            for name in dict.fromkeys(post.tags)
+        ]
+        if post_tags:
+            await self.session.execute(insert(PostTag), post_tags)
+        return len(post_ids), errors
+
+    async def existing_users(self, user_ids: Set[int]) -> Set[int]:
+        """
+        Возвращает ID существующих пользователей из набора.
+
+        Args:
+            user_ids (Set[int]): ID пользователей.
+
+        Returns:
+            Set[int]: Существующие ID.
+        """
+        statement = select(User.id).where(User.id.in_(user_ids))
+        return set((await self.session.scalars(statement)).all())
+
+    async def resolve_tags(self, names: Set[str]) -> Dict[str, int]:
+        """
+        Возвращает ID тегов по названиям, создавая недостающие одной вставкой.
+
+        Тег, одновременно созданный другим импортом, пропускается
+        (`ON CONFLICT DO NOTHING`) и находится повторным запросом.
+
+        Args:
+            names (Set[str]): Названия тегов (в нижнем регистре).
+
+        Returns:
+            Dict[str, int]: ID тегов по названиям.
+        """
+        if not names:
+            return {}
+        statement = select(Tag.name, Tag.id).where(Tag.name.in_(names))
+        tag_ids = dict((await self.session.execute(statement)).tuples().all())
+
+        missing = sorted(names - tag_ids.keys())
+        if missing:
+            insert_tags = dialect_insert(self.session)
+            statement = insert_tags(Tag).on_conflict_do_nothing(index_elements=[Tag.name])
+            await self.session.execute(statement, [{"name": name} for name in missing])
+            statement = select(Tag.name, Tag.id).where(Tag.name.in_(missing))
+            tag_ids.update((await self.session.execute(statement)).tuples().all())
+        return tag_ids
@@ -0,0 +1,272 @@
+import logging
+from datetime import datetime, timedelta
+from typing import List
+from sqlalchemy import or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.sql.elements import ColumnElement
+from shared.feed import feed
+from shared.models.posts import Post
+from shared.schemas.posts import PostStatus
+from shared.schemas.moderation import (
+    ModerationDecision,
+    ModerationPostSchema,
+    ModerationResultSchema
+)
+from settings import settings
+
+from .base import BaseService, BaseDataManager
+from .posts import post_reads
+
+# Статус, в который переводит пост решение модератора
+DECISION_STATUS = {
+    ModerationDecision.APPROVE: PostStatus.PUBLISHED,
+    ModerationDecision.REJECT: PostStatus.DRAFT,
+}
+
+class ModerationService(BaseService):
+    """
+    Сервис очереди модерации постов.
+
+    Модератор берет из очереди порцию постов на проверке: посты
+    закрепляются за ним на `moderation_lease_seconds` секунд и другим
+    модераторам не выдаются. Если модератор не принял решение до
+    истечения срока, посты снова попадают в очередь.
+
+    Methods:
+        claim_posts: Закрепляет за модератором порцию постов из очереди.
+        decide: Публикует или отклоняет посты одним запросом.
+        release_posts: Возвращает посты модератора в очередь.
+    """
+    async def claim_posts(
+        self,
+        moderator_id: int,
+        limit: int = settings.moderation_batch_size,
+        after_id: int = 0
+    ) -> List[ModerationPostSchema]:
+        """
+        Закрепляет за модератором порцию постов из очереди.
+
+        Посты, уже закрепленные за этим модератором, выдаются повторно,
+        а срок их закрепления продлевается.
+
+        Args:
+            moderator_id: ID модератора.
+            limit: Максимальное количество постов.
+            after_id: Выдавать только посты с ID больше указанного.
+
+        Returns:
+            Закрепленные посты в порядке поступления.
+        """
+        return await ModerationDataManager(self.session).claim(
+            moderator_id,
+            limit=min(limit, settings.moderation_max_batch),
+            lease=timedelta(seconds=settings.moderation_lease_seconds),
+            after_id=after_id
+        )
+
+    async def decide(
+        self,
+        moderator_id: int,
+        post_ids: List[int],
+        decision: ModerationDecision
+    ) -> ModerationResultSchema:
+        """
+        Публикует или отклоняет посты одним запросом.
+
+        Решение применяется к постам на проверке, которые закреплены за
+        модератором или ни за кем не закреплены. Остальные посты
+        возвращаются в `skipped`.
+
+        Args:
+            moderator_id: ID модератора.
+            post_ids: ID постов.
+            decision: Решение.
+
+        Returns:
+            Измененные и пропущенные посты.
+        """
+        post_ids = list(dict.fromkeys(post_ids))
+        updated = await ModerationDataManager(self.session).set_status(
+            moderator_id,
+            post_ids,
+            DECISION_STATUS[decision]
+        )
+        status = DECISION_STATUS[decision]
+        for post_id in sorted(updated):
+            feed.publish_status(post_id, status.value)
+        return ModerationResultSchema(
+            updated=sorted(updated),
+            skipped=[post_id for post_id in post_ids if post_id not in updated]
+        )
+
+    async def release_posts(self, moderator_id: int, post_ids: List[int]) -> List[int]:
+        """
+        Возвращает посты модератора в очередь без решения.
+
+        Args:
+            moderator_id: ID модератора.
+            post_ids: ID постов.
+
+        Returns:
+            ID возвращенных в очередь постов.
+        """
+        return sorted(await ModerationDataManager(self.session).release(moderator_id, post_ids))
+
+
+class ModerationDataManager(BaseDataManager[ModerationPostSchema]):
+    """
+    Менеджер данных очереди модерации.
+
+    Все операции выполняются одним UPDATE ... RETURNING без загрузки
+    моделей. В PostgreSQL выборка порции использует
+    `FOR UPDATE SKIP LOCKED`, поэтому параллельные модераторы получают
+    непересекающиеся порции, не ожидая друг друга. SQLite не поддерживает
+    блокировки строк (SQLAlchemy опускает этот фрагмент запроса), но
+    записи в нем выполняются последовательно, а условие свободного срока
+    закрепления проверяется в самом UPDATE.
+    """
+    def __init__(self, session: AsyncSession):
+        """
+        Инициализация менеджера данных очереди модерации.
+        """
+        super().__init__(
+            session=session,
+            schema=ModerationPostSchema,
+            model=Post
+        )
+
+    @staticmethod
+    def _available(moderator_id: int, now: datetime) -> ColumnElement[bool]:
+        """
+        Условие: пост ни за кем не закреплен, срок истек или он закреплен за модератором.
+
+        Args:
+            moderator_id: ID модератора.
+            now: Текущее время.
+
+        Returns:
+            Условие для WHERE.
+        """
+        return or_(
+            Post.claimed_until.is_(None),
+            Post.claimed_until < now,
+            Post.moderator_id == moderator_id
+        )
+
+    async def claim(
+        self,
+        moderator_id: int,
+        limit: int,
+        lease: timedelta,
+        after_id: int = 0
+    ) -> List[ModerationPostSchema]:
+        """
+        Закрепляет за модератором порцию постов на проверке.
+
+        Args:
+            moderator_id: ID модератора.
+            limit: Максимальное количество постов.
+            lease: Срок закрепления.
+            after_id: Выдавать только посты с ID больше указанного.
+
+        Returns:
+            Закрепленные посты, отсортированные по ID.
+        """
+        now = datetime.now()
+        available = self._available(moderator_id, now)
+        queue = (
+            select(Post.id)
+            .where(Post.status == PostStatus.CHECKING, Post.id > after_id, available)
+            .order_by(Post.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        statement = (
+            update(Post)
+            .where(Post.id.in_(queue), Post.status == PostStatus.CHECKING, available)
+            # Закрепление не меняет пост: updated_at остается прежним
+            .values(moderator_id=moderator_id, claimed_until=now + lease, updated_at=Post.updated_at)
+            .returning(Post.id, Post.name, Post.content, Post.author, Post.claimed_until)
+            .execution_options(synchronize_session=False)
+        )
+        try:
+            result = await self.session.execute(statement)
+            rows = result.all()
+            await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logging.error("Ошибка при выдаче постов модератору %s: %s", moderator_id, e)
+            raise
+        return sorted((self.schema.model_validate(row) for row in rows), key=lambda post: post.id)
+
+    async def set_status(self, moderator_id: int, post_ids: List[int], status: PostStatus) -> set[int]:
+        """
+        Меняет статус постов на проверке одним запросом и снимает закрепление.
+
+        Args:
+            moderator_id: ID модератора.
+            post_ids: ID постов.
+            status: Новый статус.
+
+        Returns:
+            ID измененных постов.
+        """
+        if not post_ids:
+            return set()
+        statement = (
+            update(Post)
+            .where(
+                Post.id.in_(post_ids),
+                Post.status == PostStatus.CHECKING,
+                self._available(moderator_id, datetime.now())
+            )
+            .values(status=status, moderator_id=moderator_id, claimed_until=None)
+            .returning(Post.id)
+            .execution_options(synchronize_session=False)
+        )
+        try:
+            result = await self.session.execute(statement)
+            updated = set(result.scalars().all())
+            await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logging.error("Ошибка при модерации постов %s: %s", post_ids, e)
+            raise
+        if updated:
+            post_reads.clear()
+        return updated
+
+    async def release(self, moderator_id: int, post_ids: List[int]) -> set[int]:
+        """
+        Снимает закрепление постов модератора.
+
+        Args:
+            moderator_id: ID модератора.
+            post_ids: ID постов.
+
+        Returns:
+            ID постов, с которых снято закрепление.
+        """
+        if not post_ids:
+            return set()
+        statement = (
+            update(Post)
+            .where(
+                Post.id.in_(post_ids),
+                Post.status == PostStatus.CHECKING,
+                Post.moderator_id == moderator_id
+            )
+            .values(moderator_id=None, claimed_until=None, updated_at=Post.updated_at)
+            .returning(Post.id)
+            .execution_options(synchronize_session=False)
+        )
+        try:
+            result = await self.session.execute(statement)
+            released = set(result.scalars().all())
+            await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logging.error("Ошибка при возврате постов в очередь %s: %s", post_ids, e)
+            raise
+        return released
@@ -1,14 +1,30 @@
-from typing import List
-from sqlalchemy import select, or_
+import logging
+from datetime import datetime
+from typing import List, Sequence
+from sqlalchemy import Row, Select, func, select, update, or_
+from sqlalchemy.orm import joinedload
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 from shared.models.posts import Post
 from shared.models.tags import Tag
 from shared.models.post_tags import PostTag
-from shared.schemas.base import PaginationParams
+from shared.schemas.base import PaginationParams, decode_cursor, encode_cursor
 from shared.schemas.users import UserRole
-from shared.schemas.posts import PostSchema, PostCreateSchema, PostUpdateSchema, PostStatus
+from shared.schemas.posts import PostSchema, PostCreateSchema, PostUpdateSchema, PostStatus, PostSort
+from shared.exceptions.base import InvalidCursorError
 from shared.exceptions.posts import PostNotFoundError, PostUpdateError
+from shared.feed import feed
+from settings import settings
 from .base import BaseService, BaseDataManager
+from .singleflight import SingleFlight
+
+# Одинаковые параллельные чтения постов выполняют один запрос
+post_reads = SingleFlight(
+    "posts",
+    ttl=settings.read_cache_ttl,
+    maxsize=settings.read_cache_size,
+    enabled=settings.read_singleflight
+)
 
 class PostService(BaseService):
     """
@@ -21,7 +37,10 @@ class PostService(BaseService):
         create_post: Создает новый пост в базе данных.
         update_post_status: Обновляет статус поста.
         get_post: Возвращает пост по его идентификатору.
+        get_post_version: Возвращает версию поста для условных запросов.
+        get_posts_batch: Возвращает посты по списку ID.
         get_posts: Возвращает список постов с пагинацией, поиском, фильтрацией и сортировкой.
+        get_posts_version: Возвращает версию списка постов для условных запросов.
         
         Ещё не реализованы:
         update_post: Обновляет существующий пост.
@@ -38,7 +57,7 @@ class PostService(BaseService):
         Returns:
             PostSchema: Созданный пост
         """
-        return PostDataManager(self.session).create_post(post, user_id)
+        return await PostDataManager(self.session).create_post(post, user_id)
 
     async def update_post(
         self,
@@ -58,7 +77,7 @@ class PostService(BaseService):
         Returns:
             PostSchema: Обновленный пост
         """
-        return PostDataManager(self.session).update_post(
+        return await PostDataManager(self.session).update_post(
             post_id=post_id,
             updated_data=updated_data,
             user_id=user_id,
@@ -67,7 +86,7 @@ class PostService(BaseService):
         
     async def update_post_status(self, post_id: int, status: PostStatus) -> PostSchema:
         """
-        Обновляет статус поста в базе данных.
+        Обновляет статус поста в базе данных и публикует событие в ленту.
         
         Args:
             post_id (int): ID поста
@@ -76,7 +95,10 @@ class PostService(BaseService):
         Returns:
             PostSchema: Обновленный пост
         """
-        return PostDataManager(self.session).update_post_status(post_id, status)
+        post = await PostDataManager(self.session).update_post_status(post_id, status)
+        if post:
+            feed.publish_status(post_id, status.value)
+        return post
                 
     async def get_post(self, post_id: int) -> PostSchema:
         """
@@ -88,7 +110,37 @@ class PostService(BaseService):
         Returns:
             PostSchema: Найденный пост
         """
-        return PostDataManager(self.session).get_post(post_id)
+        return await PostDataManager(self.session).get_post(post_id)
+
+    async def get_post_version(self, post_id: int) -> Row | None:
+        """
+        Возвращает версию поста без загрузки его содержимого.
+
+        Args:
+            post_id (int): ID поста
+
+        Returns:
+            Row | None: Строка (updated_at, status) или None, если поста нет
+        """
+        return await PostDataManager(self.session).get_post_version(post_id)
+
+    async def get_posts_batch(
+        self,
+        post_ids: List[int],
+        fields: Sequence[str] = None,
+    ) -> tuple[List[PostSchema], List[int]]:
+        """
+        Возвращает посты по списку ID одним запросом.
+
+        Args:
+            post_ids (List[int]): ID постов
+            fields (Sequence[str]): Поля постов, None - все поля
+
+        Returns:
+            tuple[List[PostSchema], List[int]]: Посты (или словари выбранных
+                полей) в порядке запроса и ненайденные ID
+        """
+        return await PostDataManager(self.session).get_many(post_ids, joinedload(Post.user), fields=fields)
 
     async def get_posts(
         self,
@@ -97,6 +149,8 @@ class PostService(BaseService):
         status: PostStatus = None,
         tags: List[str] = None,
         user_id: int = None,
+        total: int = None,
+        fields: Sequence[str] = None,
     ) -> tuple[List[PostSchema], int]:
         """
         Получает список постов с возможностью пагинации, поиска, фильтрации и сортировки.
@@ -107,16 +161,105 @@ class PostService(BaseService):
             status (PostStatus): Фильтрация по статусу
             tags (List[str]): Фильтрация по тегам
             user_id (int): Фильтрация по пользователю
+            total (int): Уже посчитанное количество постов (из версии списка)
+            fields (Sequence[str]): Поля постов, None - все поля
 
         Returns:
-            tuple[List[PostSchema], int]: Список постов и общее количество
+            tuple[List[PostSchema], int]: Список постов (или словарей
+                выбранных полей) и общее количество
         """
-        return PostDataManager(self.session).get_posts(
+        return await PostDataManager(self.session).get_posts(
             pagination=pagination,
             search=search,
             status=status,
             tags=tags,
             user_id=user_id,
+            total=total,
+            fields=fields,
+        )
+
+    async def get_posts_page(
+        self,
+        limit: int,
+        cursor: str = None,
+        sort: PostSort = PostSort.NEW,
+        search: str = None,
+        status: PostStatus = None,
+        tags: List[str] = None,
+        user_id: int = None,
+        fields: Sequence[str] = None,
+    ) -> tuple[List[PostSchema], str | None]:
+        """
+        Получает страницу постов по курсору (без подсчета общего количества).
+
+        Курсор содержит порядок сортировки и ключ последнего поста страницы,
+        поэтому курсор одного порядка не принимается для другого.
+
+        Args:
+            limit (int): Размер страницы
+            cursor (str): Курсор предыдущей страницы, None - первая страница
+            sort (PostSort): Порядок постов
+            search (str): Поиск по названию или контексту поста
+            status (PostStatus): Фильтрация по статусу
+            tags (List[str]): Фильтрация по тегам
+            user_id (int): Фильтрация по пользователю
+            fields (Sequence[str]): Поля постов, None - все поля
+
+        Returns:
+            tuple[List[PostSchema], str | None]: Посты (или словари
+                выбранных полей) и курсор следующей страницы
+
+        Raises:
+            InvalidCursorError: Если курсор поврежден или выдан для другого порядка
+        """
+        after = None
+        if cursor:
+            values = decode_cursor(cursor)
+            key = values[1:]
+            if (
+                values[:1] != [sort.value]
+                or len(key) != len(PostDataManager.SORT_KEYS[sort])
+                or not all(type(value) is int for value in key)
+            ):
+                raise InvalidCursorError()
+            after = key
+
+        posts, next_key = await PostDataManager(self.session).get_posts_page(
+            limit=limit,
+            after=after,
+            sort=sort,
+            search=search,
+            status=status,
+            tags=tags,
+            user_id=user_id,
+            fields=fields,
+        )
+        return posts, next_key and encode_cursor((sort.value, *next_key))
+
+    async def get_posts_version(
+        self,
+        search: str = None,
+        status: PostStatus = None,
+        tags: List[str] = None,
+        user_id: int = None,
+    ) -> tuple[int, datetime | None]:
+        """
+        Возвращает версию списка постов с заданными фильтрами.
+
+        Args:
+            search (str): Поиск по названию или контексту поста
+            status (PostStatus): Фильтрация по статусу
+            tags (List[str]): Фильтрация по тегам
+            user_id (int): Фильтрация по пользователю
+
+        Returns:
+            tuple[int, datetime | None]: Количество постов и последнее изменение
+        """
+        return await PostDataManager(self.session).get_posts_version(
+            search=search,
+            status=status,
+            tags=tags,
+            user_id=user_id,
         )
 
 
@@ -129,6 +272,12 @@ class PostDataManager(BaseDataManager[PostSchema]):
         schema (Type[PostSchema]): Схема данных поста.
         model (Type[Post]): Модель данных поста.
     """
+    # Колонки ключа сортировки ленты с курсором (по убыванию, `id` - уникальность)
+    SORT_KEYS = {
+        PostSort.NEW: (Post.id,),
+        PostSort.TOP: (Post.rating, Post.id),
+    }
+
     def __init__(self, session: AsyncSession):
         """
         Инициализация менеджера данных для постов.
@@ -154,7 +303,9 @@ class PostDataManager(BaseDataManager[PostSchema]):
         post_data['user_id'] = user_id
         post_data['status'] = PostStatus.CHECKING
         post_model = Post(**post_data)
-        return await self.add_one(post_model)
+        created = await self.add_one(post_model)
+        post_reads.clear()
+        return created
     
     async def update_post(
         self,
@@ -186,11 +337,15 @@ class PostDataManager(BaseDataManager[PostSchema]):
                 raise PostUpdateError(post_id, "Нет прав на редактирование")
         
         updated_post = Post(**updated_data.model_dump())
-        return await self.update_one(post, updated_post)
+        updated = await self.update_one(post, updated_post)
+        post_reads.clear()
+        return updated
     
     async def update_post_status(self, post_id: int, status: PostStatus) -> PostSchema:
         """
-        Обновляет статус поста.
+        Обновляет статус поста одним UPDATE и снимает закрепление за модератором.
+
+        Массовые решения модераторов выполняет `ModerationService`.
 
         Args:
             post_id (int): ID поста
@@ -199,27 +354,65 @@ class PostDataManager(BaseDataManager[PostSchema]):
         Returns:
             PostSchema: Обновленный пост
         """
-        statement = select(Post).where(Post.id == post_id)
-        post = await self.get_one(statement)
-        
-        if not post:
+        statement = (
+            update(Post)
+            .where(Post.id == post_id)
+            .values(status=status, claimed_until=None)
+            .returning(Post.id)
+            .execution_options(synchronize_session=False)
+        )
+        try:
+            result = await self.session.execute(statement)
+            updated = result.scalar_one_or_none()
+            await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logging.error("Ошибка при обновлении статуса поста %s: %s", post_id, e)
+            raise
+
+        post_reads.clear()
+        if updated is None:
             return None
-        
-        updated_post = Post(id=post_id, status=status)
-        return await self.update_one(post, updated_post)
+
+        statement = select(Post).options(joinedload(Post.user)).where(Post.id == post_id)
+        return self.schema.model_validate(await self.get_one(statement))
     
     async def get_post(self, post_id: int) -> PostSchema:
         """
         Получает пост по его ID.
 
+        Одновременные запросы одного поста выполняют один SQL-запрос
+        (`post_reads`).
+
         Args:
             post_id (int): ID запрашиваемого поста
 
         Returns:
             PostSchema: Найденный пост
         """
-        statement = select(Post).where(Post.id == post_id)
-        return await self.get_one(statement)
+        async def query() -> PostSchema | None:
+            statement = select(Post).options(joinedload(Post.user)).where(Post.id == post_id)
+            post = await self.get_one(statement)
+            return self.schema.model_validate(post) if post else None
+
+        return await post_reads.do(("post", post_id), query)
+
+    async def get_post_version(self, post_id: int) -> Row | None:
+        """
+        Получает дату изменения и статус поста одним запросом по ключу.
+
+        Args:
+            post_id (int): ID поста
+
+        Returns:
+            Row | None: Строка (updated_at, status) или None, если поста нет
+        """
+        async def query() -> Row | None:
+            statement = select(Post.updated_at, Post.status).where(Post.id == post_id)
+            result = await self.session.execute(statement)
+            return result.first()
+
+        return await post_reads.do(("post_version", post_id), query)
 
     async def get_posts(
         self,
@@ -228,6 +421,8 @@ class PostDataManager(BaseDataManager[PostSchema]):
         status: PostStatus = None,
         tags: List[str] = None,
         user_id: int = None,
+        total: int = None,
+        fields: Sequence[str] = None,
     ) -> tuple[List[PostSchema], int]:
         """
         Получает список постов с возможностью пагинации, поиска, фильтрации и сортировки.
@@ -238,10 +433,145 @@ class PostDataManager(BaseDataManager[PostSchema]):
             status (PostStatus): Фильтрация по статусу
             tags (List[str]): Фильтрация по тегам
             user_id (int): Фильтрация по пользователю
+            total (int): Уже посчитанное количество постов
+            fields (Sequence[str]): Поля постов; только колонки - выбираются
+                только они, без `content` и автора
             
         Returns:
                 tuple[List[PostSchema], int]: Список постов и общее количество
         """
+        async def query() -> tuple[List[PostSchema], int]:
+            statement = self._filter_posts(search, status, tags, user_id)
+            if fields is None or not self.column_fields(fields):
+                statement = statement.options(joinedload(Post.user))
+            return await self.get_paginated(statement, pagination, total, fields)
+
+        key = (
+            "posts",
+            self._filter_key(search, status, tags, user_id),
+            pagination.skip,
+            pagination.limit,
+            pagination.sort_by,
+            pagination.sort_desc,
+            total,
+            fields,
+        )
+        return await post_reads.do(key, query)
+
+    async def get_posts_page(
+        self,
+        limit: int,
+        after: Sequence = None,
+        sort: PostSort = PostSort.NEW,
+        search: str = None,
+        status: PostStatus = None,
+        tags: List[str] = None,
+        user_id: int = None,
+        fields: Sequence[str] = None,
+    ) -> tuple[List[PostSchema], tuple | None]:
+        """
+        Получает страницу постов по ключу сортировки (keyset).
+
+        Args:
+            limit (int): Размер страницы
+            after (Sequence): Ключ последнего поста предыдущей страницы
+            sort (PostSort): Порядок постов
+            search (str): Поиск по названию или контексту поста
+            status (PostStatus): Фильтрация по статусу
+            tags (List[str]): Фильтрация по тегам
+            user_id (int): Фильтрация по пользователю
+            fields (Sequence[str]): Поля постов, None - все поля
+
+        Returns:
+            tuple[List[PostSchema], tuple | None]: Посты и ключ последнего
+                поста, если есть следующая страница
+        """
+        async def query() -> tuple[List[PostSchema], tuple | None]:
+            statement = self._filter_posts(search, status, tags, user_id)
+            if fields is None or not self.column_fields(fields):
+                statement = statement.options(joinedload(Post.user))
+            return await self.get_cursor_page(statement, self.SORT_KEYS[sort], limit, after, fields)
+
+        key = (
+            "posts_page",
+            self._filter_key(search, status, tags, user_id),
+            sort,
+            limit,
+            tuple(after) if after is not None else None,
+            fields,
+        )
+        return await post_reads.do(key, query)
+
+    async def get_posts_version(
+        self,
+        search: str = None,
+        status: PostStatus = None,
+        tags: List[str] = None,
+        user_id: int = None,
+    ) -> tuple[int, datetime | None]:
+        """
+        Получает количество постов и максимальный `updated_at` одним
+        агрегатным запросом. Количество учитывает удаление постов, дата -
+        их изменение.
+
+        Args:
+            search (str): Поиск по названию или контексту поста
+            status (PostStatus): Фильтрация по статусу
+            tags (List[str]): Фильтрация по тегам
+            user_id (int): Фильтрация по пользователю
+
+        Returns:
+            tuple[int, datetime | None]: Количество постов и последнее изменение
+        """
+        async def query() -> tuple[int, datetime | None]:
+            posts = self._filter_posts(search, status, tags, user_id).subquery()
+            statement = select(func.count(), func.max(posts.c.updated_at))
+            total, last_modified = (await self.session.execute(statement)).one()
+            return total, last_modified
+
+        key = ("posts_version", self._filter_key(search, status, tags, user_id))
+        return await post_reads.do(key, query)
+
+    @staticmethod
+    def _filter_key(
+        search: str = None,
+        status: PostStatus = None,
+        tags: List[str] = None,
+        user_id: int = None,
+    ) -> tuple:
+        """
+        Возвращает ключ фильтров списка для объединения чтений.
+
+        Args:
+            search (str): Поиск по названию или контексту поста
+            status (PostStatus): Фильтрация по статусу
+            tags (List[str]): Фильтрация по тегам
+            user_id (int): Фильтрация по пользователю
+
+        Returns:
+            tuple: Хешируемый ключ фильтров
+        """
+        return search, status, tuple(sorted(tags)) if tags else None, user_id
+
+    def _filter_posts(
+        self,
+        search: str = None,
+        status: PostStatus = None,
+        tags: List[str] = None,
+        user_id: int = None,
+    ) -> Select:
+        """
+        Строит запрос постов с фильтрами списка.
+
+        Args:
+            search (str): Поиск по названию или контексту поста
+            status (PostStatus): Фильтрация по статусу
+            tags (List[str]): Фильтрация по тегам
+            user_id (int): Фильтрация по пользователю
+
+        Returns:
+            Select: Запрос постов
+        """
         # Создаем запрос для получения всех постов
         statement = select(Post).distinct()
 
@@ -265,5 +595,37 @@ class PostDataManager(BaseDataManager[PostSchema]):
         # Фильтр по пользователю
         if user_id:
             statement = statement.filter(Post.author == user_id)
-        
-        return await self.get_paginated(statement, pagination)
\ No newline at end of file
+
+        return statement
+
+    async def search_published(self, query: str, limit: int) -> List[Row]:
+        """
+        Ищет опубликованные посты по подстроке в названии или содержании.
+
+        Выбираются только колонки, нужные для карточки результата, без
+        загрузки связей. В PostgreSQL запрос использует частичные
+        триграммные индексы `ix_posts_name_trgm` и `ix_posts_content_trgm`.
+
+        Args:
+            query (str): Строка поиска. Пустая строка - самые популярные посты.
+            limit (int): Максимальное количество результатов.
+
+        Returns:
+            List[Row]: Строки (id, name, content, rating, updated_at).
+        """
+        statement = (
+            select(Post.id, Post.name, Post.content, Post.rating, Post.updated_at)
+            .where(Post.status == PostStatus.PUBLISHED)
+            .order_by(Post.rating.desc(), Post.id.desc())
+            .limit(limit)
+        )
+        if query:
+            pattern = "%" + query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+            statement = statement.where(
+                or_(
+                    Post.name.ilike(pattern, escape="\\"),
+                    Post.content.ilike(pattern, escape="\\")
+                )
+            )
+        result = await self.session.execute(statement)
+        return list(result.all())
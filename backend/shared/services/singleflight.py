@@ -0,0 +1,164 @@
+"""
+Модуль объединения одинаковых параллельных чтений (single-flight).
+
+Когда пост становится популярным, множество клиентов одновременно
+запрашивают один и тот же `/posts/{id}` или первую страницу ленты, и
+каждый запрос выполняет одинаковый SQL. `SingleFlight` выполняет запрос
+для ключа один раз: пока он выполняется, остальные вызовы с тем же ключом
+ожидают его результат.
+
+Результат общий для всех ожидающих (один и тот же объект), поэтому
+объединять можно только чтения, результат которых не изменяется
+вызывающим. Если первый вызов отменен (клиент отключился), ожидающие
+повторяют запрос сами, а при ошибке получают то же исключение.
+
+При `ttl` > 0 результат дополнительно хранится в кэше (LRU) и в течение
+`ttl` секунд отдается без запроса; запись в данные должна сбрасывать кэш
+через `clear`. Результат вызова, начатого до `clear`, в кэш не попадает,
+а новые вызовы после `clear` не присоединяются к нему. Без кэша результат
+не переживает запрос, и данные никогда не устаревают.
+
+Кэш и объединение действуют в пределах процесса: `clear` сбрасывает кэш
+только своего воркера API, поэтому при нескольких воркерах запись,
+сделанная в одном из них, видна в остальных с задержкой до `ttl`.
+
+Классы:
+- SingleFlight: Объединение параллельных вызовов по ключу.
+"""
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple, TypeVar
+from shared.metrics import singleflight_calls_total, singleflight_coalescing_ratio
+
+R = TypeVar("R")
+
+
+class SingleFlight:
+    """
+    Объединение параллельных вызовов по ключу.
+
+    Args:
+        name (str): Имя группы (метка метрик).
+        ttl (float): Время хранения результата в кэше, секунды; 0 - без кэша.
+        maxsize (int): Максимум результатов в кэше.
+        enabled (bool): False - вызовы выполняются как есть (для отладки).
+    """
+    def __init__(self, name: str, ttl: float = 0.0, maxsize: int = 1000, enabled: bool = True):
+        """
+        Инициализирует группу.
+
+        Args:
+            name (str): Имя группы.
+            ttl (float): Время хранения результата в кэше, секунды.
+            maxsize (int): Максимум результатов в кэше.
+            enabled (bool): Объединять вызовы.
+        """
+        self.name = name
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.enabled = enabled
+        self._calls: Dict[Hashable, asyncio.Future] = {}
+        self._cache: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+        self._generation = 0
+        self._total = 0
+        self._shared = 0
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[R]]) -> R:
+        """
+        Возвращает результат вызова для ключа, выполняя его не более одного
+        раза одновременно.
+
+        Args:
+            key (Hashable): Ключ; должен однозначно определять результат.
+            call (Callable[[], Awaitable[R]]): Функция запроса.
+
+        Returns:
+            R: Результат вызова (общий для одновременных вызовов).
+        """
+        if not self.enabled:
+            return await call()
+
+        if self.ttl > 0:
+            entry = self._cache.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._cache.move_to_end(key)
+                self._record("cached")
+                return entry[1]
+
+        while True:
+            future = self._calls.get(key)
+            if future is None:
+                break
+            try:
+                result = await asyncio.shield(future)
+            except asyncio.CancelledError:
+                # Отменен первый вызов, а не текущий: повторяем запрос
+                if future.cancelled():
+                    continue
+                raise
+            self._record("shared")
+            return result
+
+        future = asyncio.get_running_loop().create_future()
+        self._calls[key] = future
+        generation = self._generation
+        self._record("executed")
+        try:
+            result = await call()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Исключение получат ожидающие; без них future не должен
+            # сообщать о необработанной ошибке
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            # Во время вызова данные изменились: результат мог устареть
+            if self.ttl > 0 and generation == self._generation:
+                self._store(key, result)
+            return result
+        finally:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+    def clear(self) -> None:
+        """
+        Сбрасывает кэш результатов (после записи в данные).
+
+        Выполняющиеся вызовы не попадут в кэш, а новые вызовы выполнят
+        запрос заново, не дожидаясь их.
+        """
+        self._generation += 1
+        self._cache.clear()
+        self._calls.clear()
+
+    def _store(self, key: Hashable, result: Any) -> None:
+        """
+        Сохраняет результат в кэше, вытесняя самые старые записи.
+
+        Args:
+            key (Hashable): Ключ.
+            result (Any): Результат.
+        """
+        self._cache[key] = (time.monotonic() + self.ttl, result)
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+
+    def _record(self, outcome: str) -> None:
+        """
+        Записывает метрики вызова.
+
+        Args:
+            outcome (str): "executed" - выполнен запрос, "shared" - получен
+                результат параллельного вызова, "cached" - результат из кэша.
+        """
+        singleflight_calls_total.inc(self.name, outcome)
+        self._total += 1
+        if outcome != "executed":
+            self._shared += 1
+        singleflight_coalescing_ratio.set(self.name, value=self._shared / self._total)
@@ -17,6 +17,7 @@ class TagService(BaseService):
         add_tags: Создает новые теги и возвращает их ID.
         add_post_tags: Создает связи между постами и тегами.
         get_tags_by_post_id: Возвращает теги поста.
+        get_tags_batch: Возвращает теги по списку ID в порядке запроса.
     """
     async def add_tags(self, tag_names: list[str]) -> list[int]:
         """
@@ -63,6 +64,18 @@ class TagService(BaseService):
         """
         return await TagDataManager(self.session).get_tags_by_ids(tag_ids)
 
+    async def get_tags_batch(self, tag_ids: list[int]) -> tuple[list[TagSchema], list[int]]:
+        """
+        Возвращает теги по списку ID одним запросом.
+
+        Args:
+            tag_ids (list[int]): Список ID тегов
+
+        Returns:
+            tuple[list[TagSchema], list[int]]: Теги в порядке запроса и ненайденные ID
+        """
+        return await TagDataManager(self.session).get_many(tag_ids)
+
 
 class TagDataManager(BaseDataManager[Tag]):
     """
@@ -1,18 +1,30 @@
+import logging
+from typing import List, Sequence
 from datetime import datetime, timezone, timedelta
 from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordRequestForm, OAuth2PasswordBearer
 from jose import jwt, JWTError
-from sqlalchemy import select, update
+from sqlalchemy import select, update, or_
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import noload
 from passlib.context import CryptContext
-from shared.schemas.users import UserSchema, CreateUserSchema, UserUpdateSchema, TokenSchema
-from shared.services.base import BaseService, BaseDataManager
+from shared.schemas.users import (
+    UserSchema,
+    UserPublicSchema,
+    CreateUserSchema,
+    UserUpdateSchema,
+    TokenSchema,
+    UserRole,
+)
+from shared.services.base import BaseService, BaseDataManager, dialect_insert
 from shared.models.users import User
 from shared.exceptions.users import (
     TokenMissingError,
     InvalidCredentialsError,
     TokenExpiredError,
     AuthenticationError,
+    ForbiddenError,
 )
 from settings import settings
 
@@ -68,7 +80,7 @@ class AuthService(HashingMixin, BaseService):
         session: Асинхронная сессия для работы с базой данных.
     
     Methods:
-        loogin_telegram_user: Авторизует или создает пользователя через Telegram и возвращает токен.
+        login_telegram_user: Авторизует или создает пользователя через Telegram и возвращает токен.
         
         create_web_user: Создает нового пользователя через веб-интерфейс и возвращает токен.
         create_telegram_user: Создает нового пользователя через Telegram и возвращает токен.
@@ -140,6 +152,11 @@ class AuthService(HashingMixin, BaseService):
     async def login_telegram_user(self, chat_id: int, username: str) -> TokenSchema:
         """
         Аутентифицирует или создает пользователя через Telegram и возвращает токен.
+
+        Пользователь создается или обновляется одним запросом (upsert), поэтому
+        одновременные сообщения от нового пользователя не конфликтуют
+        по уникальному chat_id.
+
         Args:
             chat_id: Идентификатор пользователя в Telegram.
             username: Имя пользователя в Telegram.
@@ -147,10 +164,7 @@ class AuthService(HashingMixin, BaseService):
         Returns:
             Токен доступа.
         """
-        user = await AuthDataManager(self.session).get_user_by_chat_id(chat_id)
-
-        if not user:
-            user = await self.create_telegram_user(chat_id, username)
+        user = await AuthDataManager(self.session).upsert_telegram_user(chat_id, username)
 
         access_token = self._create_access_token(user)
         
@@ -205,6 +219,7 @@ class AuthDataManager(BaseDataManager[UserSchema]):
         add_user: Добавляет нового пользователя в базу данных.
         get_user_by_email: Получает пользователя по email.
         get_user_by_chat_id: Получает пользователя по chat_id.
+        upsert_telegram_user: Создает или обновляет пользователя Telegram одним запросом.
     """
     def __init__(self, session: AsyncSession):
         super().__init__(
@@ -251,6 +266,64 @@ class AuthDataManager(BaseDataManager[UserSchema]):
         statement = select(self.model).where(self.model.chat_id == chat_id) 
         return await self.get_one(statement)
 
+    async def upsert_telegram_user(self, chat_id: int, username: str) -> UserSchema:
+        """
+        Создает или получает пользователя Telegram одним запросом.
+
+        Выполняет `INSERT ... ON CONFLICT (chat_id) DO UPDATE ... WHERE ...
+        RETURNING *` (PostgreSQL и SQLite). Существующая строка обновляется,
+        только если изменилось имя или пользователь был помечен как
+        заблокировавший бота, поэтому обычное сообщение не пишет в таблицу
+        и не блокирует строку. Если обновлять нечего, RETURNING пуст, и
+        пользователь читается отдельным SELECT.
+
+        Args:
+            chat_id: ID чата пользователя.
+            username: Имя пользователя.
+
+        Returns:
+            Данные пользователя.
+
+        Raises:
+            SQLAlchemyError: Если произошла ошибка при выполнении запроса.
+        """
+        insert = dialect_insert(self.session)
+        statement = insert(self.model).values(chat_id=chat_id, username=username)
+        statement = statement.on_conflict_do_update(
+            index_elements=[self.model.chat_id],
+            set_={
+                "username": statement.excluded.username,
+                # Пользователь снова написал боту - значит, разблокировал его
+                "is_blocked": False,
+                "updated_at": datetime.now()
+            },
+            where=or_(
+                self.model.username.is_distinct_from(statement.excluded.username),
+                self.model.is_blocked
+            )
+        ).returning(self.model)
+
+        try:
+            result = await self.session.execute(
+                statement,
+                execution_options={"populate_existing": True}
+            )
+            user = result.unique().scalar_one_or_none()
+            await self.session.commit()
+            if user is None:
+                # Посты пользователя для схемы не нужны
+                statement = (
+                    select(self.model)
+                    .where(self.model.chat_id == chat_id)
+                    .options(noload(self.model.posts))
+                )
+                return await self.get_one(statement)
+            return self.schema.model_validate(user)
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logging.error("Ошибка при upsert пользователя %s: %s", chat_id, e)
+            raise
+
 async def get_current_user(token: str = Depends(oauth2_schema)) -> UserSchema | None:
     """
     Получает данные текущего пользователя.
@@ -293,6 +366,40 @@ async def get_current_user(token: str = Depends(oauth2_schema)) -> UserSchema |
     except JWTError as exc:
         raise AuthenticationError() from exc
 
+async def get_admin_user(user: UserSchema = Depends(get_current_user)) -> UserSchema:
+    """
+    Получает данные текущего пользователя и проверяет, что он администратор.
+
+    Args:
+        user: Текущий пользователь.
+
+    Returns:
+        Данные текущего пользователя.
+
+    Raises:
+        ForbiddenError: Если пользователь не администратор.
+    """
+    if user.role != UserRole.ADMIN:
+        raise ForbiddenError()
+    return user
+
+async def get_moderator_user(user: UserSchema = Depends(get_current_user)) -> UserSchema:
+    """
+    Получает данные текущего пользователя и проверяет, что он модератор или администратор.
+
+    Args:
+        user: Текущий пользователь.
+
+    Returns:
+        Данные текущего пользователя.
+
+    Raises:
+        ForbiddenError: Если пользователь не модератор и не администратор.
+    """
+    if user.role not in (UserRole.ADMIN, UserRole.MODERATOR):
+        raise ForbiddenError()
+    return user
+
 def is_expired(expires_at: str) -> bool:
     """
     Проверяет, истек ли срок действия токена.
@@ -303,7 +410,9 @@ def is_expired(expires_at: str) -> bool:
     Returns:
              True, если токен истек, иначе False.
     """
-    return datetime.strptime(expires_at, "%Y-%m-%d %H:%M:%S") < datetime.now(timezone.utc)
+    # Время в токене записано в UTC без смещения (см. `_expiration_time`)
+    expires = datetime.strptime(expires_at, "%Y-%m-%d %H:%M:%S").replace(tzinfo=timezone.utc)
+    return expires < datetime.now(timezone.utc)
 
 class UserService(BaseService):
     """
@@ -321,6 +430,28 @@ class UserService(BaseService):
         """
         return await UserDataManager(self.session).update_profile(user, data)
 
+    async def get_users_batch(
+        self,
+        user_ids: List[int],
+        fields: Sequence[str] | None = None
+    ) -> tuple[List[UserPublicSchema], List[int]]:
+        """
+        Возвращает публичные данные пользователей по списку ID одним запросом.
+
+        Args:
+            user_ids (List[int]): ID пользователей.
+            fields (Sequence[str] | None): Поля пользователей, None - все поля.
+
+        Returns:
+            tuple[List[UserPublicSchema], List[int]]: Пользователи (или
+                словари выбранных полей) в порядке запроса и ненайденные ID.
+        """
+        return await UserDataManager(self.session).get_many(
+            user_ids,
+            schema=UserPublicSchema,
+            fields=fields
+        )
+
 class UserDataManager(BaseDataManager[UserSchema]):
     """
     Класс для работы с данными пользователей в базе данных.
@@ -370,7 +501,13 @@ class UserDataManager(BaseDataManager[UserSchema]):
             
         statement = update(self.model).where(
             self.model.id == user.id).values(**update_data)
-        
-        await self.update_one(statement)
+
+        try:
+            await self.session.execute(statement)
+            await self.session.commit()
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            logging.error("Ошибка при обновлении профиля %s: %s", user.id, e)
+            raise
         
         return await self.get_profile(user.id)